@@ -0,0 +1,74 @@
+"""Encode/decode microbenchmark for the value codec.
+
+Compares ``navconfig.utils.codec`` against the jsonpickle format it
+replaces (when jsonpickle is installed), for a JSON-native value, a value
+with tuples and sets, and the plain-string fast path taken by every read.
+
+Usage:
+    python benchmarks/bench_codec.py [iterations]
+"""
+import sys
+import time
+
+from navconfig.utils import codec
+
+try:
+    import jsonpickle
+except ImportError:  # pragma: no cover
+    jsonpickle = None
+
+PLAIN = {
+    "DATABASES": {
+        "default": {"host": "localhost", "port": 5432, "user": "navigator"},
+        "replica": {"host": "replica", "port": 5432, "user": "navigator"},
+    },
+    "FEATURES": ["alpha", "beta", "gamma", "delta"],
+}
+TAGGED = {"hosts": ("a", "b", "c"), "ports": {5432, 5433}, "weights": [1.5, 2.5]}
+
+
+def bench(label: str, func, iterations: int) -> float:
+    func()  # warm-up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - started) / iterations * 1e6
+    print(f"  {label:<42} {elapsed:10.2f} us/op")
+    return elapsed
+
+
+def main(iterations: int = 20000) -> None:
+    for name, value in (("json-native", PLAIN), ("tuples/sets", TAGGED)):
+        print(f"{name}:")
+        raw = codec.encode(value)
+        bench("codec.encode", lambda: codec.encode(value), iterations)
+        bench(
+            "codec.decode (uncached)",
+            lambda: codec._decode.__wrapped__(raw),  # pylint: disable=W0212
+            iterations
+        )
+        bench("codec.decode (cached)", lambda: codec.decode(raw), iterations)
+        if jsonpickle is not None:
+            legacy = "NAVCONFIG_JSONDATA:" + jsonpickle.encode(value)
+            bench("jsonpickle.encode", lambda: jsonpickle.encode(value), iterations)
+            bench(
+                "jsonpickle.decode",
+                lambda: jsonpickle.decode(legacy[len("NAVCONFIG_JSONDATA:"):]),
+                iterations
+            )
+            bench(
+                "codec.decode legacy (uncached)",
+                lambda: codec._decode.__wrapped__(legacy),  # pylint: disable=W0212
+                iterations
+            )
+    print("plain string:")
+    bench("codec.decode", lambda: codec.decode("postgres://localhost"), iterations)
+    bench(
+        "legacy str().startswith check",
+        lambda: str("postgres://localhost").startswith("NAVCONFIG_JSONDATA"),
+        iterations
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,79 @@
+"""Memory of N cached environments: plain dict copies vs ``EnvStore``.
+
+Each environment is built from separately created strings, as parsing
+its ``.env`` files would, with ``KEYS`` keys of which ``DIFFERENT`` per
+cent differ from one environment to the next. Memory is measured with
+``tracemalloc`` (what the cached environments keep allocated), along with
+the time of a lookup and of the ``copy()`` done by ``set_env()``.
+
+Usage:
+    python benchmarks/bench_envstore.py [environments] [keys] [different %]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+from navconfig.utils.envstore import EnvStore
+
+
+def parse(env: int, keys: int, different: int) -> dict:
+    values = {}
+    for n in range(keys):
+        key = "".join(["SETTING_", str(n)])
+        if n % 100 < different:
+            value = "".join(["env", str(env), "-value-", str(n)])
+        else:
+            value = "".join(["postgres://db.internal:5432/value-", str(n)])
+        values[key] = value
+    return values
+
+
+def measure(label: str, build) -> object:
+    gc.collect()
+    tracemalloc.start()
+    cache = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<30} {size / 1024:10.1f} KiB")
+    return cache
+
+
+def bench(label: str, func, iterations: int = 20000) -> None:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - started) / iterations * 1e6
+    print(f"  {label:<30} {elapsed:10.2f} us/op")
+
+
+def main(environments: int = 8, keys: int = 500, different: int = 10) -> None:
+    print(f"{environments} environments, {keys} keys, {different}% different:")
+
+    def as_dicts():
+        # what Kardex._env_cache held: one full copy per environment
+        return {
+            f"env{n}": parse(n, keys, different).copy()
+            for n in range(environments)
+        }
+
+    def as_store():
+        store = EnvStore()
+        for n in range(environments):
+            store[f"env{n}"] = parse(n, keys, different)
+        return store
+
+    dicts = measure("dict copies", as_dicts)
+    store = measure("EnvStore", as_store)
+    print(f"  {'EnvStore.stats()':<30} {store.stats()}")
+    key = f"SETTING_{keys - 1}"
+    bench("dict lookup", lambda: dicts["env1"].get(key))
+    bench("EnvStore lookup", lambda: store["env1"].get(key))
+    bench("dict copy (set_env)", lambda: dicts["env1"].copy(), 2000)
+    bench("EnvStore copy (set_env)", lambda: store["env1"].copy(), 2000)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:4]))
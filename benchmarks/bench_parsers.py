@@ -0,0 +1,104 @@
+"""Startup microbenchmark for the TOML/YAML parsers.
+
+Compares the synchronous fast path used by the loaders against the
+asynchronous parser, and against the thread + event loop dance that
+``pyProjectLoader.load_environment`` used to perform on every startup.
+
+Usage:
+    python benchmarks/bench_parsers.py [iterations]
+"""
+import asyncio
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+
+from navconfig.loaders.parsers.toml import TOMLParser
+from navconfig.loaders.parsers.yaml import YAMLParser
+
+PYPROJECT = Path(__file__).resolve().parent.parent / "pyproject.toml"
+
+YAML_CONTENT = """
+navconfig:
+  APP_NAME: bench
+  DEBUG: true
+  DATABASES:
+    default: {host: localhost, port: 5432, user: navigator}
+    replica: {host: replica, port: 5432, user: navigator}
+  FEATURES: [alpha, beta, gamma, delta]
+"""
+
+
+def bench(label: str, func, iterations: int) -> float:
+    func()  # warm-up
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = (time.perf_counter() - started) / iterations * 1e6
+    print(f"  {label:<42} {elapsed:10.1f} us/op")
+    return elapsed
+
+
+def legacy_pyproject(parser: TOMLParser, filename: Path):
+    """What pyProjectLoader.load_environment did before the fast path."""
+    async def run_coro(coro):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        result = await coro
+        loop.close()
+        return result
+
+    with ThreadPoolExecutor() as executor:
+        future = executor.submit(asyncio.run, run_coro(parser.parse(filename)))
+        return future.result()
+
+
+def main(iterations: int = 500) -> None:
+    toml_parser = TOMLParser()
+    yaml_parser = YAMLParser()
+
+    print(f"TOML: {PYPROJECT.name} ({PYPROJECT.stat().st_size} bytes)")
+    fast = bench(
+        "parse_file (sync)",
+        lambda: toml_parser.parse_file(PYPROJECT),
+        iterations,
+    )
+    bench(
+        "asyncio.run(parse)",
+        lambda: asyncio.run(toml_parser.parse(PYPROJECT)),
+        iterations,
+    )
+    legacy = bench(
+        "thread + new loop (previous pyProjectLoader)",
+        lambda: legacy_pyproject(toml_parser, PYPROJECT),
+        iterations,
+    )
+    print(f"  speed-up: {legacy / fast:.1f}x")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = Path(tmp) / "env.yaml"
+        filename.write_text(YAML_CONTENT, encoding="utf-8")
+        print(f"YAML: {filename.name} ({filename.stat().st_size} bytes)")
+        fast = bench(
+            "parse_file (sync)",
+            lambda: yaml_parser.parse_file(filename),
+            iterations,
+        )
+        bench(
+            "yaml.SafeLoader (pure python)",
+            lambda: yaml.load(filename.read_text(), Loader=yaml.SafeLoader),
+            iterations,
+        )
+        slow = bench(
+            "asyncio.run(parse)",
+            lambda: asyncio.run(yaml_parser.parse(filename)),
+            iterations,
+        )
+        print(f"  speed-up: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -11,13 +11,13 @@ from .project import (
     get_env_type,
     get_environment
 )
-from .utils import install_uvloop
+from .utils.uvl import install_uvloop
 from .utils.settings import ensure_settings_priority
 from .kardex import Kardex  # noqa
+from .registry import KardexRegistry  # noqa
+from .schema import Field, Schema  # noqa
 from .version import __version__
 
-install_uvloop()
-
 # Reduce asyncio log level:
 logging.getLogger('asyncio').setLevel(logging.INFO)
 
@@ -35,7 +35,10 @@ _LAZY_NAMES: tuple = (
     "ENVIRONMENT",
 )
 
-__all__ = ("Kardex", "bootstrap", "__version__", *_LAZY_NAMES)
+__all__ = (
+    "Kardex", "KardexRegistry", "Schema", "Field", "bootstrap",
+    "__version__", *_LAZY_NAMES
+)
 
 _bootstrapped: bool = False
 
@@ -65,6 +68,9 @@ def bootstrap() -> "Kardex":
 
     ns = globals()
 
+    # uvloop is installed when the configuration is built, not on import.
+    install_uvloop()
+
     # PROJECT PATH IS DEFINED?
     site_root, base_dir = project_root(__file__)
     ns["SITE_ROOT"] = site_root
@@ -32,6 +32,10 @@ VAULT_OWN_VARIABLES = (
     "VAULT_VERSION",
     "VAULT_ENV",
     "VAULT_NAMESPACE",
+    "VAULT_TIMEOUT",
+    "VAULT_CACHE",
+    "VAULT_CACHE_TTL",
+    "VAULT_CACHE_KEY_DIR",
 )
 
 #: Directives NavConfig needs *before* any external source is reachable:
@@ -51,6 +55,20 @@ BOOTSTRAP_VARIABLES = (
     "PROJECT_PATH",
     "PROJECT_FILE",
     "NAVCONFIG_FILE_OVERRIDE_ENABLED",
+    "NAVCONFIG_PARALLEL_LOAD",
+    "NAVCONFIG_DISCOVERY_CACHE",
+    "NAVCONFIG_INTERPOLATE",
+    "NAVCONFIG_VAULT_PRELOAD",
+    "NAVCONFIG_MANIFEST",
+    "NAVCONFIG_SINGLE_FLIGHT",
+    "NAVCONFIG_BREAKER_FAILURES",
+    "NAVCONFIG_BREAKER_RESET",
+    "NAVCONFIG_BROADCAST",
+    "NAVCONFIG_WRITE_BEHIND",
+    "NAVCONFIG_WRITE_BEHIND_SIZE",
+    "NAVCONFIG_FORK_SAFE",
+    "NAVCONFIG_PRELOAD_ENVS",
+    "NAVCONFIG_PRELOAD_WORKERS",
 )
 
 
@@ -184,9 +202,8 @@ def create_vault_env(
 class VaultWriter:
     """Minimal Vault KV writer used by the ``kardex vault`` sub-commands.
 
-    ``navconfig.readers.vault.VaultReader`` performs a read-modify-write per
-    key, which is both slow and racy when migrating a whole ``.env`` file.
-    This writer merges every key in memory and issues a single write.
+    Every key of a ``.env`` file is sent in a single write (see
+    :meth:`set_many`).
     """
 
     def __init__(self, settings: dict) -> None:
@@ -242,17 +259,18 @@ class VaultWriter:
                 f"Unable to read '{self.mount_point}/{self.path}': {ex}"
             ) from ex
 
-    def write(self, data: dict) -> None:
-        """Replace the secret at the configured path with *data*."""
+    def set_many(self, values: dict) -> None:
+        """Merge *values* into the secret at the configured path.
+
+        Only the given keys are sent (a KV v2 merge-patch, or a
+        check-and-set write when patching is not possible), so keys written
+        meanwhile by another job are preserved.
+        """
+        from ..readers.vault import KVPatcher  # pylint: disable=C0415
         try:
-            if self.version == 1:
-                self.client.secrets.kv.v1.create_or_update_secret(
-                    path=self.path, secret=data, mount_point=self.mount_point
-                )
-            else:
-                self.client.secrets.kv.v2.create_or_update_secret(
-                    path=self.path, secret=data, mount_point=self.mount_point
-                )
+            KVPatcher(self.client, self.mount_point, self.version).patch(
+                self.path, values
+            )
         except Exception as ex:
             hint = ""
             if "no handler for route" in str(ex):
@@ -611,7 +629,7 @@ def _run_migrate(args: argparse.Namespace) -> int:
     writer = VaultWriter(settings)
     existing = writer.read()
 
-    payload = dict(existing)
+    payload = {}
     written, kept = [], []
     for key, value in values.items():
         if args.keep_existing and key in existing:
@@ -624,7 +642,7 @@ def _run_migrate(args: argparse.Namespace) -> int:
         msg("Every variable is already present in Vault; nothing written.")
         return 0
 
-    writer.write(payload)
+    writer.set_many(payload)
 
     msg("")
     msg(f"Wrote {len(written)} variable(s) to {destination}.")
@@ -673,10 +691,7 @@ def _run_save(args: argparse.Namespace) -> int:
         msg("Dry run: nothing was written to Vault.")
         return 0
 
-    writer = VaultWriter(settings)
-    payload = writer.read()
-    payload.update(values)
-    writer.write(payload)
+    VaultWriter(settings).set_many(values)
 
     msg("")
     msg(f"Saved {len(values)} variable(s) to {destination}.")
@@ -24,6 +24,16 @@ class FileCypher(AbstractCypher):
         except RuntimeError as ex:
             raise RuntimeError(f"NavConfig: Error reading the unlock Key: {ex}") from ex
 
+    def load_key(self) -> Fernet:
+        """Synchronous get_key(), for callers without an event loop."""
+        file = self.path.joinpath("unlock.key")
+        if not file.exists():
+            raise FileNotFoundError(f"Not Found: {file}")
+        key = file.read_bytes().strip()
+        if not key:
+            raise Exception("Missing the Unlock Key")
+        return Fernet(key)
+
     async def encrypt(self, name: str = ".env"):
         # use the generated key
         f = await self.get_key()
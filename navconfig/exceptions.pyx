@@ -27,6 +27,9 @@ cdef class KardexError(Exception):
 cdef class ReaderError(KardexError):
     """An error Triggered by Reader."""
 
+cdef class ReaderUnavailable(ReaderError):
+    """The backend of a Reader can't be reached."""
+
 cdef class LoaderError(KardexError):
     """A Feature is not supported"""
 
@@ -1,13 +1,18 @@
 from typing import (
     Any,
     Dict,
+    Iterable,
     List,
     Optional,
+    Type,
 )
 import os
+import sys
+import time
+import threading
 import contextlib
-import asyncio
 import warnings
+import weakref
 from collections.abc import Callable
 import logging
 from configparser import (
@@ -17,27 +22,96 @@ from configparser import (
     NoSectionError
 )
 from pathlib import Path
-from dotenv import load_dotenv
-import jsonpickle
 from .utils.functions import strtobool
 from .utils.types import Singleton
-from .loaders import import_loader, pyProjectLoader
-from .exceptions import ConfigError, KardexError, ReaderNotSet
+from .utils.discovery import discovery_timings
+from .utils import codec
+from .utils.interpolation import Interpolator, expand_values
+from .utils.references import (
+    SecretRef, SecretResolver, SecretUnavailable, parse_reference
+)
+from .utils.manifest import AccessRecorder, manifest_file, prefetch
+from .utils.flight import SingleFlight
+from .utils.breaker import CircuitBreaker, GuardedReader
+from .utils.broadcast import InvalidationBus, channel_name
+from .utils.writebehind import WriteBehind
+from .utils.filecache import read_text
+from .utils.envstore import EnvStore
+from .schema import Handle, Schema, changed, coerce
+from .exceptions import (
+    ConfigError, KardexError, ReaderError, ReaderNotSet, ReaderUnavailable
+)
+
+# NOTE: the optional backends (redis, hvac), the loaders (dotenv, TOML/YAML
+# parsers) and asyncio are imported on first use: ``import navconfig`` is
+# paid by every CLI invocation, configured or not.
+
+
+#: held while ``KardexRegistry`` builds an instance (loading a project
+#: writes ``os.environ``): once a registry exists, the lookups read
+#: ``os.environ`` under it.
+environ_lock = threading.RLock()
+
+
+def _reader_class(name: str) -> Optional[type]:
+    """Import an external reader backend, None if its dependency is missing."""
+    # pylint: disable=import-outside-toplevel
+    try:
+        if name == "redis":
+            from .readers.redis import mredis
+            return mredis
+        if name == "vault":
+            from .readers.vault import VaultReader
+            return VaultReader
+    except ModuleNotFoundError:
+        return None
+    raise ValueError(f"Unknown reader: {name}")
+
+
+def __getattr__(name: str) -> Any:
+    """Backward-compatible (lazy) access to the reader classes."""
+    if name == "REDIS_LOADER":
+        return _reader_class("redis")
+    if name == "HVAULT_LOADER":
+        return _reader_class("vault")
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
 
 
-## redis:
-try:
-    from .readers.redis import mredis
-    REDIS_LOADER = mredis
-except ModuleNotFoundError:
-    REDIS_LOADER = None
+def _running_loop():
+    """Return the running event loop, without importing asyncio for it."""
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        # nothing can be running an asyncio loop
+        return None
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+# Kardex instances repaired in the child of os.fork() (NAVCONFIG_FORK_SAFE):
+_forked: Optional[weakref.WeakSet] = None
+
 
-## Hashicorp Vault:
-try:
-    from .readers.vault import VaultReader
-    HVAULT_LOADER = VaultReader
-except ModuleNotFoundError:
-    HVAULT_LOADER = None
+def _after_fork_in_child():
+    # the build holding it (another thread) doesn't exist in the child
+    environ_lock._at_fork_reinit()  # pylint: disable=W0212
+    for kardex in list(_forked or ()):
+        try:
+            kardex.after_fork()
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(f"NavConfig: unable to reinitialize after fork: {err}")
+
+
+def _register_fork(kardex: "Kardex"):
+    global _forked  # pylint: disable=W0603
+    if _forked is None:
+        _forked = weakref.WeakSet()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=_after_fork_in_child)
+    _forked.add(kardex)
 
 
 class Kardex(metaclass=Singleton):
@@ -50,35 +124,138 @@ class Kardex(metaclass=Singleton):
     __initialized__ = False
     _readers: dict = {}
     _mapping_: dict = {}
+    _references: dict = {}
+    _recorder: Optional[AccessRecorder] = None
+    _prefetched: dict = {}
+    _flight: Optional[SingleFlight] = None
+    _breakers: dict = {}
+    _broadcast: Optional[InvalidationBus] = None
+    _preloaded: frozenset = frozenset()
+    _writer: Optional[WriteBehind] = None
+    _behind: dict = {}
+    _shared: Optional[dict] = None
+    _borrowed: frozenset = frozenset()
+    _files: Any = None
+    _env_loading: dict = {}
+    _env_preloader: Any = None
+    _typed: dict = {}
+    _handles: dict = {}
+    _evictions: int = 0
+    # environ_lock once a KardexRegistry exists (see KardexRegistry):
+    _environ_guard: Any = contextlib.nullcontext()
+
+    @classmethod
+    def _unshared(cls, *args, **kwargs) -> "Kardex":
+        """A new instance, next to the singleton (see ``KardexRegistry``).
+
+        Built under ``environ_lock``: until the caller puts the guard back,
+        its own lookups (from the bootstrap threads too) don't wait for it.
+        """
+        kardex = object.__new__(cls)
+        kardex._readers = {}
+        kardex._environ_guard = contextlib.nullcontext()
+        kardex.__init__(*args, **kwargs)
+        return kardex
 
     def __init__(
         self,
         site_root: str = None,
         env: str = None,
+        lazy: bool = None,
         **kwargs
     ):
         if self.__initialized__ is True:
             return
+        # KardexRegistry: readers shared with the other instances (keyed by
+        # their settings) and a cache of the parsed INI/pyproject files
+        self._shared: Optional[dict] = kwargs.pop("shared_readers", None)
+        self._borrowed: set = set()
+        self._files = kwargs.pop("files", None)
 
         # check if create is True (default: false)
         # create the required directories:
         self._create: bool = strtobool(os.getenv("CONFIG_CREATE", False))
         self._auto_env: bool = strtobool(os.getenv("AUTO_DISCOVERY", "True"))
+        # run the independent bootstrap phases concurrently:
+        self._parallel: bool = strtobool(
+            os.getenv("NAVCONFIG_PARALLEL_LOAD", "True")
+        )
+        # wall time (ms) of every bootstrap phase:
+        self._timings: Dict[str, float] = {}
+        # ${VAR} references, expanded across every source:
+        self._interpolation: Optional[Interpolator] = None
+        if strtobool(os.getenv("NAVCONFIG_INTERPOLATE", "True")):
+            self._interpolation = Interpolator(
+                environ=os.environ, resolve=self._reference_value
+            )
+        # vault:/redis: references, fetched on first access:
+        self._references: Dict[Any, SecretRef] = {}
+        self._secrets = SecretResolver(self._secret_reader)
+        # resolved redis: references, restored when the key changes
+        self._resolved: Dict[Any, SecretRef] = {}
+        # _evict() runs on the invalidation listener thread: it and the
+        # storing of a resolved reference are serialized, and a value
+        # fetched while an eviction happened isn't stored
+        self._evict_lock = threading.RLock()
+        self._evictions: int = 0
+        self._readers_ready: bool = False
+        # keys whose reference was used by a template before the readers
+        # were ready:
+        self._deferred: set = set()
+        # opt-in access manifest (NAVCONFIG_MANIFEST) and the values it
+        # prefetched from the external readers: key -> (source, value)
+        self._recorder: Optional[AccessRecorder] = None
+        self._prefetched: Dict[str, tuple] = {}
+        # keys of _mapping_ bulk loaded from the cache backend hash:
+        self._preloaded: set = set()
+        # concurrent misses on the same key share one reader call:
+        self._flight: Optional[SingleFlight] = None
+        if strtobool(os.getenv("NAVCONFIG_SINGLE_FLIGHT", "True")):
+            self._flight = SingleFlight()
+        # per reader circuit breakers (fail fast while a backend is down):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # opt-in invalidations exchanged with the other instances (Redis
+        # pub/sub, NAVCONFIG_BROADCAST=true):
+        self._broadcast: Optional[InvalidationBus] = None
+        # opt-in write-behind of the external writes, and the values still
+        # queued (served from _mapping_ meanwhile): key -> (backend, value)
+        self._writer: Optional[WriteBehind] = None
+        self._behind: Dict[str, tuple] = {}
+        # _behind and its values in _mapping_ change on the writer thread too
+        self._behind_lock = threading.Lock()
+        if strtobool(os.getenv("NAVCONFIG_WRITE_BEHIND", "False")):
+            self._writer = WriteBehind(
+                self._write_batch,
+                max_size=int(os.getenv("NAVCONFIG_WRITE_BEHIND_SIZE", "10000"))
+            )
+        # expanded values written to os.environ:
+        self._exported: Dict[str, str] = {}
+        # variables the current environment added to os.environ (removed
+        # when switching to another one):
+        self._env_exported: Dict[str, str] = {}
+        # typed settings (config.settings(Schema)), until their keys change:
+        self._typed: Dict[type, Schema] = {}
+        # bound values (config.handle()), refreshed when their key changes
+        self._handles: Dict[str, weakref.WeakSet] = {}
 
         # Core components
         self._site_path: Path = None
         self._env_loader: Callable = None
         self._ini: Callable = None
         self._current_env: str = None
-        # Cache for multiple environments
-        self._env_cache: Dict[str, Dict] = {}
-
-        # asyncio loop
-        try:
-            self._loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
+        # Cache for multiple environments (overlays on a shared base)
+        self._env_cache: EnvStore = EnvStore()
+        # environments loaded in the background (NAVCONFIG_PRELOAD_ENVS):
+        # env -> Future of its values
+        self._env_loading: Dict[str, Any] = {}
+        self._env_preloader = None
+        self._env_lock = threading.Lock()
+
+        # asyncio loop (only when created from a running loop)
+        self._loop = _running_loop()
+        # rebuild the reader connections in forked children:
+        if strtobool(os.getenv("NAVCONFIG_FORK_SAFE", "True")):
+            _register_fork(self)
 
         # this only load at first time
         if not site_root:
@@ -90,8 +267,9 @@ class Kardex(metaclass=Singleton):
             else:
                 self._site_path = site_root
         # then: configure the instance:
-        lazy_load = strtobool(os.getenv('LAZY_LOAD', 'False'))
-        if lazy_load is False:
+        if lazy is None:
+            lazy = strtobool(os.getenv('LAZY_LOAD', 'False'))
+        if lazy is False:
             self.configure(env, **kwargs)
 
     def configure(
@@ -111,19 +289,14 @@ class Kardex(metaclass=Singleton):
         Raises:
             ConfigError: Error on Configuration.
         """
-        # Environment Configuration:
-        if env is not None:
-            self.ENV = env
-            self._current_env = env
-        else:
-            environment = os.getenv("ENV", "")
-            self.ENV = environment
-            self._current_env = environment
+        self._set_current_env(env)
+        started = time.perf_counter()
+        self._timings = {}
+        self._start_recorder()
         # getting type of environment consumer:
         try:
-            self.load_environment(
-                env_type,
-                override=override
+            self._timed(
+                "environment", self.load_environment, env_type, override
             )
         except FileNotFoundError:
             logging.error("NavConfig Error: Environment configuration is missing.")
@@ -137,14 +310,473 @@ class Kardex(metaclass=Singleton):
                     raise ConfigError(
                         "NavConfig Error: Unable to load environment configuration"
                     ) from err
-        # Initialize external readers (redis cache, vault as reader)
-        self._init_external_readers()
-        # Load INI configuration
-        self._load_ini_config()
-        # Running Load PyProject:
-        self.load_pyproject()
+        self._expand_references(self._mapping_)
+        # External readers (redis cache, vault as reader), INI configuration
+        # and PyProject only depend on the environment loaded above:
+        self._load_sources()
+        self._expand_ini()
+        self._prune_references()
+        self._collect_references()
+        self._timed("prefetch", self._prefetch_manifest)
+        self._timed("preload", self._preload_cache)
+        self._timings["total"] = self._elapsed(started)
         # Defined as initialized:
         self.__initialized__ = True
+        self._keys_changed(None)
+        if strtobool(os.getenv("NAVCONFIG_PRELOAD_ENVS", "False")):
+            self.preload_envs()
+
+    async def configure_async(
+        self,
+        env: str = None,
+        env_type: str = "vault",
+        override: bool = False
+    ):
+        """
+        Configure Kardex on the running event loop.
+
+        Same as :meth:`configure`, but every loader runs its I/O on the
+        caller's loop: no nested event loops and no private executors.
+
+        Args:
+            env (str, optional): Environment name (dev, prod, staging).
+            env_type (str, optional): Loader type - defaults to "vault".
+            override (bool, optional): Override current environment variables.
+
+        Raises:
+            ConfigError: Error on Configuration.
+        """
+        self._set_current_env(env)
+        started = time.perf_counter()
+        self._timings = {}
+        self._start_recorder()
+        try:
+            await self._timed_async(
+                "environment",
+                self.load_environment_async(env_type, override)
+            )
+        except FileNotFoundError:
+            logging.error("NavConfig Error: Environment configuration is missing.")
+            if env_type == "vault":
+                logging.info("Falling back to file-only loading...")
+                try:
+                    await self.load_environment_async("file", override=override)
+                except Exception as err:
+                    logging.error(f"Fallback loading also failed: {err}")
+                    raise ConfigError(
+                        "NavConfig Error: Unable to load environment configuration"
+                    ) from err
+        self._expand_references(self._mapping_)
+        await self._load_sources_async()
+        self._expand_ini()
+        self._prune_references()
+        self._collect_references()
+        self._timed("prefetch", self._prefetch_manifest)
+        self._timed("preload", self._preload_cache)
+        self._timings["total"] = self._elapsed(started)
+        self.__initialized__ = True
+        self._keys_changed(None)
+        if strtobool(os.getenv("NAVCONFIG_PRELOAD_ENVS", "False")):
+            self.preload_envs()
+
+    @classmethod
+    async def create_async(
+        cls,
+        site_root: str = None,
+        env: str = None,
+        **kwargs
+    ) -> "Kardex":
+        """Build (or return) the configuration from inside a running loop.
+
+        Usage:
+            config = await Kardex.create_async(site_root, env="dev")
+        """
+        instance = cls(site_root, env=env, lazy=True)
+        if not instance.initialized:
+            await instance.configure_async(env, **kwargs)
+        return instance
+
+    def _set_current_env(self, env: str = None):
+        """Select the environment (explicit, or the ENV variable)."""
+        if env is None:
+            env = os.getenv("ENV", "")
+        self.ENV = env
+        self._current_env = env
+        if self._interpolation is not None and not self._interpolation.outer:
+            # self-references (PATH=${PATH}:...) read the environment as it
+            # was before the first load.
+            self._interpolation.outer = dict(os.environ)
+
+    def _expand_references(self, changes: dict, escape: Callable = None):
+        """Expand the ``${VAR}`` references affected by *changes*.
+
+        Only the values that depend on a changed key are rendered again,
+        and only those are written back (see :meth:`_write_expansions`).
+        """
+        if self._interpolation is None:
+            return
+        rendered = self._interpolation.update(changes, escape=escape)
+        expanded = self._interpolation.expanded
+        for key in changes:
+            if key not in rendered and key in expanded:
+                # the same raw value loaded again (reload): not rendered,
+                # but the loader put the raw value back
+                rendered[key] = expanded[key]
+        self._write_expansions(rendered)
+
+    def _write_expansions(self, rendered: dict):
+        """Write expanded values to the mapping, the INI parser and
+        ``os.environ`` (where the loader put the raw value)."""
+        for key, value in rendered.items():
+            if isinstance(key, tuple):
+                section, option = key
+                if self._ini is not None and (
+                    section == self._ini.default_section
+                    or self._ini.has_section(section)
+                ):
+                    self._ini.set(section, option, value)
+                continue
+            if key in self._mapping_:
+                self._mapping_[key] = value
+            current = os.environ.get(key)
+            if current is not None and current in (
+                self._interpolation.raw(key), self._exported.get(key)
+            ):
+                os.environ[key] = self._exported[key] = value
+
+    def _expand_ini(self):
+        """Expand the references in the INI values (``%`` escaped)."""
+        if self._interpolation is None or self._ini is None:
+            return
+        defaults = self._ini.defaults()
+        values = {
+            (self._ini.default_section, option): value
+            for option, value in defaults.items() if "${" in value
+        }
+        for section in self._ini.sections():
+            for option, value in self._ini.items(section, raw=True):
+                if "${" in value and defaults.get(option) != value:
+                    values[(section, option)] = value
+        self._expand_references(
+            values, escape=lambda value: value.replace("%", "%%")
+        )
+
+    def _start_recorder(self):
+        """Record the keys read when ``NAVCONFIG_MANIFEST`` is set."""
+        if self._recorder is not None:
+            return
+        if (filename := manifest_file()) is None:
+            return
+        import atexit  # pylint: disable=C0415
+        self._recorder = AccessRecorder(filename, env=self.ENV)
+        atexit.register(self._recorder.save)
+
+    def _record(self, key: str, source: str):
+        if self._recorder is not None:
+            self._recorder.record(key, source)
+
+    def _prefetch_manifest(self):
+        """Fetch, in one batch per reader, the external keys of the manifest."""
+        if self._recorder is None:
+            return
+        for source, name in (("redis", "cache"), ("vault", "vault")):
+            reader = self._readers.get(name)
+            if reader is None or reader.enabled is not True:
+                continue
+            breaker = self._breakers.get(name)
+            try:
+                if breaker is None:
+                    values = prefetch(reader, self._recorder.keys(source))
+                else:
+                    values = breaker.call(
+                        prefetch, reader, self._recorder.keys(source)
+                    )
+            except Exception as err:  # pylint: disable=W0703
+                logging.warning(f"NavConfig: unable to prefetch from {source}: {err}")
+                continue
+            self._prefetched.update(
+                {key: (source, value) for key, value in values.items()}
+            )
+
+    def _preload_cache(self):
+        """Load at once the environment hash of the cache backend.
+
+        Only with ``REDIS_LAYOUT=hash``; the keys already defined by the
+        environment or the mapping keep their value.
+        """
+        reader = self._readers.get("cache")
+        if reader is None or reader.enabled is not True or getattr(
+            reader, "layout", None
+        ) != "hash":
+            return
+        breaker = self._breakers.get("cache")
+        try:
+            if breaker is None:
+                values = reader.get_all()
+            else:
+                values = breaker.call(reader.get_all)
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(f"NavConfig: unable to preload the cache: {err}")
+            return
+        for key, value in values.items():
+            if key in self._mapping_ or key in os.environ:
+                continue
+            self._mapping_[key] = self._unserialize(value)
+            self._preloaded.add(key)
+
+    def _switch_cache_env(self):
+        """Point the cache backend (and its listener) at the current ENV."""
+        # queued writes belong to the previous environment
+        try:
+            self.flush()
+        except ReaderError as err:
+            # already logged by the writer: the switch goes on
+            logging.warning(f"NavConfig: {err}")
+        self._drop_preloaded(None)
+        reader = self._readers.get("cache")
+        if id(reader) in self._borrowed:
+            # a shared reader stays on its environment: borrow the other one
+            reader = self._new_reader("redis", type(reader), env=self.ENV)
+            self._readers["cache"] = self._readers["redis"] = reader
+            self._timed("preload", self._preload_cache)
+        elif callable(use_env := getattr(reader, "use_env", None)):
+            use_env(self.ENV)
+            self._timed("preload", self._preload_cache)
+        if self._broadcast is not None:
+            self._start_broadcast()
+
+    def _drop_preloaded(self, keys: Optional[List[str]]):
+        if not self._preloaded:
+            return
+        for key in list(self._preloaded) if keys is None else keys:
+            # a queued write is newer than the backend value
+            if key in self._preloaded and key not in self._behind:
+                self._preloaded.discard(key)
+                self._mapping_.pop(key, None)
+
+    def get_manifest_info(self) -> Optional[Dict[str, Any]]:
+        """Access manifest diagnostics, None when not recording."""
+        if self._recorder is None:
+            return None
+        vault_keys = getattr(self._env_loader, 'vault_data', None) or {}
+        return {
+            'file': str(self._recorder.filename),
+            'accessed': self._recorder.accessed,
+            'prefetched': sorted(self._prefetched),
+            'unused_vault_keys': self._recorder.unused(vault_keys),
+        }
+
+    def _secret_reader(self, scheme: str) -> Any:
+        """Reader used to resolve the ``vault:``/``redis:`` references."""
+        name = "cache" if scheme == "redis" else "vault"
+        if (reader := self._readers.get(name)) is None:
+            if scheme == "redis":
+                return None
+            return getattr(self._env_loader, "vault_reader", None)
+        if (breaker := self._breakers.get(name)) is not None:
+            return GuardedReader(reader, breaker)
+        return reader
+
+    def _reference_value(self, name: str, value: Any) -> Any:
+        """Secret behind *value* when a template uses a reference."""
+        if (ref := parse_reference(value)) is None:
+            return value
+        try:
+            return self._secrets.resolve(ref)
+        except LookupError as err:
+            if not self._readers_ready:
+                self._deferred.add(name)
+            else:
+                logging.warning(
+                    f"NavConfig: unable to resolve {ref.raw!r} ({name}): {err}"
+                )
+            return value
+
+    def _collect_references(self):
+        """Register the values that point to a secret.
+
+        They are kept unresolved until first accessed (see
+        :meth:`_resolve_reference`).
+        """
+        if self._deferred and self._interpolation is not None:
+            deferred, self._deferred = self._deferred, set()
+            self._write_expansions(self._interpolation.refresh(deferred))
+        references = {
+            key: ref for key, value in self._mapping_.items()
+            if (ref := parse_reference(value)) is not None
+        }
+        if self._ini is not None:
+            for section in self._ini.sections():
+                for option, value in self._ini.items(section, raw=True):
+                    if (ref := parse_reference(value)) is not None:
+                        references[(section, option)] = ref
+        self._references = references
+
+    def _resolve_reference(self, key: Any) -> Any:
+        """Fetch the secret behind a reference and store it in place.
+
+        Falls back to the reference itself when it can't be resolved.
+        """
+        with self._evict_lock:
+            if (ref := self._references.get(key)) is None:
+                return None
+            evictions = self._evictions
+        try:
+            value = self._secrets.resolve(ref)
+        except SecretUnavailable as err:
+            # backend down: keep the reference, it's fetched once it's back
+            logging.debug(f"NavConfig: {ref.raw!r} ({key}) not resolved: {err}")
+            return ref.raw
+        except LookupError as err:
+            logging.warning(
+                f"NavConfig: unable to resolve {ref.raw!r} ({key}): {err}"
+            )
+            value = ref.raw
+        with self._evict_lock:
+            if evictions != self._evictions:
+                # evicted while fetched: may be stale, resolved again next time
+                return value
+            if ref.scheme == "redis":
+                self._resolved[key] = ref
+            if isinstance(key, tuple):
+                section, option = key
+                with contextlib.suppress(NoSectionError):
+                    self._ini.set(section, option, str(value).replace("%", "%%"))
+            else:
+                previous = self._mapping_.get(key, ref.raw)
+                if key in self._mapping_:
+                    self._mapping_[key] = value
+                if os.environ.get(key) in (ref.raw, self._serialize(previous)):
+                    os.environ[key] = self._serialize(value)
+            self._references.pop(key, None)
+        return value
+
+    def _prune_references(self):
+        """Forget the keys that disappeared since the previous load."""
+        if self._interpolation is None:
+            return
+        current = set(self._mapping_)
+        if self._ini is not None:
+            current.update(
+                (section, option)
+                for section in (self._ini.default_section, *self._ini.sections())
+                for option in self._ini[section]
+            )
+        if stale := [
+            key for key in self._interpolation.keys() if key not in current
+        ]:
+            self._write_expansions(
+                self._interpolation.update({}, removed=stale)
+            )
+
+    @staticmethod
+    def _elapsed(started: float) -> float:
+        return round((time.perf_counter() - started) * 1000, 3)
+
+    def _timed(self, phase: str, func: Callable, *args) -> Any:
+        """Run a bootstrap phase, recording its wall time."""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._timings[phase] = self._elapsed(started)
+
+    async def _timed_async(self, phase: str, coro) -> Any:
+        """Await a bootstrap phase, recording its wall time."""
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self._timings[phase] = self._elapsed(started)
+
+    def _ini_needs_readers(self) -> bool:
+        """True when the INI phase could read its settings from a reader.
+
+        ``DEBUG`` and ``CONFIG_FILE`` are looked up in the external readers
+        when the environment does not define them, so in that case the INI
+        must wait for the readers to be ready.
+        """
+        return any(
+            key not in self._mapping_ and key not in os.environ
+            for key in ("DEBUG", "CONFIG_FILE")
+        )
+
+    def _load_sources(self):
+        """Initialize the readers and parse the INI and PyProject files.
+
+        The three phases are independent once the environment is loaded, so
+        they run concurrently (unless ``NAVCONFIG_PARALLEL_LOAD`` is false).
+        Results are merged in the same order as a sequential load: readers,
+        then INI, then the PyProject values on top of the environment.
+        """
+        if not self._parallel:
+            self._timed("readers", self._init_external_readers)
+            self._timed("ini", self._load_ini_config)
+            self._timed("pyproject", self.load_pyproject)
+            return
+        from concurrent.futures import ThreadPoolExecutor  # pylint: disable=C0415
+        with ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="navconfig-bootstrap"
+        ) as executor:
+            readers = executor.submit(
+                self._timed, "readers", self._init_external_readers
+            )
+            pyproject = executor.submit(
+                self._timed, "pyproject", self._parse_pyproject
+            )
+            if self._ini_needs_readers():
+                readers.result()
+            ini = executor.submit(self._timed, "ini", self._load_ini_config)
+            # surface errors in the sequential order:
+            readers.result()
+            ini.result()
+            data = pyproject.result()
+        self._merge_pyproject(data)
+
+    async def _load_sources_async(self):
+        """Asyncio version of :meth:`_load_sources`.
+
+        The readers handshake and the INI parsing are blocking calls, so they
+        run on the loop's default executor; the PyProject file is parsed
+        with the asynchronous parser. One after the other, like
+        :meth:`_load_sources`, when ``NAVCONFIG_PARALLEL_LOAD`` is false.
+        """
+        import asyncio  # pylint: disable=C0415
+        if not self._parallel:
+            await self._timed_async(
+                "readers", asyncio.to_thread(self._init_external_readers)
+            )
+            await self._timed_async(
+                "ini", asyncio.to_thread(self._load_ini_config)
+            )
+            self._merge_pyproject(await self._timed_async(
+                "pyproject", self._parse_pyproject_async()
+            ))
+            return
+        readers = asyncio.ensure_future(
+            self._timed_async(
+                "readers", asyncio.to_thread(self._init_external_readers)
+            )
+        )
+
+        async def load_ini():
+            if self._ini_needs_readers():
+                await readers
+            await self._timed_async(
+                "ini", asyncio.to_thread(self._load_ini_config)
+            )
+
+        results = await asyncio.gather(
+            readers,
+            load_ini(),
+            self._timed_async("pyproject", self._parse_pyproject_async()),
+            return_exceptions=True,
+        )
+        # surface errors in the sequential order:
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        self._merge_pyproject(results[2])
 
     def _resolve_cache_backend(self) -> Optional[str]:
         """Resolve which cache backend to use.
@@ -190,10 +822,18 @@ class Kardex(metaclass=Singleton):
         self._cache_backend: Optional[str] = self._resolve_cache_backend()
         self._use_cache: bool = False
 
-        if self._cache_backend == "redis" and REDIS_LOADER:
+        redis_reader = None
+        if self._cache_backend == "redis":
+            redis_reader = _reader_class("redis")
+        if redis_reader:
             try:
-                reader = REDIS_LOADER()
+                reader = self._new_reader("redis", redis_reader, env=self.ENV)
                 self._readers["cache"] = reader
+                # only an unreachable server opens the circuit, not an
+                # error reply (WRONGTYPE)
+                self._breakers["cache"] = CircuitBreaker(
+                    "redis", counts=(ReaderUnavailable,)
+                )
                 self._use_cache = True
             except ReaderNotSet as err:
                 logging.debug(f"{err}")
@@ -209,17 +849,111 @@ class Kardex(metaclass=Singleton):
         # Backward-compat alias so source("redis") still works
         if self._use_cache:
             self._readers["redis"] = self._readers["cache"]
+            self._breakers["redis"] = self._breakers["cache"]
 
         # --- Vault as external reader (different from vault loader) ---
         self._use_vault: bool = strtobool(os.environ.get("VAULT_ENABLED", False))
-        if self._use_vault and HVAULT_LOADER:
+        vault_reader = _reader_class("vault") if self._use_vault else None
+        if vault_reader:
             try:
-                self._readers["vault"] = HVAULT_LOADER(env=self.ENV)
+                self._readers["vault"] = self._new_reader(
+                    "vault", vault_reader,
+                    env=self.ENV, cache=self._readers.get("cache")
+                )
+                self._breakers["vault"] = CircuitBreaker("vault")
             except ReaderNotSet as err:
                 logging.error(f"{err}")
             except Exception as err:
                 logging.warning(f"Vault error: {err}")
                 raise ConfigError(str(err)) from err
+        self._readers_ready = True
+        self._start_broadcast()
+
+    def _new_reader(self, name: str, factory: Callable, **kwargs) -> Any:
+        """Build a reader, or borrow the shared one with the same settings."""
+        if self._shared is None:
+            return factory(**kwargs)
+        prefix = f"{name.upper()}_"
+        settings = tuple(sorted(
+            (key, value) for key, value in os.environ.items()
+            if key.startswith(prefix)
+        ))
+        scope = kwargs.get("env")
+        if name == "redis":
+            # the hash layout is per project and environment, plain keys not
+            scope = (scope, os.getenv("PROJECT_NAME")) if os.getenv(
+                "REDIS_LAYOUT", "keys"
+            ) == "hash" else None
+        signature = (name, factory, settings, scope, id(kwargs.get("cache")))
+        if (reader := self._shared.get(signature)) is None:
+            reader = self._shared[signature] = factory(**kwargs)
+        self._borrowed.add(id(reader))
+        return reader
+
+    def _start_broadcast(self):
+        """Listen to the invalidations published by the other instances.
+
+        Opt-in (``NAVCONFIG_BROADCAST=true``): it costs a pub/sub connection
+        and a listener thread per instance.
+        """
+        if self._broadcast is not None:
+            self._broadcast.stop()
+            self._broadcast = None
+        if not strtobool(os.getenv("NAVCONFIG_BROADCAST", "False")):
+            return
+        reader = self._readers.get("cache")
+        if reader is None or not callable(getattr(reader, "subscribe", None)):
+            return
+        bus = InvalidationBus(
+            reader,
+            channel_name(os.getenv("PROJECT_NAME", "navconfig"), self.ENV),
+            self._evict
+        )
+        try:
+            bus.start()
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(f"NavConfig: invalidation listener not started: {err}")
+            return
+        self._broadcast = bus
+
+    def _evict(self, keys: Optional[List[str]], notify: bool = True):
+        """Drop *keys* (None: every key) from the local caches.
+
+        Called from the invalidation listener thread as well: the caches
+        are changed under ``_evict_lock``, the handles refreshed after
+        (unless *notify* is False).
+        """
+        with self._evict_lock:
+            self._evictions += 1
+            readers = {id(reader): reader for reader in self._readers.values()}
+            for reader in readers.values():
+                if callable(forget := getattr(reader, "forget", None)):
+                    forget(keys)
+            if keys is None:
+                self._prefetched.clear()
+            else:
+                for key in keys:
+                    self._prefetched.pop(key, None)
+            self._secrets.forget(keys)
+            # fetched again from the cache backend on next access
+            self._drop_preloaded(keys)
+            for name, ref in list(self._resolved.items()):
+                if keys is None or ref.key in keys:
+                    # resolved again on next access
+                    self._references[name] = ref
+                    self._resolved.pop(name, None)
+        if notify:
+            self._keys_changed(keys)
+
+    def _invalidate(self, keys: List[str], notify: bool = True):
+        """Evict *keys* written to the cache backend, here and elsewhere.
+
+        ``set()``, ``set_many()`` and ``setext()`` pass ``notify=False``:
+        they refresh the handles themselves once the write is done.
+        """
+        self._evict(keys, notify)
+        if self._broadcast is not None:
+            self._broadcast.publish(keys)
 
     def _load_ini_config(self):
         """Load INI configuration file."""
@@ -236,7 +970,13 @@ class Kardex(metaclass=Singleton):
         self._ini_path = cf
         if cf.exists():
             try:
-                self._ini.read(cf)
+                if self._files is not None:
+                    # the text is shared: parsed like read() would
+                    self._ini.read_string(
+                        self._files.load(cf, read_text), source=str(cf)
+                    )
+                else:
+                    self._ini.read(cf)
             except IOError as err:
                 logging.exception(f"NavConfig: INI file doesn't exist: {err}")
             except ParsingError as ex:
@@ -262,63 +1002,168 @@ class Kardex(metaclass=Singleton):
         finally:
             pass
 
+    def after_fork(self) -> None:
+        """Make a forked child independent of its parent.
+
+        The loaded configuration is kept; the reader connections, the locks
+        and the background threads (invalidation listener, write-behind)
+        are rebuilt. Runs by itself in the child of ``os.fork()``
+        (``NAVCONFIG_FORK_SAFE=false`` turns it off); frameworks with their
+        own post-fork hook may call it there.
+        """
+        self._loop = None
+        if self._flight is not None:
+            self._flight.after_fork()
+        self._secrets.after_fork()
+        for breaker in {id(b): b for b in self._breakers.values()}.values():
+            breaker.after_fork()
+        readers = {id(reader): reader for reader in self._readers.values()}
+        for reader in readers.values():
+            if callable(hook := getattr(reader, "after_fork", None)):
+                hook()
+        if self._writer is not None:
+            self._writer.after_fork()
+            self._behind_lock = threading.Lock()
+            # the parent writes what it queued
+            for key, (_, value) in list(self._behind.items()):
+                if self._mapping_.get(key) is value:
+                    self._mapping_.pop(key, None)
+            self._behind.clear()
+        if self._broadcast is not None:
+            # the listener thread stayed in the parent
+            self._start_broadcast()
+        self._evict_lock = threading.RLock()
+        # the preloader workers stayed in the parent: their loads never end
+        self._env_lock = threading.Lock()
+        self._env_preloader = None
+        self._env_loading = {
+            env: future for env, future in self._env_loading.items()
+            if future.done()
+        }
+
     def close(self):
+        lost = None
+        if self._writer is not None:
+            # flush-on-close: nothing queued is lost (or close() says so)
+            try:
+                self._writer.close()
+            except ReaderError as err:
+                lost = err
+        if self._env_preloader is not None:
+            self._env_preloader.shutdown(wait=False, cancel_futures=True)
+            self._env_preloader = None
+        if self._recorder is not None:
+            self._recorder.save()
+        if self._broadcast is not None:
+            self._broadcast.stop()
+            self._broadcast = None
         for _, reader in self._readers.items():
+            if id(reader) in self._borrowed:
+                # closed by the registry
+                continue
             try:
                 reader.close()
             except Exception as err:  # pylint: disable=W0703
                 logging.error(f"NavConfig: Error on Reader close: {err}")
+        if lost is not None:
+            raise lost
 
     @property
     def debug(self):
         return self._debug
 
-    def load_pyproject(self):
+    def _pyproject_loader(self):
+        """Build the pyproject.toml loader (FileNotFoundError if missing)."""
+        from .loaders import pyProjectLoader  # pylint: disable=C0415
+        project_name = os.getenv("PROJECT_NAME", "navconfig")
+        project_path = os.getenv("PROJECT_PATH", self.site_root)
+        project_file = os.getenv("PROJECT_FILE", "pyproject.toml")
+        if isinstance(project_path, str):
+            project_path = Path(project_path).resolve()
+        self._pyproject = pyProjectLoader(
+            env_path=project_path,
+            project_name=project_name,
+            project_file=project_file,
+            create=self._create,
+        )
+        return self._pyproject
+
+    def _parse_pyproject(self) -> dict:
         """
-        Load a pyproject.toml file and set the configuration
+        Parse the pyproject.toml file, returning the project section.
         """
         try:
-            project_name = os.getenv("PROJECT_NAME", "navconfig")
-            project_path = os.getenv("PROJECT_PATH", self.site_root)
-            project_file = os.getenv("PROJECT_FILE", "pyproject.toml")
-            if isinstance(project_path, str):
-                project_path = Path(project_path).resolve()
             with contextlib.suppress(FileNotFoundError):
-                self._pyproject = pyProjectLoader(
-                    env_path=project_path,
-                    project_name=project_name,
-                    project_file=project_file,
-                    create=self._create,
-                )
-                data = self._pyproject.load_environment()
-                self._mapping_ = {**self._mapping_, **data}
+                loader = self._pyproject_loader()
+                if self._files is not None:
+                    return self._files.load(
+                        loader.env_file,
+                        lambda path: loader.load_environment(),
+                        loader.project_name
+                    ) or {}
+                return loader.load_environment() or {}
+            return {}
         except Exception as err:
             logging.exception(err)
             raise ConfigError(
                 f"PyProject: {err}"
             ) from err
 
-    def load_environment(self, env_type: str = "vault", override: bool = False):
-        """load_environment.
-        Load an environment from a File or any pluggable Origin.
+    async def _parse_pyproject_async(self) -> dict:
+        """
+        Parse the pyproject.toml file on the running loop.
         """
         try:
-            env_path = self.site_root.joinpath("env", self.ENV)
-            logging.debug(
-                f"Environment Path: {env_path!s}"
-            )
-            obj = import_loader(loader=env_type)
-            self._env_loader = obj(
-                env_path=env_path,
-                env_file="",
-                override=override,
-                create=self._create,
-                env=self.ENV,
-                auto=self._auto_env
-            )
-            self._mapping_ = self._env_loader.load_environment()
-            if self._mapping_ is None:
-                self._mapping_ = {}  # empty dict
+            with contextlib.suppress(FileNotFoundError):
+                if self._files is not None:
+                    # a local file, answered by the shared cache
+                    return self._parse_pyproject()
+                loader = self._pyproject_loader()
+                return await loader.load_environment_async() or {}
+            return {}
+        except Exception as err:
+            logging.exception(err)
+            raise ConfigError(
+                f"PyProject: {err}"
+            ) from err
+
+    def load_pyproject(self):
+        """
+        Load a pyproject.toml file and set the configuration
+        """
+        self._merge_pyproject(self._parse_pyproject())
+
+    def _merge_pyproject(self, data: dict):
+        """Merge the PyProject values on top of the environment."""
+        self._mapping_ = {**self._mapping_, **data}
+        self._expand_references(data)
+
+    def _build_env_loader(self, env_type: str, override: bool):
+        """Instantiate the environment loader for the current ENV."""
+        env_path = self.site_root.joinpath("env", self.ENV)
+        logging.debug(
+            f"Environment Path: {env_path!s}"
+        )
+        from .loaders import import_loader  # pylint: disable=C0415
+        obj = import_loader(loader=env_type)
+        self._env_loader = obj(
+            env_path=env_path,
+            env_file="",
+            override=override,
+            create=self._create,
+            env=self.ENV,
+            auto=self._auto_env,
+            parallel=self._parallel,
+            # references are expanded by Kardex, across every source:
+            interpolate=self._interpolation is None,
+        )
+        return self._env_loader
+
+    @contextlib.contextmanager
+    def _loading_environment(self):
+        """Translate the errors raised while loading an environment."""
+        try:
+            yield
         except (FileExistsError, FileNotFoundError) as ex:
             error_message = (
                 "NavConfig initialization failed: environment assets are missing.\n"
@@ -338,6 +1183,32 @@ class Kardex(metaclass=Singleton):
                 f"Navconfig: Exception on Env loader: {ex}"
             ) from ex
 
+    def load_environment(self, env_type: str = "vault", override: bool = False):
+        """load_environment.
+        Load an environment from a File or any pluggable Origin.
+        """
+        with self._loading_environment():
+            loader = self._build_env_loader(env_type, override)
+            before = set(os.environ)
+            self._mapping_ = loader.load_environment() or {}
+            self._env_exported = {
+                key: os.environ[key] for key in os.environ.keys() - before
+            }
+
+    async def load_environment_async(
+        self, env_type: str = "vault", override: bool = False
+    ):
+        """load_environment_async.
+        Load an environment on the running loop, without blocking it.
+        """
+        with self._loading_environment():
+            loader = self._build_env_loader(env_type, override)
+            before = set(os.environ)
+            self._mapping_ = await loader.load_environment_async() or {}
+            self._env_exported = {
+                key: os.environ[key] for key in os.environ.keys() - before
+            }
+
     def source(self, option: str = "ini") -> object:
         """
         source.
@@ -374,6 +1245,7 @@ class Kardex(metaclass=Singleton):
             Add new files to the ini parser
         """
         self._ini.read(files)
+        self._expand_ini()
 
     def addEnv(self, file, override: bool = False):
         """
@@ -388,20 +1260,78 @@ class Kardex(metaclass=Singleton):
             raise ConfigError(
                 f"Failed to load a new ENV file from {file}"
             )
+        from dotenv import load_dotenv  # pylint: disable=C0415
         try:
             load_dotenv(dotenv_path=file, override=override)
         except Exception as err:
             raise KardexError(str(err)) from err
 
-    def _get_external(self, key: str) -> Any:
-        """Get value fron an External Reader."""
-        for _, reader in self._readers.items():
+    @staticmethod
+    def _lookup(reader: Any, key: str) -> tuple:
+        if reader.exists(key) is True:
+            return True, reader.get(key)
+        return False, None
+
+    def _fetch_external(self, key: str) -> tuple:
+        """Ask the external readers for *key*: (source, value).
+
+        A reader whose circuit is open is skipped without a round trip.
+        """
+        seen = set()
+        for name, reader in self._readers.items():
+            if id(reader) in seen or reader.enabled is not True:
+                # "redis" is an alias of "cache"
+                continue
+            seen.add(id(reader))
+            breaker = self._breakers.get(name)
             try:
-                if reader.enabled is True and reader.exists(key) is True:
-                    return reader.get(key)
-            except RuntimeError:
+                if breaker is None:
+                    found, value = self._lookup(reader, key)
+                else:
+                    found, value = breaker.call(self._lookup, reader, key)
+            except (RuntimeError, ReaderUnavailable):
                 continue
-        return None
+            except Exception as err:  # pylint: disable=W0703
+                if breaker is None:
+                    raise
+                logging.debug(f"NavConfig: {name} lookup of {key} failed: {err}")
+                continue
+            if found:
+                return ("vault" if name == "vault" else "redis", value)
+        return (None, None)
+
+    def _get_external(self, key: str) -> Any:
+        """Get value fron an External Reader."""
+        # (popped at once: an eviction may clear it meanwhile)
+        if self._prefetched and (entry := self._prefetched.pop(key, None)):
+            source, value = entry
+            self._record(key, source)
+            return value
+        if not self._readers:
+            return None
+        if self._flight is None:
+            source, value = self._fetch_external(key)
+        else:
+            source, value = self._flight.do(key, self._fetch_external, key)
+        if source is not None:
+            self._record(key, source)
+        return value
+
+    async def _get_external_async(self, key: str) -> Any:
+        if self._prefetched and key in self._prefetched:
+            return self._get_external(key)
+        if not self._readers:
+            return None
+        if self._flight is None:
+            import asyncio  # pylint: disable=C0415
+            source, value = await asyncio.to_thread(self._fetch_external, key)
+        else:
+            source, value = await self._flight.do_async(
+                key, self._fetch_external, key
+            )
+        if source is not None:
+            self._record(key, source)
+        return value
 
     def section(self, section: str) -> dict:
         """
@@ -432,15 +1362,7 @@ class Kardex(metaclass=Singleton):
                     return self._ini.BOOLEAN_STATES[val.lower()] if val else fallback  # noqa
                 except (NoOptionError, NoSectionError):
                     return fallback
-        # get ENV value
-        if key in self._mapping_:
-            val = self._mapping_[key]
-        elif key in os.environ:
-            val = os.getenv(key, fallback)
-            val = self._unserialize(val)
-        else:
-            val = self._get_external(key)
-            val = self._unserialize(val)
+        val = self._lookup_key(key)
         return strtobool(val) if val else fallback
 
     def getint(self, key: str, section: str = None, fallback: Any = None):
@@ -455,10 +1377,8 @@ class Kardex(metaclass=Singleton):
             else:
                 with contextlib.suppress(NoOptionError, NoSectionError):
                     val = self._ini.getint(section, key)
-        elif key in os.environ:
-            val = os.getenv(key, fallback)
         else:
-            val = self._get_external(key)
+            val = self._lookup_key(key)
         if not val:
             return fallback
         try:
@@ -478,20 +1398,37 @@ class Kardex(metaclass=Singleton):
             else:
                 with contextlib.suppress(NoOptionError, NoSectionError):
                     val = self._ini.get(section, key)
-        if key in os.environ:
-            val = os.getenv(key, fallback)
-            val = self._unserialize(val)
-        elif key in self._mapping_:
-            val = self._mapping_[key]
+        else:
+            val = self._lookup_key(key)
             if isinstance(val, (list, tuple)):
                 return val
         return val.split(",") if val else []
 
     def getdict(self, key: str) -> dict:
+        val = self._lookup_key(key)
+        return coerce(val, dict) if val else None
+
+    def _lookup_key(self, key: str) -> Any:
+        """Value of *key* outside the INI, None when it isn't defined.
+
+        The single lookup of ``get()`` and the typed getters: references,
+        then the mapping (the values of this instance), ``os.environ`` and
+        the external readers.
+        """
+        if self._references and key in self._references:
+            self._record(key, "mapping")
+            return self._resolve_reference(key)
         if key in self._mapping_:
+            self._record(key, "mapping")
             return self._mapping_[key]
-        elif key in os.environ:
-            return dict(os.getenv(key))
+        with self._environ_guard:
+            raw = os.environ.get(key)
+        if raw is not None:
+            self._record(key, "environ")
+            return self._unserialize(raw)
+        if val := self._get_external(key):
+            return self._unserialize(val)
+        return None
 
     def get(self, key: str, section: str = None, fallback: Any = None) -> Any:
         """
@@ -504,19 +1441,32 @@ class Kardex(metaclass=Singleton):
             if section in self._mapping_:
                 return self._mapping_[section]
             elif self._ini:
+                self._record(f"{section}.{key}", "ini")
+                if self._references and (section, key) in self._references:
+                    return self._resolve_reference((section, key))
                 with contextlib.suppress(NoOptionError, NoSectionError):
                     return self._ini.get(section, key)
-        if key in self._mapping_:
-            return self._mapping_[key]
-        # get ENV value
-        if key in os.environ:
-            val = os.getenv(key, fallback)
-            val = self._unserialize(val)
-            return val
-        # get data from external readers:
-        if val := self._get_external(key):
-            val = self._unserialize(val)
-            return val
+        val = self._lookup_key(key)
+        return fallback if val is None else val
+
+    async def get_async(
+        self, key: str, section: str = None, fallback: Any = None
+    ) -> Any:
+        """
+        get_async.
+            Like get(), but the external readers are queried without blocking
+            the event loop. Concurrent tasks missing the same key share a
+            single reader call.
+        """
+        if (
+            section is not None
+            or key in self._mapping_
+            or key in os.environ
+            or (self._references and key in self._references)
+        ):
+            return self.get(key, section=section, fallback=fallback)
+        if val := await self._get_external_async(key):
+            return self._unserialize(val)
         return fallback
 
     # Config Magic Methods (dict like)
@@ -525,6 +1475,7 @@ class Kardex(metaclass=Singleton):
             # override an environment variable
             value = self._serialize(value)
             os.environ[key] = value
+            self._keys_changed([key])
         elif key in self._mapping_:
             return self._mapping_[key]
         # Adding to Mutable Mapping
@@ -558,16 +1509,8 @@ class Kardex(metaclass=Singleton):
 
     ## attribute name
     def __getattr__(self, key: str) -> Any:
-        val = None
-        if key in os.environ:
-            val = os.getenv(key)
-        elif key in self._mapping_:
-            val = self._mapping_[key]
-        else:
-            # get data from external readers:
-            val = self._get_external(key)
+        val = self._lookup_key(key)
         if val:
-            val = self._unserialize(val)
             try:
                 if val.lower() in self._ini.BOOLEAN_STATES:
                     return self._ini.BOOLEAN_STATES[val.lower()]
@@ -580,23 +1523,187 @@ class Kardex(metaclass=Singleton):
                 f"Config Error: has not attribute {key}"
             )
 
-    def _serialize(self, value: Any) -> Any:
-        # Check if serialization is needed
-        if not isinstance(value, (str, int, float, bool)):
-            val = jsonpickle.encode(value)
-            value = 'NAVCONFIG_JSONDATA:' + val
-        return value
+    def settings(self, schema: Type[Schema]) -> Schema:
+        """The values of *schema*, typed, in a frozen ``__slots__`` object.
 
-    def _unserialize(self, value: Any) -> str:
-        if value and str(value).startswith("NAVCONFIG_JSONDATA"):
-            try:
-                return jsonpickle.decode(
-                    value[len("NAVCONFIG_JSONDATA:"):]
+        Built on first use and kept until a reload, ``set()`` or an
+        invalidation changes one of its keys (see :mod:`navconfig.schema`).
+
+        Usage:
+            db = config.settings(Database)
+            db.DB_PORT
+
+        Raises:
+            ConfigError: a required key is missing or a value has the
+                wrong type.
+        """
+        if (settings := self._typed.get(schema)) is None:
+            settings = schema._build({  # pylint: disable=W0212
+                name: schema._convert(  # pylint: disable=W0212
+                    name, self._read_from(field.source, field.key, field.section)
                 )
-            except jsonpickle.UnpicklingError:
-                # Fallback to the original string if deserialization fails
-                pass
-        return value
+                for name, field in schema.__fields__.items()
+            })
+            self._typed[schema] = settings
+        return settings
+
+    def handle(
+        self,
+        key: str,
+        type: Any = str,  # pylint: disable=W0622
+        default: Any = None,
+        source: str = None,
+        section: str = None
+    ) -> Handle:
+        """A handle of *key*: ``handle.value`` is the converted value.
+
+        The value is computed once, then again in place when a reload,
+        ``set()`` or an invalidation changes the key: hot loops read an
+        attribute and never see a stale value.
+
+        Usage:
+            pool_size = config.handle("POOL_SIZE", type=int, default=10)
+            pool_size.value
+
+        Args:
+            type: Conversion of the value (see ``navconfig.schema.coerce``).
+            default: Value while the key is not defined.
+            source: Read *key* from one source only ("env", "ini", "cache"
+                or "vault"); *section* implies "ini".
+
+        Raises:
+            ConfigError: the current value can't be converted to *type*.
+        """
+        handle = Handle(key, type, default, source=source, section=section)
+        try:
+            handle._update(  # pylint: disable=W0212
+                self._read_from(handle.source, key, section)
+            )
+        except (TypeError, ValueError) as err:
+            raise ConfigError(f"Invalid value for {key}: {err}") from err
+        self._handles.setdefault(key, weakref.WeakSet()).add(handle)
+        return handle
+
+    def _refresh_handles(self, keys: Optional[Iterable[str]]) -> None:
+        names = list(self._handles) if keys is None else [
+            key for key in keys if key in self._handles
+        ]
+        for name in names:
+            if not (handles := self._handles.get(name)):
+                # every handle of the key was collected
+                self._handles.pop(name, None)
+                continue
+            for handle in list(handles):
+                try:
+                    handle._update(  # pylint: disable=W0212
+                        self._read_from(handle.source, name, handle.section)
+                    )
+                except Exception as err:  # pylint: disable=W0703
+                    logging.warning(
+                        f"NavConfig: {name} keeps {handle.value!r}: {err}"
+                    )
+
+    def _read_from(
+        self, source: Optional[str], key: str, section: str = None
+    ) -> Any:
+        """Value of *key* in *source* (None: every source), None if unset."""
+        if source is None:
+            return self.get(key)
+        if source == "ini":
+            return self.get(key, section=section)
+        if source == "env":
+            if key in self._mapping_:
+                return self._mapping_[key]
+            with self._environ_guard:
+                value = os.environ.get(key)
+            return None if value is None else self._unserialize(value)
+        reader = self._readers.get(source)
+        if reader is None or reader.enabled is not True:
+            return None
+        breaker = self._breakers.get(source)
+        try:
+            if breaker is None:
+                _, value = self._lookup(reader, key)
+            else:
+                _, value = breaker.call(self._lookup, reader, key)
+        except (RuntimeError, ReaderUnavailable):
+            return None
+        return None if value is None else self._unserialize(value)
+
+    def _keys_changed(self, keys: Optional[Iterable[str]]) -> None:
+        """*keys* (None: every key) changed: drop the typed settings built
+        from them, refresh their handles."""
+        if keys is not None:
+            keys = list(keys)
+        if self._typed:
+            for schema in [s for s in self._typed if changed(s, keys)]:
+                self._typed.pop(schema, None)
+        if self._handles:
+            self._refresh_handles(keys)
+
+    def _serialize(self, value: Any) -> Any:
+        # non-scalar values are stored as tagged JSON
+        return codec.encode(value)
+
+    def _unserialize(self, value: Any) -> Any:
+        # plain strings are rejected by a prefix check; immutable decoded
+        # values are cached by their raw string.
+        return codec.decode(value)
+
+    def _external_backend(self, key: str) -> Optional[str]:
+        """Reader ("cache" or "vault") that set() writes *key* to, if any."""
+        if key in self._behind:
+            return self._behind[key][0]
+        if key in self._preloaded:
+            return "cache"
+        if key in self._mapping_ or key in os.environ:
+            return None
+        if self._use_vault is True:
+            return "vault"
+        return "cache" if self._use_cache else None
+
+    def _write_later(
+        self, backend: str, key: str, value: Any, timeout: int = None
+    ) -> bool:
+        """Queue a write (write-behind); the value is visible at once."""
+        with self._behind_lock:
+            self._behind[key] = (backend, value)
+            self._mapping_[key] = value
+        # outside the lock: put() blocks while the queue is full
+        self._writer.put(backend, key, value, timeout)
+        return True
+
+    def _write_batch(
+        self, backend: str, values: Dict[str, Any], timeout: Optional[int]
+    ):
+        """Write a batch of the write-behind queue to *backend*."""
+        reader = self._readers[backend]
+        if backend == "cache":
+            reader.set_many(
+                {key: self._serialize(value) for key, value in values.items()},
+                timeout=timeout
+            )
+        else:
+            reader.set_many(values, timeout=timeout)
+        with self._behind_lock:
+            for key, value in values.items():
+                # unless written again meanwhile, read it from the backend again
+                if (pending := self._behind.get(key)) and pending[1] is value:
+                    self._behind.pop(key, None)
+                    if self._mapping_.get(key) is value:
+                        self._mapping_.pop(key, None)
+                        self._preloaded.discard(key)
+        if backend == "cache":
+            self._invalidate(list(values))
+
+    def flush(self) -> None:
+        """Wait until the queued writes (write-behind) reached the backends.
+
+        Raises ReaderError for the writes the backend rejected (they stay
+        pending: their values are still served from the local mapping).
+        """
+        if self._writer is not None:
+            self._writer.flush()
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -604,10 +1711,27 @@ class Kardex(metaclass=Singleton):
         Set an enviroment variable on REDIS, based on Strategy
         TODO: add cloudpickle to serialize and unserialize data first.
         """
+        try:
+            return self._set(key, value)
+        finally:
+            # once written: the handles read the new value
+            self._keys_changed([key])
+
+    def _set(self, key: str, value: Any) -> None:
+        if self._writer is not None and (backend := self._external_backend(key)):
+            return self._write_later(backend, key, value)
+        if key in self._preloaded:
+            # loaded from the cache backend: write it through
+            result = self._readers["cache"].set(key, self._serialize(value))
+            self._invalidate([key], notify=False)
+            return result
         if key in self._mapping_:
             self._mapping_[key] = value
+            self._references.pop(key, None)
+            self._expand_references({key: value})
         elif key in os.environ:
             os.environ[key] = value
+            self._expand_references({key: value})
         elif self._use_vault is True:
             try:
                 return self._readers["vault"].set(key, value)
@@ -620,7 +1744,9 @@ class Kardex(metaclass=Singleton):
         elif self._use_cache:
             value = self._serialize(value)
             try:
-                return self._readers["cache"].set(key, value)
+                result = self._readers["cache"].set(key, value)
+                self._invalidate([key], notify=False)
+                return result
             except KeyError:
                 logging.warning(
                     f"Unable to Set key {key} in cache ({self._cache_backend})"
@@ -628,11 +1754,58 @@ class Kardex(metaclass=Singleton):
         else:
             # set the mapping:
             self._mapping_[key] = value
-            value = self._serialize(value)
             # Fallback: set in the environment:
-            os.environ[key] = value
+            os.environ[key] = self._serialize(value)
+            self._expand_references({key: value})
         return False
 
+    def set_many(self, values: Dict[str, Any], timeout: int = None) -> None:
+        """
+        set_many.
+        Set several variables; the keys stored in an external reader (Vault
+        or the cache backend) are written in one batch.
+        """
+        try:
+            return self._set_many(values, timeout)
+        finally:
+            self._keys_changed(values)
+
+    def _set_many(self, values: Dict[str, Any], timeout: int = None) -> None:
+        external = {}
+        for key, value in values.items():
+            if key in self._mapping_ or key in os.environ or not (
+                self._use_vault or self._use_cache
+            ):
+                self._set(key, value)
+            else:
+                external[key] = value
+        if not external:
+            return
+        if self._writer is not None:
+            backend = "vault" if self._use_vault is True else "cache"
+            for key, value in external.items():
+                self._write_later(backend, key, value, timeout)
+            return
+        if self._use_vault is True:
+            try:
+                return self._readers["vault"].set_many(external)
+            except KeyError:
+                logging.warning(
+                    f"Unable to Set keys {list(external)} in Vault"
+                )
+        else:
+            try:
+                result = self._readers["cache"].set_many(
+                    {key: self._serialize(value) for key, value in external.items()},
+                    timeout=timeout
+                )
+                self._invalidate(list(external), notify=False)
+                return result
+            except KeyError:
+                logging.warning(
+                    f"Unable to Set keys {list(external)} in cache ({self._cache_backend})"
+                )
+
     def setext(
         self, key: str, value: Any, timeout: int = None, vault: bool = False
     ) -> bool:
@@ -640,16 +1813,30 @@ class Kardex(metaclass=Singleton):
         set
             set a variable in redis with expiration
         """
+        try:
+            return self._setext(key, value, timeout, vault)
+        finally:
+            self._keys_changed([key])
+
+    def _setext(
+        self, key: str, value: Any, timeout: int = None, vault: bool = False
+    ) -> bool:
         if self._use_cache:
             time = timeout if isinstance(timeout, int) else 3600
+            if self._writer is not None:
+                return self._write_later("cache", key, value, time)
             try:
-                return self._readers["cache"].set(key, value, time)
+                result = self._readers["cache"].set(key, value, time)
+                self._invalidate([key], notify=False)
+                return result
             except KeyError:
                 logging.warning(
                     f"Unable to Set key {key} in cache ({self._cache_backend})"
                 )
         elif vault:
-            time = timeout if isinstance(timeout, int) else 3600
+            # Vault secrets don't expire: the timeout is passed as given
+            if self._writer is not None:
+                return self._write_later("vault", key, value, timeout)
             try:
                 return self._readers["vault"].set(key, value, timeout=timeout)
             except (ValueError, AttributeError):
@@ -677,35 +1864,70 @@ class Kardex(metaclass=Singleton):
         old_env = self._current_env
 
         try:
-            # Check cache first
-            if new_env in self._env_cache and not reload:
+            # a preloaded environment is current: no need to reload it
+            preloaded = self._wait_env(new_env)
+            cached = new_env in self._env_cache and (preloaded or not reload)
+            # the variables of the environment left don't leak into the new one
+            self._unexport_env()
+            self._current_env = new_env
+            self.ENV = new_env
+            if cached:
                 self._mapping_ = self._env_cache[new_env].copy()
-                self._current_env = new_env
-                self.ENV = new_env
-                logging.info(f"Switched to cached environment: {new_env}")
-                return True
-
-            # Switch environment in loader if supported
-            if hasattr(self._env_loader, 'set_environment'):
-                self._env_loader.set_environment(new_env)
-                self._current_env = new_env
-                self.ENV = new_env
+                self._export_env(self._mapping_)
             else:
-                # Reinitialize loader for new environment
-                self._current_env = new_env
-                self.ENV = new_env
                 self.load_environment(override=False)
+            self._reset_env_references()
 
-            logging.info(f"Environment switched from {old_env} to {new_env}")
+            self._switch_cache_env()
+            self._keys_changed(None)
+            self._preload_left(old_env)
+            if cached:
+                logging.info(f"Switched to cached environment: {new_env}")
+            else:
+                logging.info(f"Environment switched from {old_env} to {new_env}")
             return True
 
         except Exception as e:
             # Rollback on error
             self._current_env = old_env
             self.ENV = old_env
+            self._export_env(self._mapping_)
             logging.error(f"Failed to switch to environment {new_env}: {e}")
             raise RuntimeError(f"Environment switch failed: {e}") from e
 
+    def _unexport_env(self) -> None:
+        """Remove the variables the current environment added to os.environ."""
+        for key in self._env_exported:
+            os.environ.pop(key, None)
+        self._env_exported = {}
+
+    def _export_env(self, values: Dict[str, Any]) -> None:
+        """Add *values* to os.environ, like the loaders (no override)."""
+        for key, value in values.items():
+            if value is not None and key not in os.environ:
+                os.environ[key] = self._env_exported[key] = str(
+                    self._serialize(value)
+                )
+
+    def _reset_env_references(self) -> None:
+        """``_mapping_`` holds another environment: drop the references,
+        secrets and expansions that came from the previous one."""
+        with self._evict_lock:
+            # a resolution in flight belongs to the previous environment
+            self._evictions += 1
+            self._references = {}
+            self._resolved = {}
+            self._deferred = set()
+            self._secrets.clear()
+        if self._interpolation is not None:
+            self._exported = {}
+            self._interpolation.update({}, removed=[
+                key for key in self._interpolation.keys()
+                if not isinstance(key, tuple)
+            ])
+            self._expand_references(self._mapping_)
+        self._collect_references()
+
     def get_current_env(self) -> str:
         """Get currently active environment."""
         return self._current_env
@@ -733,9 +1955,20 @@ class Kardex(metaclass=Singleton):
             'loader_type': type(self._env_loader).__name__ if self._env_loader else None,
             'available_envs': self.list_available_envs(),
             'cached_envs': list(self._env_cache.keys()),
+            'env_cache': self._env_cache.stats(),
+            'preloaded_envs': self._preloaded_envs(),
             'site_root': str(self.site_root),
             'total_variables': len(self._mapping_),
             'cache_backend': self.cache_backend,
+            'bootstrap': self.get_bootstrap_info(),
+            'manifest': self.get_manifest_info(),
+            'readers': self.get_readers_health(),
+            'broadcast': (
+                self._broadcast.stats() if self._broadcast is not None else None
+            ),
+            'write_behind': (
+                self._writer.stats() if self._writer is not None else None
+            ),
         }
 
         # Add vault-specific information if available
@@ -750,6 +1983,49 @@ class Kardex(metaclass=Singleton):
 
         return info
 
+    def get_readers_health(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit state of every external reader (see ``CircuitBreaker``),
+        and the near-cache metrics of the readers that have one."""
+        health = {}
+        for name, breaker in self._breakers.items():
+            if name == "redis":
+                # alias of "cache"
+                continue
+            health[name] = status = breaker.status()
+            reader = self._readers.get(name)
+            if callable(stats := getattr(reader, "near_cache_stats", None)):
+                status['near_cache'] = stats()
+            if callable(stats := getattr(reader, "pool_stats", None)):
+                status['pool'] = stats()
+            if callable(stats := getattr(reader, "cache_stats", None)):
+                status['redis_copy'] = stats()
+        return health
+
+    def get_bootstrap_info(self) -> Dict[str, Any]:
+        """Diagnostics of the last bootstrap: wall time (ms) per phase."""
+        phases = dict(self._timings)
+        if timings := getattr(self._env_loader, 'timings', None):
+            phases.update(
+                {f"environment.{name}": ms for name, ms in timings.items()}
+            )
+        interpolation = None
+        if self._interpolation is not None:
+            interpolation = {
+                'templates': len(self._interpolation),
+                'rendered': self._interpolation.rendered,
+            }
+        return {
+            'parallel': self._parallel,
+            'phases': phases,
+            'discovery': discovery_timings(),
+            'interpolation': interpolation,
+            'references': {
+                'pending': len(self._references),
+                'reads': self._secrets.reads,
+            },
+            'coalesced': self._flight.shared if self._flight is not None else None,
+        }
+
     def get_with_env(self, key: str, env: str = None, fallback: Any = None) -> Any:
         """
         Get a variable from a specific environment without switching.
@@ -760,24 +2036,17 @@ class Kardex(metaclass=Singleton):
         if env is None or env == self._current_env:
             return self.get(key, fallback=fallback)
 
-        # Check cache first
+        # Check cache first (a load in progress is waited for)
+        self._wait_env(env)
         if env in self._env_cache:
             return self._env_cache[env].get(key, fallback)
 
         # Load environment temporarily (simplified version)
         try:
-            temp_env_path = self.site_root.joinpath("env", env)
-            if temp_env_path.exists():
-                from .loaders.vault import vaultLoader
-                temp_loader = vaultLoader(
-                    env_path=temp_env_path,
-                    env=env,
-                    override=False,
-                    create=False,
-                )
-                if temp_data := temp_loader.load_environment():
+            if self.site_root.joinpath("env", env).exists():
+                if temp_data := self._load_env_isolated(env):
                     # Cache for future use
-                    self._env_cache[env] = temp_data.copy()
+                    self._env_cache[env] = temp_data
                     return temp_data.get(key, fallback)
 
         except Exception as e:
@@ -789,11 +2058,108 @@ class Kardex(metaclass=Singleton):
         """Clear cached environment data."""
         if env:
             self._env_cache.pop(env, None)
+            self._env_loading.pop(env, None)
             logging.debug(f"Cleared cache for environment: {env}")
         else:
             self._env_cache.clear()
+            self._env_loading.clear()
             logging.debug("Cleared all environment cache")
 
+    def _load_env_isolated(self, env: str) -> Dict[str, Any]:
+        """Values of *env* (files and Vault), without writing ``os.environ``."""
+        from .loaders.vault import vaultLoader  # pylint: disable=C0415
+        loader = vaultLoader(
+            env_path=self.site_root.joinpath("env", env),
+            env=env,
+            override=False,
+            create=False,
+            auto=self._auto_env,
+            parallel=self._parallel,
+            interpolate=self._interpolation is None,
+            isolated=True,
+        )
+        data = loader.load_environment() or {}
+        if self._interpolation is not None:
+            # the current environment only fills what *env* doesn't define
+            data = expand_values(data, os.environ)
+        return data
+
+    def _preload_env(self, env: str) -> Dict[str, Any]:
+        data = self._load_env_isolated(env)
+        self._env_cache[env] = data
+        return data
+
+    def preload_envs(
+        self, envs: Optional[List[str]] = None, wait: bool = False
+    ) -> Dict[str, Any]:
+        """Load environments into the environment cache in the background.
+
+        Every environment of ``list_available_envs()`` but the current one
+        by default, concurrently on ``NAVCONFIG_PRELOAD_WORKERS`` (4)
+        threads and without writing ``os.environ``. ``set_env()`` then
+        switches to them without reloading, ``get_with_env()`` reads them
+        without loading. Runs after ``configure()`` with
+        ``NAVCONFIG_PRELOAD_ENVS=true``.
+
+        Returns:
+            dict: environment -> ``concurrent.futures.Future`` of its values.
+        """
+        from concurrent.futures import (  # pylint: disable=C0415
+            ThreadPoolExecutor, wait as wait_all
+        )
+        if envs is None:
+            envs = [
+                env for env in self.list_available_envs()
+                if env != self._current_env
+            ]
+        futures = {}
+        with self._env_lock:
+            if self._env_preloader is None:
+                self._env_preloader = ThreadPoolExecutor(
+                    max_workers=int(os.getenv("NAVCONFIG_PRELOAD_WORKERS", "4")),
+                    thread_name_prefix="navconfig-envs"
+                )
+            for env in envs:
+                future = self._env_loading.get(env)
+                if future is None or future.done():
+                    # (again: the files or Vault may have changed)
+                    future = self._env_preloader.submit(self._preload_env, env)
+                    future.add_done_callback(
+                        lambda f, env=env: self._preload_failed(env, f)
+                    )
+                    self._env_loading[env] = future
+                futures[env] = future
+        if wait:
+            wait_all(futures.values())
+        return futures
+
+    @staticmethod
+    def _preload_failed(env: str, future) -> None:
+        if not future.cancelled() and (err := future.exception()) is not None:
+            logging.warning(f"NavConfig: unable to preload environment {env}: {err}")
+
+    def _wait_env(self, env: str) -> bool:
+        """Wait for the background load of *env*; True if it succeeded."""
+        if (future := self._env_loading.get(env)) is None:
+            return False
+        try:
+            future.result()
+            return True
+        except Exception:  # pylint: disable=W0703
+            return False
+
+    def _preload_left(self, env: Optional[str]) -> None:
+        # keep the environment we left ready for a switch back
+        if env and self._env_preloader is not None:
+            self.preload_envs([env])
+
+    def _preloaded_envs(self) -> List[str]:
+        return sorted(
+            env for env, future in self._env_loading.items()
+            if future.done() and not future.cancelled()
+            and future.exception() is None
+        )
+
     def reload_current_env(self):
         """Reload current environment from source."""
         self.set_env(self._current_env, reload=True)
@@ -1,5 +1,6 @@
 from typing import Any, Union
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 import re
 from pathlib import PurePath
@@ -69,6 +70,14 @@ class BaseLoader(ABC):
     def load_environment(self):
         pass
 
+    async def load_environment_async(self):
+        """Load the environment without blocking the running loop.
+
+        Loaders with native asynchronous I/O override this; the default
+        runs :meth:`load_environment` on the loop's default executor.
+        """
+        return await asyncio.to_thread(self.load_environment)
+
     @abstractmethod
     def save_environment(self):
         pass
@@ -78,7 +87,9 @@ class BaseLoader(ABC):
             content = _strip_section_headers(fh.read())
         load_dotenv(stream=StringIO(content), override=self.override)
 
-    def load_from_stream(self, content: str):
+    def load_from_stream(self, content: Union[str, StringIO]):
+        if hasattr(content, "read"):
+            content = content.read()
         content = _strip_section_headers(content)
         load_dotenv(stream=StringIO(content), override=self.override)
 
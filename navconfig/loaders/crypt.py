@@ -29,5 +29,9 @@ class cryptLoader(BaseLoader):
             print(err)
             raise
 
+    async def load_environment_async(self):
+        decrypted = await self._cypher.decrypt(name=self.env_file)
+        self.load_from_stream(content=decrypted)
+
     def save_environment(self):
         raise NotImplementedError
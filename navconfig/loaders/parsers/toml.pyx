@@ -4,18 +4,42 @@
 """
 Parsing a TOML file.
 """
-import pytomlpp
 import aiofiles
+try:
+    import pytomlpp
+    _loads = pytomlpp.loads
+except ImportError:  # pragma: no cover - pytomlpp is a hard dependency
+    import tomllib
+    _loads = tomllib.loads
 
 
 cdef class TOMLParser:
+    cpdef object loads(self, str content):
+        try:
+            return _loads(content)
+        except Exception as err:
+            raise RuntimeError(
+                f'Error parsing TOML content: {err!s}.'
+            )
+
+    def parse_file(self, object filename):
+        """Read and parse a TOML file synchronously (the default path)."""
+        try:
+            with open(filename, encoding="utf-8") as f:
+                content = f.read()
+        except OSError as err:
+            raise RuntimeError(
+                f'Error parsing TOML content: {err!s}.'
+            )
+        return self.loads(content)
+
     async def parse(self, object filename):
         try:
             content = None
             async with aiofiles.open(filename) as f:
                 content = await f.read()
-            return pytomlpp.loads(content)
         except Exception as err:
             raise RuntimeError(
                 f'Error parsing TOML content: {err!s}.'
             )
+        return self.loads(content)
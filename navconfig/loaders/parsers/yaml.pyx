@@ -7,14 +7,37 @@ Parsing a YAML file.
 import yaml
 import aiofiles
 
+# libyaml-backed loader when PyYAML was built with it.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 cdef class YAMLParser:
+    cpdef object loads(self, str content):
+        try:
+            return yaml.load(content, Loader=SafeLoader)
+        except Exception as err:
+            raise RuntimeError(
+                f'Error parsing Yaml content: {err!s}.'
+            )
+
+    def parse_file(self, object filename):
+        """Read and parse a YAML file synchronously (the default path)."""
+        try:
+            with open(filename, encoding="utf-8") as f:
+                content = f.read()
+        except OSError as err:
+            raise RuntimeError(
+                f'Error parsing Yaml content: {err!s}.'
+            )
+        return self.loads(content)
+
     async def parse(self, object filename):
         try:
             content = None
             async with aiofiles.open(filename) as f:
                 content = await f.read()
-            return yaml.load(content, Loader=yaml.SafeLoader)
         except Exception as err:
             raise RuntimeError(
                 f'Error parsing Yaml content: {err!s}.'
             )
+        return self.loads(content)
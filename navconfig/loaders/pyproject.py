@@ -1,6 +1,4 @@
-import asyncio
 from pathlib import PurePath
-from concurrent.futures import ThreadPoolExecutor
 from .parsers.toml import TOMLParser
 from .abstract import BaseLoader
 
@@ -31,18 +29,8 @@ class pyProjectLoader(BaseLoader):
         return self.load().get(self.project_name, {})
 
     def load_environment(self):
-        async def run_coro(coro):
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            result = await coro
-            loop.close()
-            return result
-
-        coro = self.load_environment_async()
-        with ThreadPoolExecutor() as executor:
-            # Run the coroutine in a separate thread
-            future = executor.submit(asyncio.run, run_coro(coro))
-            return future.result()
+        self._content = self._parser.parse_file(self.env_file)
+        return self.load().get(self.project_name, {})
 
     def save_environment(self):
         pass
@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import PurePath
 from .parsers.toml import TOMLParser
 from .abstract import BaseLoader
@@ -16,7 +15,11 @@ class tomlLoader(BaseLoader):
         self._parser = TOMLParser()
 
     def load_environment(self):
-        content = asyncio.run(self._parser.parse(self.env_file))
+        content = self._parser.parse_file(self.env_file)
+        return self.load_from_string(content)
+
+    async def load_environment_async(self):
+        content = await self._parser.parse(self.env_file)
         return self.load_from_string(content)
 
     def save_environment(self):
@@ -11,11 +11,15 @@ This loader combines vault and file-based configuration loading:
 """
 
 import os
+import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional, List
 from pathlib import Path, PurePath
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv, dotenv_values
 from .abstract import BaseLoader
+from ..utils.interpolation import expand_values
 
 
 def sort_key(path):
@@ -46,6 +50,9 @@ class vaultLoader(BaseLoader):
     setting VAULT_ENV (env var or base .env file). When VAULT_ENV is
     set and non-empty, vault secrets are read from
     {mount_point}/{VAULT_ENV}/* while file loading keeps using ENV.
+
+    With ``isolated=True`` nothing is written to ``os.environ``: the values
+    are only returned (Kardex preloads the other environments this way).
     """
 
     # Default file patterns for multi-file loading
@@ -92,30 +99,113 @@ class vaultLoader(BaseLoader):
         self.vault_reader = None
         self.vault_config = {}
 
+        # Run the Vault fetch and the .env.* files at the same time
+        self.parallel: bool = kwargs.get('parallel', True)
+        # Expand ${VAR} references per file (python-dotenv); Kardex turns it
+        # off to expand them across every source.
+        self.interpolate: bool = kwargs.get('interpolate', True)
+        # Only return the values, don't export them (nor the Vault settings)
+        self.isolated: bool = kwargs.get('isolated', False)
+
         # Tracking
         self.loaded_files = []
         self.vault_data = {}
         self.file_data = {}
+        # values of each .env.* file, exported once the Vault fetch is over
+        self._file_values: List[Dict[str, Any]] = []
+        self.timings: Dict[str, float] = {}
+
+    def _timed(self, name: str, func, *args):
+        """Run ``func`` and record its wall time (ms) under ``name``."""
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.timings[name] = round(
+                (time.perf_counter() - started) * 1000, 3
+            )
+
+    def _load_vault_and_files(self) -> tuple:
+        """
+        Fetch the Vault secrets and read the additional .env.* files.
+
+        Both only depend on the base .env file, so when Vault is enabled
+        they run concurrently: the file reads overlap the Vault round trips.
+        The files are exported to ``os.environ`` once both are done (the
+        Vault reader reads and writes it meanwhile).
+        """
+        if not (self.parallel and self.vault_enabled):
+            vault_data = self._timed('vault', self._load_from_vault)
+            file_data = self._timed('files', self._load_additional_env_files)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="navconfig-vault"
+            ) as executor:
+                vault_future = executor.submit(
+                    self._timed, 'vault', self._load_from_vault
+                )
+                file_data = self._timed(
+                    'files', self._load_additional_env_files
+                )
+                vault_data = vault_future.result()
+        self._export_files()
+        return vault_data, file_data
 
     def load_environment(self) -> Dict[str, Any]:
         """
         Main loading method - orchestrates vault + file loading.
         """
-        all_data = {}
+        self.timings = {}
 
         # Step 1: Load base .env file first to get vault credentials
-        base_env_data = self._load_base_env_file()
-        all_data |= base_env_data
+        base_env_data = self._timed('base', self._load_base_env_file)
 
-        # Step 2: Initialize and load from vault if credentials available
-        if vault_data := self._load_from_vault():
+        # Step 2 and 3: load from vault (if credentials are available) and
+        # the additional .env.* files (excluding base .env)
+        vault_data, file_data = self._load_vault_and_files()
+        return self._merge_sources(base_env_data, vault_data, file_data)
+
+    async def load_environment_async(self) -> Dict[str, Any]:
+        """
+        Asyncio version of :meth:`load_environment`.
+
+        The Vault fetch and the .env.* files are read at the same time on
+        the running loop's default executor (one after the other without
+        ``parallel``).
+        """
+        self.timings = {}
+        base_env_data = await asyncio.to_thread(
+            self._timed, 'base', self._load_base_env_file
+        )
+        if not (self.parallel and self.vault_enabled):
+            vault_data, file_data = await asyncio.to_thread(
+                self._load_vault_and_files
+            )
+            return self._merge_sources(base_env_data, vault_data, file_data)
+        vault_data, file_data = await asyncio.gather(
+            asyncio.to_thread(self._timed, 'vault', self._load_from_vault),
+            asyncio.to_thread(
+                self._timed, 'files', self._load_additional_env_files
+            ),
+        )
+        self._export_files()
+        return self._merge_sources(base_env_data, vault_data, file_data)
+
+    def _merge_sources(
+        self,
+        base_env_data: Dict[str, Any],
+        vault_data: Dict[str, Any],
+        file_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Merge base .env, vault and .env.* data (in that order of loading).
+        """
+        all_data = dict(base_env_data)
+        if vault_data:
             all_data |= vault_data
             self.vault_data = vault_data
             logging.info(f"Loaded {len(vault_data)} variables from vault")
 
-        # Step 3: Load additional .env.* files (excluding base .env)
-        file_data = self._load_additional_env_files()
-
         # Step 4: Merge file data
         for key, value in file_data.items():
             if key not in all_data:
@@ -134,7 +224,8 @@ class vaultLoader(BaseLoader):
                 all_data[key] = value
 
         # Step 5: Update environment variables
-        self._update_environment_variables(all_data)
+        if not self.isolated:
+            self._update_environment_variables(all_data)
 
         logging.debug(
             f"Environment '{self.env}' loaded: "
@@ -155,16 +246,26 @@ class vaultLoader(BaseLoader):
         if base_env_path.exists() and base_env_path.stat().st_size > 0:
             try:
                 # Load into environment first
-                load_dotenv(dotenv_path=base_env_path, override=self.override)
+                if not self.isolated:
+                    load_dotenv(
+                        dotenv_path=base_env_path,
+                        override=self.override,
+                        interpolate=self.interpolate
+                    )
 
                 # Also get as dict for return value
-                base_data = dotenv_values(base_env_path)
+                base_data = dotenv_values(
+                    base_env_path, interpolate=self.interpolate
+                )
 
                 self.loaded_files.append(base_env_path)
                 logging.debug(f"Loaded base .env file: {base_env_path}")
 
                 # Extract vault configuration
-                self._extract_vault_config(base_data)
+                self._extract_vault_config(
+                    base_data if self.interpolate
+                    else expand_values(base_data, os.environ)
+                )
 
             except Exception as e:
                 logging.warning(f"Error loading base .env file {base_env_path}: {e}")
@@ -218,6 +319,12 @@ class vaultLoader(BaseLoader):
             if not self.vault_reader:
                 return {}
 
+            preload = os.getenv("NAVCONFIG_VAULT_PRELOAD", "true")
+            if preload.lower() not in ("true", "1", "yes"):
+                # secrets are only read through vault: references
+                logging.debug("Vault preload disabled")
+                return {}
+
             # Load secrets for current environment
             vault_data = self.vault_reader.list(path=self.vault_env)
 
@@ -239,15 +346,23 @@ class vaultLoader(BaseLoader):
         try:
             from ..readers.vault import VaultReader  # noqa: F401
 
-            # Set environment variables for VaultReader
-            os.environ['VAULT_URL'] = self.vault_config['url']
-            os.environ['VAULT_TOKEN'] = self.vault_config['token']
-            os.environ['VAULT_MOUNT_POINT'] = self.vault_config['mount_point']
-            os.environ['VAULT_VERSION'] = str(self.vault_config['version'])
+            settings = {
+                'VAULT_URL': self.vault_config['url'],
+                'VAULT_TOKEN': self.vault_config['token'],
+                'VAULT_MOUNT_POINT': self.vault_config['mount_point'],
+                'VAULT_VERSION': str(self.vault_config['version']),
+            }
             if self._vault_env_override:
                 # Push the resolved vault env so VaultReader (and any other
                 # consumer reading os.environ) sees the file-level override.
-                os.environ['VAULT_ENV'] = self.vault_env
+                settings['VAULT_ENV'] = self.vault_env
+            if self.isolated:
+                self.vault_reader = VaultReader(
+                    env=self.vault_env, settings=settings
+                )
+                return
+            # Set environment variables for VaultReader
+            os.environ.update(settings)
 
             self.vault_reader = VaultReader(env=self.vault_env)
             logging.debug(f"Vault reader initialized for environment: {self.vault_env}")
@@ -265,6 +380,7 @@ class vaultLoader(BaseLoader):
         """
         additional_data = {}
         additional_patterns = [p for p in self.file_patterns if p != ".env"]
+        self._file_values = []
 
         for file_pattern in additional_patterns:
             file_path = self.env_path / file_pattern
@@ -276,10 +392,13 @@ class vaultLoader(BaseLoader):
                         continue
 
                     # Load file data
-                    file_data = dotenv_values(file_path)
+                    file_data = dotenv_values(
+                        file_path, interpolate=self.interpolate
+                    )
 
-                    # Also load into environment
-                    load_dotenv(dotenv_path=file_path, override=self.override)
+                    # Also load into environment (see _export_files)
+                    if not self.isolated:
+                        self._file_values.append(file_data)
 
                     # Merge data
                     additional_data |= file_data
@@ -292,6 +411,16 @@ class vaultLoader(BaseLoader):
 
         return additional_data
 
+    def _export_files(self) -> None:
+        """
+        Write the .env.* files read to os.environ, in order, like load_dotenv.
+        """
+        file_values, self._file_values = self._file_values, []
+        for values in file_values:
+            for key, value in values.items():
+                if value is not None and (self.override or key not in os.environ):
+                    os.environ[key] = value
+
     def _update_environment_variables(self, data: Dict[str, Any]) -> None:
         """
         Update os.environ with loaded data (respecting override setting).
@@ -1,4 +1,3 @@
-import asyncio
 from pathlib import PurePath
 from .parsers.yaml import YAMLParser
 from .abstract import BaseLoader
@@ -16,7 +15,11 @@ class yamlLoader(BaseLoader):
         self._parser = YAMLParser()
 
     def load_environment(self):
-        content = asyncio.run(self._parser.parse(self.env_file))
+        content = self._parser.parse_file(self.env_file)
+        return self.load_from_string(content)
+
+    async def load_environment_async(self):
+        content = await self._parser.parse(self.env_file)
         return self.load_from_string(content)
 
     def save_environment(self):
@@ -2,6 +2,7 @@ import sys
 import os
 import logging
 from pathlib import Path, PurePath
+from .utils.discovery import discovery_cache, stamp
 
 class ProjectDetectionError(Exception):
     """Raised when project root cannot be properly detected."""
@@ -37,6 +38,31 @@ def is_notebook() -> bool:
     except (ImportError, AttributeError):
         return False
 
+def _scan_project_root(
+    current_dir: Path,
+    markers: tuple
+) -> tuple[Path, list]:
+    """Walk up from *current_dir* looking for a project marker.
+
+    Returns the root and the stamps the answer depends on: the mtime of
+    every directory searched (and of the intermediate directories of nested
+    markers such as ``etc/config.ini``), plus the marker that matched.
+    """
+    nested = sorted({
+        str(PurePath(marker).parent) for marker in markers
+        if PurePath(marker).parent != PurePath(".")
+    })
+    stamps = []
+    for directory in (current_dir, *current_dir.parents):
+        for marker in markers:
+            if (directory / marker).exists():
+                stamps.append(stamp(directory / marker))
+                return directory, stamps
+        stamps.append(stamp(directory))
+        stamps.extend(stamp(directory / parent) for parent in nested)
+    raise FileNotFoundError(current_dir)
+
+
 def find_project_root(
     base_file: str,
     markers=("etc/config.ini", ".env", "pyproject.toml", "setup.py", ".git")
@@ -44,6 +70,9 @@ def find_project_root(
     """
     Find project root by looking for common project markers.
 
+    The answer is cached (see :mod:`navconfig.utils.discovery`) until one
+    of the directories searched changes.
+
     Args:
         base_file: Starting file path for search
         markers: Tuple of file/directory names that indicate project root
@@ -54,17 +83,22 @@ def find_project_root(
     Raises:
         ProjectDetectionError: If no project root can be found
     """
-    current_dir = Path(base_file).resolve().parent
-    # Check current directory first
-    for marker in markers:
-        if (current_dir / marker).exists():
-            return current_dir
-
-    # Then check parent directories
-    for parent in current_dir.parents:
-        for marker in markers:
-            if (parent / marker).exists():
-                return parent
+    def compute():
+        root, stamps = _scan_project_root(
+            Path(base_file).resolve().parent, markers
+        )
+        return str(root), stamps
+
+    try:
+        return Path(
+            discovery_cache().lookup(
+                "project_root",
+                (str(base_file), os.getcwd(), list(markers)),
+                compute
+            )
+        )
+    except FileNotFoundError:
+        current_dir = Path(base_file).resolve().parent
 
     checked_dirs = [
         str(current_dir)
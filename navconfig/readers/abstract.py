@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Dict, Iterable
 from abc import ABC, abstractmethod
 
 
@@ -29,3 +29,22 @@ class AbstractReader(ABC):
     @abstractmethod
     def delete(self, key: str) -> bool:
         pass
+
+    # Batch operations: readers override them to save round trips; the
+    # defaults issue one call per key.
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Values of *keys* (None for the missing ones)."""
+        return {key: self.get(key) for key in keys}
+
+    def exists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """Whether each of *keys* exists."""
+        return {key: self.exists(key) for key in keys}
+
+    def set_many(self, values: Dict[str, Any], timeout: int = None) -> None:
+        """Store every key/value of *values*."""
+        for key, value in values.items():
+            self.set(key, value, timeout=timeout)
+
+    def delete_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """Delete *keys*, returning whether each one was deleted."""
+        return {key: self.delete(key) for key in keys}
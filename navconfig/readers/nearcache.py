@@ -0,0 +1,117 @@
+"""
+Process-local near-cache for the Redis reader.
+
+Values read from Redis are kept in a bounded LRU and dropped as soon as the
+server reports that another client changed them:
+
+* ``tracking``: server-assisted client-side caching. The reader connections
+  run ``CLIENT TRACKING ON REDIRECT <id>`` and Redis (6+) pushes the keys
+  that changed to a dedicated connection subscribed to
+  ``__redis__:invalidate``.
+* ``pubsub``: for servers without tracking, writers publish the keys they
+  change on :data:`CHANNEL`. Only writes made through NavConfig are seen.
+
+A read that races with an invalidation is not cached: every fetch reserves
+the key first and the value is only stored if no invalidation arrived in
+between.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+#: invalidations pushed by Redis for tracked keys.
+TRACKING_CHANNEL = "__redis__:invalidate"
+#: invalidations published by the writers (servers without tracking).
+CHANNEL = "navconfig:invalidate"
+
+MISSING = object()
+
+
+class NearCache:
+    """Bounded LRU of Redis values with hit/miss metrics.
+
+    Keys that don't exist in Redis are cached too (as None), so repeated
+    misses don't reach the server either.
+    """
+
+    def __init__(self, max_size: int = 1024, mode: str = None) -> None:
+        self.max_size = max_size
+        #: invalidation mode ("tracking" or "pubsub").
+        self.mode = mode
+        self._data: OrderedDict = OrderedDict()
+        self._pending: Dict[str, object] = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.invalidations: int = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        """Cached value of *key*, :data:`MISSING` when not cached."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def reserve(self, key: str) -> object:
+        """Call before fetching *key*; pass the token to :meth:`put`, then
+        to :meth:`release` (in a ``finally``)."""
+        token = object()
+        with self._lock:
+            self._pending[key] = token
+        return token
+
+    def put(self, key: str, value: Any, token: object) -> bool:
+        """Cache *value* unless *key* was invalidated since :meth:`reserve`."""
+        with self._lock:
+            if self._pending.get(key) is not token:
+                return False
+            del self._pending[key]
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def release(self, key: str, token: object) -> None:
+        """Drop the reservation of *key* unless another fetch took it over."""
+        with self._lock:
+            if self._pending.get(key) is token:
+                del self._pending[key]
+
+    def invalidate(self, keys: Optional[Iterable[str]]) -> None:
+        """Drop *keys* (everything when None, e.g. after a FLUSHDB)."""
+        with self._lock:
+            self.invalidations += 1
+            if keys is None:
+                self._data.clear()
+                self._pending.clear()
+                return
+            for key in keys:
+                self._data.pop(key, None)
+                self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'mode': self.mode,
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
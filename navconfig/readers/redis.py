@@ -1,31 +1,108 @@
 import os
 import logging
-from collections.abc import Callable
+from time import sleep, time as timestamp
+from collections.abc import Callable, Iterable
+from typing import Any, Dict, Optional
 import redis
-from redis.exceptions import RedisError, ResponseError, ReadOnlyError
-from ..exceptions import ReaderNotSet
+from redis.exceptions import (
+    ConnectionError as RedisConnectionError,
+    RedisError,
+    ResponseError,
+    ReadOnlyError,
+    TimeoutError as RedisTimeoutError,
+)
+from ..exceptions import ReaderNotSet, ReaderUnavailable
+from ..utils.functions import strtobool
 from .abstract import AbstractReader
+from .nearcache import CHANNEL, MISSING, TRACKING_CHANNEL, NearCache
+
+#: hashes larger than this are read with HSCAN instead of HGETALL.
+HSCAN_THRESHOLD = 5000
+
+# Drop the fields whose expiry (score of the index) is due, atomically: a
+# field written again meanwhile has been removed from the index.
+PURGE_EXPIRED = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for i = 1, #expired, 1000 do
+    local chunk = {unpack(expired, i, math.min(i + 999, #expired))}
+    redis.call('HDEL', KEYS[1], unpack(chunk))
+    redis.call('ZREM', KEYS[2], unpack(chunk))
+end
+return #expired
+"""
 
 
 class mredis(AbstractReader):
     """
     Very Basic Connector for Redis.
+
+    Reads can go through a process-local near-cache, off by default:
+    ``REDIS_NEAR_CACHE=1024`` keeps up to 1024 values, invalidated by the
+    server (``CLIENT TRACKING``) or, on servers without tracking, by the
+    writers (``REDIS_NEAR_CACHE_MODE``: ``auto``, ``tracking`` or
+    ``pubsub``). It costs a listener connection and thread per reader.
+
+    With ``REDIS_LAYOUT=hash`` the keys are stored as the fields of one hash
+    per application and environment (``navconfig:<PROJECT_NAME>:<env>``, or
+    ``REDIS_HASH``), so the whole configuration is read at once with
+    :meth:`get_all`. Key TTLs are kept in a companion sorted set
+    (``<hash>:expiry``, score = expiry timestamp): expired fields are hidden
+    on read and purged by :meth:`get_all`.
+
+    Connections come from a blocking pool (``REDIS_MAX_CONNECTIONS``, 50):
+    when every connection is busy a caller waits up to ``REDIS_POOL_TIMEOUT``
+    seconds for one instead of failing. ``REDIS_SOCKET`` connects through a
+    Unix-domain socket instead of ``REDIS_HOST``/``REDIS_PORT``; TCP
+    connections use keepalive (``REDIS_KEEPALIVE``). Idle connections are
+    checked every ``REDIS_HEALTH_CHECK`` seconds and ``REDIS_PROTOCOL=3``
+    selects RESP3.
     """
 
     params: dict = {
         "encoding": "utf-8",
         "decode_responses": True,
-        "max_connections": 10,
     }
+    _near: Optional[NearCache] = None
+    _listener: Any = None
+    _listener_client: Any = None
+    _hash: Optional[str] = None
+    _expiry: Optional[str] = None
+    #: process that opened the connections.
+    _pid: int = 0
 
-    def __init__(self):
+    def __init__(self, env: str = None, near_cache: bool = True):
+        self._pid = os.getpid()
         host = os.getenv("REDIS_HOST", "localhost")
         port = int(os.getenv("REDIS_PORT", "6379"))
         db = int(os.getenv("REDIS_DB", "1"))
-        self.redis_url = f"redis://{host}:{port}/{db}"
+        if socket_path := os.getenv("REDIS_SOCKET"):
+            # Redis on the same node: no TCP/IP stack
+            self.redis_url = f"unix://{socket_path}?db={db}"
+        else:
+            self.redis_url = f"redis://{host}:{port}/{db}"
+        # seconds: a lookup never waits longer than this for a slow server
+        self._timeout = float(os.getenv("REDIS_TIMEOUT", "2"))
+        self._max_connections = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+        # seconds waited for a free connection of the pool
+        self._pool_timeout = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+        self._options: Dict[str, Any] = {
+            "socket_connect_timeout": self._timeout,
+            "health_check_interval": int(os.getenv("REDIS_HEALTH_CHECK", "30")),
+            "protocol": int(os.getenv("REDIS_PROTOCOL", "2")),
+        }
+        if not socket_path and strtobool(os.getenv("REDIS_KEEPALIVE", "true")):
+            self._options["socket_keepalive"] = True
+        #: storage layout: "keys" (one string per key) or "hash".
+        self.layout = os.getenv("REDIS_LAYOUT", "keys").lower()
+        if self.layout == "hash":
+            self._use_hash(env if env is not None else os.getenv("ENV", ""))
         self._redis: Callable = None
         try:
-            self._redis = redis.from_url(url=self.redis_url, **self.params)
+            self._redis = self._client(
+                max_connections=self._max_connections,
+                timeout=self._pool_timeout,
+                socket_timeout=self._timeout
+            )
             response = self._redis.ping()
             if not response:
                 self.enabled = False
@@ -43,25 +120,494 @@ class mredis(AbstractReader):
             self.enabled = False
             logging.exception(err)
             raise
+        if self.enabled is not False and near_cache:
+            self._start_near_cache()
+
+    def after_fork(self) -> None:
+        """In a forked child: open new connections, restart the listener."""
+        if self._pid == os.getpid():
+            # already done (a reader shared by several Kardex)
+            return
+        self._pid = os.getpid()
+        if self._redis is not None:
+            # no disconnect(): the sockets are still used by the parent
+            self._redis.connection_pool.reset()
+        if self._near is not None:
+            self._near = None
+            self._listener = None
+            self._listener_client = None
+            self._start_near_cache()
+
+    @property
+    def client(self) -> Any:
+        """The redis-py client, for plain keys outside of the reader layout."""
+        return self._redis
+
+    def _client(self, max_connections: int, timeout: float = None, **options) -> Any:
+        """A client over its own pool of *max_connections* connections.
+
+        With a *timeout* the pool blocks (up to *timeout* seconds) when
+        every connection is in use.
+        """
+        options = {**self.params, **self._options, **options}
+        if timeout is None:
+            pool = redis.ConnectionPool.from_url(
+                self.redis_url, max_connections=max_connections, **options
+            )
+        else:
+            pool = redis.BlockingConnectionPool.from_url(
+                self.redis_url,
+                max_connections=max_connections,
+                timeout=timeout,
+                **options
+            )
+        client = redis.Redis(connection_pool=pool)
+        client.auto_close_connection_pool = True
+        return client
+
+    def pool_stats(self) -> Optional[Dict[str, Any]]:
+        """Usage of the connection pool, None when not connected."""
+        pool = getattr(self._redis, "connection_pool", None)
+        if pool is None:
+            return None
+        if isinstance(pool, redis.BlockingConnectionPool):
+            created = len(pool._connections)
+            idle = sum(conn is not None for conn in list(pool.pool.queue))
+        else:
+            created = pool._created_connections
+            idle = len(pool._available_connections)
+        return {
+            'transport': "unix" if self.redis_url.startswith("unix:") else "tcp",
+            'protocol': self._options["protocol"],
+            'max_connections': pool.max_connections,
+            'created': created,
+            'in_use': created - idle,
+            'idle': idle,
+            'blocking': isinstance(pool, redis.BlockingConnectionPool),
+        }
+
+    ## near-cache
+    def _start_near_cache(self) -> None:
+        size = int(os.getenv("REDIS_NEAR_CACHE", "0"))
+        mode = os.getenv("REDIS_NEAR_CACHE_MODE", "auto").lower()
+        if size <= 0 or mode not in ("auto", "tracking", "pubsub"):
+            return
+        near = NearCache(size)
+        try:
+            if mode != "pubsub":
+                try:
+                    self._listen(near, TRACKING_CHANNEL, tracking=True)
+                    near.mode = "tracking"
+                except ResponseError as err:
+                    if mode == "tracking":
+                        raise
+                    # Redis < 6: no CLIENT TRACKING
+                    logging.debug(
+                        f"Redis: client tracking not available ({err}), "
+                        "using pub/sub invalidation"
+                    )
+                    self._stop_listener()
+            if near.mode is None:
+                self._listen(near, CHANNEL)
+                near.mode = "pubsub"
+        except RedisError as err:
+            logging.warning(f"Redis: near-cache disabled: {err}")
+            self._stop_listener()
+            return
+        self._near = near
+
+    def _listen(self, near: NearCache, channel: str, tracking: bool = False) -> None:
+        """Subscribe a dedicated connection to the invalidation *channel*."""
+        # RESP2: with RESP3 invalidations arrive as push messages, not on
+        # the pub/sub channel
+        client = self._client(max_connections=1, protocol=2)
+        self._listener_client = client
+        if tracking:
+            # the pool has a single connection: the pub/sub below reuses
+            # the one whose id the readers redirect their invalidations to
+            pool = client.connection_pool
+            connection = pool.get_connection("CLIENT")
+            try:
+                connection.send_command("CLIENT", "ID")
+                client_id = connection.read_response()
+            finally:
+                pool.release(connection)
+            self._track(client_id)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+
+        def invalidate(message: dict) -> None:
+            keys = message.get("data")
+            if isinstance(keys, str):
+                keys = [keys]
+            if tracking and self._hash is not None and keys is not None and (
+                self._hash in keys or self._expiry in keys
+            ):
+                # tracking works per Redis key: a change to any field
+                # invalidates the whole hash
+                keys = None
+            near.invalidate(keys)
+
+        pubsub.subscribe(**{channel: invalidate})
+        self._listener = pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=self._listener_error
+        )
+
+    def _track(self, client_id: int) -> None:
+        """Turn on CLIENT TRACKING on every connection of the reader."""
+        def on_connect(connection) -> None:
+            connection.on_connect()
+            connection.send_command(
+                "CLIENT", "TRACKING", "ON", "REDIRECT", client_id
+            )
+            connection.read_response()
+
+        # raises ResponseError when the server has no tracking
+        self._redis.execute_command(
+            "CLIENT", "TRACKING", "ON", "REDIRECT", client_id
+        )
+        pool = self._redis.connection_pool
+        pool.connection_kwargs["redis_connect_func"] = on_connect
+        # reconnect the existing connections with tracking on
+        pool.disconnect()
+        pool.reset()
+
+    def _listener_error(self, err: Exception, pubsub: Any, thread: Any) -> None:
+        # without the invalidation channel the cached values can't be
+        # trusted: drop them and read from the server from now on
+        logging.warning(f"Redis: near-cache invalidation lost, disabled: {err}")
+        if (near := self._near) is not None:
+            self._near = None
+            near.clear()
+        thread.stop()
+        pubsub.close()
+
+    def _stop_listener(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._listener_client is not None:
+            self._listener_client.close()
+            self._listener_client = None
+
+    def _changed(self, keys: Iterable[str]) -> None:
+        """Drop *keys* from the near-cache (and tell the other nodes)."""
+        if (near := self._near) is None:
+            return
+        keys = list(keys)
+        near.invalidate(keys)
+        if near.mode == "pubsub" and keys:
+            with self._redis.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.publish(CHANNEL, key)
+                pipe.execute()
+
+    def forget(self, keys: Optional[Iterable[str]]) -> None:
+        """Drop *keys* (all when None) from the near-cache only."""
+        if (near := self._near) is not None:
+            near.invalidate(None if keys is None else list(keys))
+
+    def _use_hash(self, env: str) -> None:
+        self._hash = os.getenv("REDIS_HASH") or (
+            f"navconfig:{os.getenv('PROJECT_NAME', 'navconfig')}:{env}"
+        )
+        self._expiry = f"{self._hash}:expiry"
+
+    def use_env(self, env: str) -> None:
+        """Switch to the hash of *env* (``REDIS_LAYOUT=hash``)."""
+        if self._hash is None:
+            return
+        self._use_hash(env)
+        self.forget(None)
+
+    ## pub/sub
+    def publish(self, channel: str, message: str) -> int:
+        """Publish *message* on *channel*, returning the receivers."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        try:
+            return self._redis.publish(channel, message)
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+        except RedisError as err:
+            raise Exception(f"Redis Error: {err}") from err
+
+    def subscribe(
+        self,
+        channel: str,
+        handler: Callable[[str], None],
+        on_error: Callable[[Exception], None] = None
+    ) -> Any:
+        """Call ``handler(data)`` for every message on *channel*.
+
+        Messages are read by a daemon thread on a dedicated connection,
+        which reconnects (and subscribes again) on errors; *on_error* is
+        called then, since the messages sent meanwhile are lost.
+
+        Returns:
+            The listener thread (``.stop()`` to unsubscribe).
+        """
+        if self.enabled is False:
+            raise ReaderNotSet()
+        client = self._client(max_connections=1, protocol=2)
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{channel: lambda message: handler(message["data"])})
+
+        def error(err: Exception, pubsub: Any, thread: Any) -> None:
+            logging.warning(f"Redis: listener of {channel} failed: {err}")
+            if on_error is not None:
+                on_error(err)
+            # don't spin while the server is away
+            sleep(1.0)
+
+        return pubsub.run_in_thread(
+            sleep_time=1.0, daemon=True, exception_handler=error
+        )
+
+    def near_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss metrics of the near-cache, None when disabled."""
+        return self._near.stats() if self._near is not None else None
+
+    def _fetch(self, keys: list) -> Dict[str, tuple]:
+        """(value, cacheable) of *keys*, in one round trip."""
+        if self._hash is None:
+            if len(keys) == 1:
+                return {keys[0]: (self._redis.get(keys[0]), True)}
+            return {
+                key: (value, True)
+                for key, value in zip(keys, self._redis.mget(keys))
+            }
+        with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hmget(self._hash, keys)
+            for key in keys:
+                pipe.zscore(self._expiry, key)
+            values, *expiry = pipe.execute()
+        now = timestamp()
+        result = {}
+        for key, value, expires in zip(keys, values, expiry):
+            if expires is not None and expires <= now:
+                value = None
+            # values with a TTL are not kept in the near-cache: their
+            # expiry isn't notified
+            result[key] = (value, expires is None)
+        return result
+
+    def _get(self, key: str) -> Any:
+        if (near := self._near) is None:
+            if self._hash is None:
+                return self._redis.get(key)
+            return self._fetch([key])[key][0]
+        if (value := near.get(key)) is not MISSING:
+            return value
+        token = near.reserve(key)
+        try:
+            value, cacheable = self._fetch([key])[key]
+            if cacheable:
+                near.put(key, value, token)
+        finally:
+            # fetch failed or value not cacheable: drop the reservation
+            near.release(key, token)
+        return value
+
+    def _queue_set(self, pipe: Any, values: Dict[str, Any], timeout: int = None):
+        if not values:
+            # HSET, ZADD and ZREM reject an empty list of members
+            return
+        if self._hash is None:
+            for key, value in values.items():
+                pipe.set(key, value, ex=timeout)
+            return
+        pipe.hset(self._hash, mapping=values)
+        if timeout:
+            expires = timestamp() + timeout
+            pipe.zadd(self._expiry, {key: expires for key in values})
+        else:
+            pipe.zrem(self._expiry, *values)
+
+    def _queue_delete(self, pipe: Any, keys: list):
+        if not keys:
+            return
+        if self._hash is None:
+            for key in keys:
+                pipe.delete(key)
+            return
+        for key in keys:
+            pipe.hdel(self._hash, key)
+        pipe.zrem(self._expiry, *keys)
+
+    def get_all(self, expiring: bool = False) -> Dict[str, Any]:
+        """Every key of the environment hash (``REDIS_LAYOUT=hash``).
+
+        Expired keys are purged first. Keys with a TTL are left out unless
+        *expiring* is True: a copy of them would outlive their expiry.
+        """
+        if self._hash is None:
+            raise ValueError("Redis: get_all() needs REDIS_LAYOUT=hash")
+        _, size, with_ttl = self._pipeline(
+            lambda pipe: [
+                pipe.eval(PURGE_EXPIRED, 2, self._hash, self._expiry, timestamp()),
+                pipe.hlen(self._hash),
+                pipe.zrange(self._expiry, 0, -1),
+            ]
+        )
+        if size > HSCAN_THRESHOLD:
+            try:
+                values = dict(self._redis.hscan_iter(self._hash, count=1000))
+            except (RedisConnectionError, RedisTimeoutError) as err:
+                raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+            except RedisError as err:
+                raise Exception(f"Redis Error: {err}") from err
+        else:
+            values = self._pipeline(lambda pipe: pipe.hgetall(self._hash))[0]
+        if not expiring:
+            for key in with_ttl:
+                values.pop(key, None)
+        return values
+
+    ## writes
+    def set(self, key, value, timeout: int = None):
+        if self.enabled is False:
+            raise ReaderNotSet()
+        try:
+            if self._hash is None:
+                result = self._redis.set(key, value, ex=timeout)
+            else:
+                self._pipeline(
+                    lambda pipe: self._queue_set(pipe, {key: value}, timeout)
+                )
+                result = True
+            self._changed([key])
+            return result
+        except ReadOnlyError as err:
+            raise Exception(f"Redis is Read Only: {err}") from err
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+        except ReaderUnavailable:
+            raise
+        except Exception as err:
+            raise Exception(f"Redis Error: {err}") from err
 
-    def set(self, key, value):
+    def delete(self, key: str) -> bool:
         if self.enabled is False:
             raise ReaderNotSet()
         try:
-            return self._redis.set(key, value)
+            if self._hash is None:
+                result = bool(self._redis.delete(key))
+            else:
+                result = bool(self._pipeline(
+                    lambda pipe: self._queue_delete(pipe, [key])
+                )[0])
+            self._changed([key])
+            return result
         except ReadOnlyError as err:
             raise Exception(f"Redis is Read Only: {err}") from err
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+        except ReaderUnavailable:
+            raise
         except Exception as err:
             raise Exception(f"Redis Error: {err}") from err
 
-    def delete(self, key: str) -> None:
-        pass
+    def _pipeline(self, commands: Callable) -> list:
+        """Queue *commands* on a pipeline and run them in one round trip."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        try:
+            with self._redis.pipeline(transaction=False) as pipe:
+                commands(pipe)
+                return pipe.execute()
+        except ReadOnlyError as err:
+            raise Exception(f"Redis is Read Only: {err}") from err
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+        except ResponseError as err:
+            raise Exception(f"Bad Response: {err}") from err
+        except RedisError as err:
+            raise Exception(f"Redis Error: {err}") from err
+        except Exception as err:
+            raise Exception(f"Unknown Redis Error: {err}") from err
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Values of *keys* in one round trip (cached keys are skipped)."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        keys = list(keys)
+        values: Dict[str, Any] = {}
+        tokens: Dict[str, object] = {}
+        if (near := self._near) is not None:
+            for key in keys:
+                if (value := near.get(key)) is not MISSING:
+                    values[key] = value
+                else:
+                    tokens[key] = near.reserve(key)
+            missing = list(tokens)
+        else:
+            missing = keys
+        if missing:
+            try:
+                fetched = self._fetch(missing)
+                for key, token in tokens.items():
+                    value, cacheable = fetched[key]
+                    if cacheable:
+                        near.put(key, value, token)
+            except (RedisConnectionError, RedisTimeoutError) as err:
+                raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+            except ResponseError as err:
+                raise Exception(f"Bad Response: {err}") from err
+            except RedisError as err:
+                raise Exception(f"Redis Error: {err}") from err
+            except Exception as err:
+                raise Exception(f"Unknown Redis Error: {err}") from err
+            finally:
+                for key, token in tokens.items():
+                    near.release(key, token)
+            values.update({key: value for key, (value, _) in fetched.items()})
+        return {key: values[key] for key in keys}
+
+    def exists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        if self._hash is not None:
+            return {
+                key: value is not None for key, value in self.get_many(keys).items()
+            }
+        keys = list(keys)
+        results = self._pipeline(
+            lambda pipe: [pipe.exists(key) for key in keys]
+        )
+        return {key: bool(result) for key, result in zip(keys, results)}
+
+    def set_many(self, values: Dict[str, Any], timeout: int = None) -> None:
+        if not values:
+            return
+        self._pipeline(lambda pipe: self._queue_set(pipe, values, timeout))
+        self._changed(values)
+
+    def delete_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        results = self._pipeline(lambda pipe: self._queue_delete(pipe, keys))
+        self._changed(keys)
+        return {key: bool(result) for key, result in zip(keys, results)}
 
     def exists(self, key, *keys):
         if self.enabled is False:
             raise ReaderNotSet()
         try:
+            if self._hash is not None:
+                return any(
+                    value is not None
+                    for value, _ in self._fetch([key, *keys]).values()
+                ) if keys else self._get(key) is not None
+            if self._near is not None and not keys:
+                # GET instead of EXISTS: the value is cached for the get()
+                # that usually follows
+                try:
+                    return self._get(key) is not None
+                except ResponseError:
+                    # not a string
+                    pass
             return bool(self._redis.exists(key, *keys))
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
         except ResponseError as err:
             raise Exception(f"Bad Response: {err}") from err
         except RedisError as err:
@@ -73,7 +619,9 @@ class mredis(AbstractReader):
         if self.enabled is False:
             raise ReaderNotSet()
         try:
-            return self._redis.get(key)
+            return self._get(key)
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
         except ResponseError as err:
             raise Exception(f"Bad Response: {err}") from err
         except RedisError as err:
@@ -97,9 +645,20 @@ class mredis(AbstractReader):
         else:
             time = timeout
         try:
-            self._redis.setex(key, time, value)
+            if self._hash is None:
+                self._redis.setex(key, time, value)
+            else:
+                self._pipeline(
+                    lambda pipe: self._queue_set(pipe, {key: value}, time)
+                )
+            self._changed([key])
         except ReadOnlyError as err:
             raise Exception(f"Redis is Read Only: {err}") from err
+        except (RedisConnectionError, RedisTimeoutError) as err:
+            raise ReaderUnavailable(f"Redis is unavailable: {err}") from err
+        except ReaderUnavailable:
+            # from the pipeline (REDIS_LAYOUT=hash)
+            raise
         except ResponseError as err:
             raise Exception(f"Bad Response: {err}") from err
         except RedisError as err:
@@ -108,6 +667,7 @@ class mredis(AbstractReader):
             raise Exception(f"Unknown Redis Error: {err}") from err
 
     def close(self):
+        self._stop_listener()
         try:
             self._redis.close()
         except Exception as err:  # pylint: disable=W0703
@@ -1,8 +1,11 @@
-from typing import Any
+from typing import Any, Dict, Iterable
 import os
+import time
 import logging
 import hvac
-from ..exceptions import ReaderNotSet
+import requests
+from ..exceptions import ReaderNotSet, ReaderUnavailable
+from ..utils.functions import strtobool
 from .abstract import AbstractReader
 import urllib3
 
@@ -11,6 +14,151 @@ import urllib3
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+_MISSING = object()
+
+# Attempts of a check-and-set write before giving up on a busy path.
+CAS_RETRIES = 5
+
+# What Vault says when it doesn't know PATCH (405, before 1.9).
+_NOT_ALLOWED = ("405", "method not allowed", "unsupported operation")
+
+
+def _method_not_allowed(err: Exception) -> bool:
+    """True when *err* is hvac's rendering of a 405 answer.
+
+    hvac has no exception for 405: ``VaultError.from_status`` raises an
+    ``UnexpectedError`` and the status is lost, only the message is left.
+    """
+    message = str(err).lower()
+    return any(hint in message for hint in _NOT_ALLOWED)
+
+
+# Errors meaning that Vault can't be reached (or can't answer) right now.
+UNAVAILABLE = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    hvac.exceptions.VaultDown,
+    hvac.exceptions.InternalServerError,
+    hvac.exceptions.BadGateway,
+)
+
+
+class KVPatcher:
+    """Partial updates of a KV secret, safe against concurrent writers.
+
+    On KV v2 the changes are sent as a JSON merge-patch (one ``PATCH``
+    request, only the changed keys travel). When the server, the policy or
+    the data rule it out (Vault < 1.9, no ``patch`` capability, a missing
+    secret, ``null`` or nested values), the secret is read and written back
+    with check-and-set, retrying when another writer got in between. KV v1
+    has no versions: it falls back to a plain read-modify-write.
+    """
+
+    def __init__(self, client: Any, mount_point: str, version: int = 2) -> None:
+        self.client = client
+        self.mount_point = mount_point
+        self.version = version
+        #: None until the first PATCH tells whether the server supports it.
+        self.native: Any = None
+
+    def patch(
+        self,
+        path: str,
+        updates: Dict[str, Any] = None,
+        deletes: Iterable[str] = ()
+    ) -> None:
+        """Set *updates* and remove *deletes* from the secret at *path*."""
+        updates = updates or {}
+        deletes = [key for key in deletes if key not in updates]
+        if not updates and not deletes:
+            return
+        if self.version == 1:
+            self._read_modify_write(path, updates, deletes)
+            return
+        mergeable = all(
+            value is not None and not isinstance(value, dict)
+            for value in updates.values()
+        )
+        if mergeable and self.native is not False and self._merge_patch(
+            path, {**updates, **{key: None for key in deletes}}
+        ):
+            return
+        self._check_and_set(path, updates, deletes)
+
+    def _merge_patch(self, path: str, changes: dict) -> bool:
+        """Send *changes* as a merge-patch; False when it's not possible."""
+        try:
+            self.client.adapter.request(
+                "PATCH",
+                f"/v1/{self.mount_point}/data/{path}",
+                headers={"Content-Type": "application/merge-patch+json"},
+                json={"data": changes},
+            )
+        except (
+            hvac.exceptions.UnexpectedError, hvac.exceptions.InvalidRequest
+        ) as err:
+            if not _method_not_allowed(err):
+                raise
+            # Vault < 1.9 answers 405: don't try again
+            self.native = False
+            return False
+        except (hvac.exceptions.InvalidPath, hvac.exceptions.Forbidden) as err:
+            # the secret doesn't exist yet, or the policy lacks "patch"
+            logging.debug(f"Vault PATCH of {path} not possible: {err}")
+            return False
+        self.native = True
+        return True
+
+    @staticmethod
+    def _apply(data: dict, updates: dict, deletes: Iterable[str]) -> bool:
+        changed = bool(updates)
+        data.update(updates)
+        for key in deletes:
+            changed |= data.pop(key, _MISSING) is not _MISSING
+        return changed
+
+    def _check_and_set(self, path: str, updates: dict, deletes: list) -> None:
+        kv = self.client.secrets.kv.v2
+        for attempt in range(CAS_RETRIES):
+            try:
+                response = kv.read_secret_version(
+                    path=path, mount_point=self.mount_point
+                )
+                data = response["data"]["data"] or {}
+                version = response["data"]["metadata"]["version"]
+            except hvac.exceptions.InvalidPath:
+                # cas=0: only written if the secret still doesn't exist
+                data, version = {}, 0
+            if not self._apply(data, updates, deletes):
+                return
+            try:
+                kv.create_or_update_secret(
+                    path=path, secret=data, cas=version,
+                    mount_point=self.mount_point
+                )
+                return
+            except hvac.exceptions.InvalidRequest as err:
+                if "check-and-set" not in str(err):
+                    raise
+                logging.debug(
+                    f"Vault: {path} changed while writing (attempt {attempt + 1})"
+                )
+                time.sleep(0.05 * (attempt + 1))
+        raise ValueError(
+            f"Vault: {path} kept changing, gave up after {CAS_RETRIES} attempts"
+        )
+
+    def _read_modify_write(self, path: str, updates: dict, deletes: list) -> None:
+        kv = self.client.secrets.kv.v1
+        try:
+            data = kv.read_secret(path=path, mount_point=self.mount_point)["data"]
+        except hvac.exceptions.InvalidPath:
+            data = {}
+        if self._apply(data, updates, deletes):
+            kv.create_or_update_secret(
+                path=path, secret=data, mount_point=self.mount_point
+            )
+
 class VaultReader(AbstractReader):
     """VaultReader.
 
@@ -20,26 +168,82 @@ class VaultReader(AbstractReader):
     ``VAULT_ENV`` (if set and non-empty) > ``env`` argument > ``ENV``.
     This allows pointing to a custom vault environment without
     changing the ``ENV`` used by the rest of the application.
+
+    With ``VAULT_CACHE=true`` secret paths are read through an encrypted
+    copy in Redis (:mod:`navconfig.readers.vaultcache`), using the *cache*
+    reader when given, else a connection of its own.
+
+    *settings* (``VAULT_*`` names) are read before ``os.environ``: an
+    isolated loader connects without exporting them.
     """
 
-    def __init__(self, env: str = None) -> None:
-        url = os.getenv(
+    _cache: Any = None
+    _own_cache: Any = None
+    _pid: int = 0
+
+    def __init__(
+        self, env: str = None, cache: Any = None, settings: dict = None
+    ) -> None:
+        self._pid = os.getpid()
+        # VAULT_* values given by an isolated loader win over os.environ
+        environ = {**os.environ, **settings} if settings else os.environ
+        url = environ.get(
             "VAULT_URL",
             "http://localhost:8200"
         )
-        token = os.getenv("VAULT_TOKEN")
-        self.version = int(os.getenv("VAULT_VERSION", 2))
-        self._mount = os.getenv("VAULT_MOUNT_POINT", "navigator")
-        self._env = os.getenv("VAULT_ENV") or env or os.getenv("ENV", "")
+        token = environ.get("VAULT_TOKEN")
+        self.version = int(environ.get("VAULT_VERSION", 2))
+        self._mount = environ.get("VAULT_MOUNT_POINT", "navigator")
+        self._env = environ.get("VAULT_ENV") or env or environ.get("ENV", "")
         if not token:
             raise ValueError("VAULT_TOKEN is not set")
         try:
-            self.client = hvac.Client(url=url, token=token)
+            # seconds: a lookup never waits longer than this for Vault
+            timeout = float(environ.get("VAULT_TIMEOUT", "5"))
+            self.client = hvac.Client(url=url, token=token, timeout=timeout)
+            self._patcher = KVPatcher(self.client, self._mount, self.version)
             self.open()
         except Exception as err:  # pylint: disable=W0703
             self.enabled = False
             raise ReaderNotSet(f"Vault Error: {err}") from err
         self.enabled = True
+        if strtobool(environ.get("VAULT_CACHE", "False")):
+            self._start_cache(token, cache)
+
+    def _start_cache(self, token: str, cache: Any = None) -> None:
+        from .vaultcache import SecretCache, cache_cypher  # pylint: disable=C0415
+        try:
+            if cache is None or not hasattr(cache, "client"):
+                from .redis import mredis  # pylint: disable=C0415
+                cache = self._own_cache = mredis(near_cache=False)
+            self._cache = SecretCache(
+                cache.client,
+                cache_cypher(token),
+                namespace=self._mount,
+                ttl=float(os.getenv("VAULT_CACHE_TTL", "60")),
+                unavailable=UNAVAILABLE,
+            )
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(f"Vault: Redis copy of the secrets disabled: {err}")
+
+    def after_fork(self) -> None:
+        """In a forked child: new HTTP connections (and Redis ones if owned)."""
+        if self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        old = self.client.adapter.session
+        session = requests.Session()
+        session.cert, session.verify, session.proxies = (
+            old.cert, old.verify, old.proxies
+        )
+        # the parent's session is left open: its sockets are the parent's
+        self.client.adapter.session = session
+        if self._own_cache is not None:
+            self._own_cache.after_fork()
+
+    def cache_stats(self) -> Any:
+        """Metrics of the Redis copy (``VAULT_CACHE``), None when disabled."""
+        return self._cache.stats() if self._cache is not None else None
 
     def open(self) -> bool:
         if self.client.is_authenticated():
@@ -70,18 +274,11 @@ class VaultReader(AbstractReader):
             secret_path = self._env
             secret_key = key
         try:
-            if self.version == 1:
-                response = self.client.secrets.kv.v1.read_secret(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]
-            elif self.version == 2:
-                response = self.client.secrets.kv.v2.read_secret_version(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]["data"]
+            data = self._read_secret(secret_path)
         except hvac.exceptions.InvalidPath:
             return default
+        except UNAVAILABLE as err:
+            raise ReaderUnavailable(f"Vault is unavailable: {err}") from err
         except Exception as e:
             logging.debug(f"Vault get error for {key}: {e}")
             return default
@@ -111,18 +308,11 @@ class VaultReader(AbstractReader):
             secret_path = self._env
             secret_key = key
         try:
-            if self.version == 1:
-                response = self.client.secrets.kv.v1.read_secret(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]
-            elif self.version == 2:
-                response = self.client.secrets.kv.v2.read_secret_version(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]["data"]
+            data = self._read_secret(secret_path)
         except hvac.exceptions.InvalidPath:
             return False
+        except UNAVAILABLE as err:
+            raise ReaderUnavailable(f"Vault is unavailable: {err}") from err
         except Exception as e:
             logging.debug(f"Vault exists error for {key}: {e}")
             return False
@@ -131,14 +321,13 @@ class VaultReader(AbstractReader):
             return True
         return secret_key in data
 
-    def set(
-        self,
-        key: str,
-        value: Any,
-        **kwargs
-    ) -> None:
-        if self.enabled is False:
-            raise ReaderNotSet()
+    def _read_path(self, key: str) -> tuple:
+        """Secret path and key of *key* as read by get/exists (``path/key``)."""
+        secret_path, _, secret_key = key.rpartition("/")
+        return secret_path or self._env, secret_key
+
+    def _write_path(self, key: str) -> tuple:
+        """Secret path and key of *key* as written by set/delete."""
         try:
             secret_path, secret_key = key.split("/", 1)
             if not secret_path:
@@ -146,98 +335,131 @@ class VaultReader(AbstractReader):
         except ValueError:
             secret_path = self._env
             secret_key = key
+        return secret_path, secret_key
+
+    def _read_secret(self, secret_path: str) -> dict:
+        """Data stored at *secret_path* (hvac.exceptions.InvalidPath if none)."""
+        if self._cache is None:
+            return self._fetch_secret(secret_path)[1]
         try:
-            if self.version == 1:
-                # Read the existing secret data
-                existing_data = {}
-                try:
-                    read_response = self.client.secrets.kv.v1.read_secret(
-                        path=secret_path, mount_point=self._mount
-                    )
-                    existing_data = read_response['data']
-                except hvac.exceptions.InvalidPath:
-                    # If the path doesn't exist yet, it's fine
-                    pass
-
-                # Update the existing data with the new key-value pair
-                existing_data[secret_key] = value
-
-                # Write the updated data back to the path
-                self.client.secrets.kv.v1.create_or_update_secret(
-                    path=secret_path,
-                    secret=existing_data,
-                    mount_point=self._mount,
-                )
-            elif self.version == 2:
-                # For KV v2, you need to provide the full data for the path
-                # Fetch existing data if you want to preserve other keys
-                existing_data = {}
-                try:
-                    read_response = self.client.secrets.kv.v2.read_secret_version(
-                        path=secret_path, mount_point=self._mount
-                    )
-                    existing_data = read_response['data']['data']
-                except hvac.exceptions.InvalidPath:
-                    # If the path doesn't exist yet, it's fine
-                    pass
-
-                # Update the existing data with the new key-value pair
-                existing_data[secret_key] = value
-
-                # Write the updated data back to the path
-                self.client.secrets.kv.v2.create_or_update_secret(
-                    path=secret_path,
-                    secret=existing_data,
-                    mount_point=self._mount
+            return self._cache.read(
+                secret_path, self._fetch_secret, self._secret_version
+            )
+        except hvac.exceptions.InvalidPath:
+            self._cache.drop([secret_path])
+            raise
+
+    def _fetch_secret(self, secret_path: str) -> tuple:
+        """(version, data) of *secret_path*, read from Vault."""
+        if self.version == 1:
+            return None, self.client.secrets.kv.v1.read_secret(
+                path=secret_path, mount_point=self._mount
+            )["data"]
+        response = self.client.secrets.kv.v2.read_secret_version(
+            path=secret_path, mount_point=self._mount
+        )["data"]
+        return response["metadata"]["version"], response["data"]
+
+    def _secret_version(self, secret_path: str) -> Any:
+        """Current version of *secret_path* (None on KV v1)."""
+        if self.version == 1:
+            return None
+        return self.client.secrets.kv.v2.read_secret_metadata(
+            path=secret_path, mount_point=self._mount
+        )["data"]["current_version"]
+
+    @staticmethod
+    def _by_path(keys: Iterable[str], split) -> Dict[str, Dict[str, str]]:
+        """Group *keys* by secret path: {path: {key: secret_key}}."""
+        paths: Dict[str, Dict[str, str]] = {}
+        for key in keys:
+            secret_path, secret_key = split(key)
+            paths.setdefault(secret_path, {})[key] = secret_key
+        return paths
+
+    def _read_paths(self, keys: Iterable[str]) -> Dict[str, tuple]:
+        """Read every path of *keys* once: {key: (data, secret_key)}."""
+        found = {}
+        for secret_path, members in self._by_path(keys, self._read_path).items():
+            try:
+                data = self._read_secret(secret_path)
+            except hvac.exceptions.InvalidPath:
+                data = {}
+            except UNAVAILABLE as err:
+                raise ReaderUnavailable(f"Vault is unavailable: {err}") from err
+            except Exception as e:
+                logging.debug(f"Vault read error for {secret_path}: {e}")
+                data = {}
+            for key, secret_key in members.items():
+                found[key] = (data, secret_key)
+        return found
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Values of *keys*, one read per secret path."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        return {
+            key: data if secret_key == "*" else data.get(secret_key)
+            for key, (data, secret_key) in self._read_paths(keys).items()
+        }
+
+    def exists_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """Whether each of *keys* exists, one read per secret path."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        return {
+            key: bool(data) if secret_key == "*" else secret_key in data
+            for key, (data, secret_key) in self._read_paths(keys).items()
+        }
+
+    def set_many(self, values: Dict[str, Any], timeout: int = None) -> None:
+        """Store *values* with one read-modify-write per secret path."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        paths = self._by_path(values, self._write_path)
+        try:
+            for secret_path, members in paths.items():
+                self._patcher.patch(
+                    secret_path,
+                    {secret_key: values[key] for key, secret_key in members.items()}
                 )
         except Exception as ex:
             raise ValueError(
                 f"Error writing to Vault: {ex}"
             )
+        finally:
+            if self._cache is not None:
+                self._cache.drop(paths)
 
-    def delete(self, key: str, secret_path: str = None) -> bool:
-        if self.enabled is False:
-            raise ReaderNotSet()  # Or some appropriate exception
+    def set(
+        self,
+        key: str,
+        value: Any,
+        **kwargs
+    ) -> None:
+        self.set_many({key: value})
 
-        try:
-            secret_path, secret_key = key.split("/", 1)
-            if not secret_path:
-                secret_path = self._env
-        except ValueError:
-            secret_path = self._env
-            secret_key = key
+    def delete_many(self, keys: Iterable[str]) -> Dict[str, bool]:
+        """Delete *keys* with one read-modify-write per secret path."""
+        if self.enabled is False:
+            raise ReaderNotSet()
+        deleted = {}
+        paths = self._by_path(keys, self._write_path)
+        for secret_path, members in paths.items():
+            try:
+                self._patcher.patch(secret_path, deletes=members.values())
+                deleted.update({key: True for key in members})
+            except Exception as e:
+                logging.warning(
+                    f"Error deleting keys {list(members)} from '{secret_path}': {e}"
+                )
+                deleted.update({key: False for key in members})
+        if self._cache is not None:
+            self._cache.drop(paths)
+        return deleted
 
-        try:
-            if self.version == 1:
-                current_secret = self.client.secrets.kv.v1.read_secret(
-                    path=secret_path,
-                    mount_point=self._mount
-                )['data']
-                if secret_key in current_secret:
-                    del current_secret[secret_key]
-                    self.client.secrets.kv.v1.create_or_update_secret(
-                        path=secret_path,
-                        secret=current_secret,
-                        mount_point=self._mount
-                    )
-            elif self.version == 2:
-                current_secret = self.client.secrets.kv.v2.read_secret_version(
-                    path=secret_path,
-                    mount_point=self._mount
-                )['data']['data']
-                if secret_key in current_secret:
-                    del current_secret[secret_key]
-                    self.client.secrets.kv.v2.create_or_update_secret(
-                        path=secret_path,
-                        secret=current_secret,
-                        mount_point=self._mount
-                    )
-            return True
-        except Exception as e:
-            logging.warning(
-                f"Error deleting key '{key}' from '{secret_path}': {e}"
-            )
-            return False
+    def delete(self, key: str, secret_path: str = None) -> bool:
+        return self.delete_many([key])[key]
 
     def list(self, path: str = None, filter: str = None) -> dict:
         """
@@ -253,21 +475,9 @@ class VaultReader(AbstractReader):
         secret_path = path or self._env
 
         try:
-            if self.version == 1:
-                # For KV v1, read the secret directly
-                response = self.client.secrets.kv.v1.read_secret(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]
-
-            elif self.version == 2:
-                # For KV v2, read the secret version
-                response = self.client.secrets.kv.v2.read_secret_version(
-                    path=secret_path, mount_point=self._mount
-                )
-                data = response["data"]["data"]
-            else:
+            if self.version not in (1, 2):
                 raise ValueError("Invalid KV version specified")
+            data = self._read_secret(secret_path)
 
             # Apply filter if specified
             if filter:
@@ -0,0 +1,174 @@
+"""
+Encrypted read-through copy of the Vault secrets in Redis.
+
+With ``VAULT_CACHE=true`` the Vault reader (and so the Vault loader) looks
+for a copy of a secret path in Redis before asking Vault. Copies are
+encrypted (Fernet) with a key derived from ``VAULT_TOKEN``, or with the
+``unlock.key`` of ``VAULT_CACHE_KEY_DIR`` (see ``FileCypher``), and stored
+as::
+
+    navconfig:vault:<mount point>:<path> = {"v": <version>, "c": <checked at>,
+                                            "d": <encrypted payload>}
+
+A copy younger than ``VAULT_CACHE_TTL`` seconds (60) is used as is. An
+older one is revalidated against the secret metadata (KV v2): if the
+version didn't change it is used again, otherwise, or on a Redis miss (or
+when the metadata can't be read), the path is read from Vault and the copy
+replaced. Vault load therefore grows
+with the number of secret changes, not with the number of processes. While
+Vault is unreachable an outdated copy is served instead of failing.
+"""
+import base64
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+#: seconds a copy is kept in Redis without being read or revalidated.
+EXPIRE = 86400
+
+
+def cache_cypher(token: str) -> Fernet:
+    """Fernet of the copies: ``VAULT_CACHE_KEY_DIR`` or derived from *token*."""
+    if directory := os.getenv("VAULT_CACHE_KEY_DIR"):
+        from ..cyphers import FileCypher  # pylint: disable=C0415
+        return FileCypher(directory=Path(directory)).load_key()
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"navconfig vault cache",
+    ).derive(token.encode())
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+class SecretCache:
+    """Read-through copies of Vault secret paths, kept in Redis.
+
+    Args:
+        client: redis-py client (``mredis.client``).
+        cypher: Encrypts the copies (:func:`cache_cypher`).
+        namespace: Distinguishes the mount points.
+        ttl: Seconds a copy is trusted before revalidation.
+        unavailable: Exceptions meaning Vault can't be reached.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        cypher: Fernet,
+        namespace: str,
+        ttl: float = 60,
+        unavailable: tuple = (),
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        self.client = client
+        self.cypher = cypher
+        self.namespace = namespace
+        self.ttl = ttl
+        self.unavailable = unavailable
+        self._clock = clock
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidated: int = 0
+        self.stale: int = 0
+
+    def key(self, path: str) -> str:
+        return f"navconfig:vault:{self.namespace}:{path}"
+
+    def _load(self, path: str) -> Optional[dict]:
+        try:
+            raw = self.client.get(self.key(path))
+        except Exception as err:  # pylint: disable=W0703
+            logging.debug(f"Vault cache: unable to read {path}: {err}")
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = json.loads(raw)
+            entry["data"] = json.loads(self.cypher.decrypt(entry["d"].encode()))
+            return entry
+        except (InvalidToken, ValueError, KeyError, TypeError) as err:
+            # another key (the token rotated) or a damaged copy
+            logging.debug(f"Vault cache: ignoring the copy of {path}: {err}")
+            return None
+
+    def _store(self, path: str, version: Optional[int], payload: str) -> None:
+        entry = json.dumps(
+            {"v": version, "c": self._clock(), "d": payload},
+            separators=(",", ":")
+        )
+        try:
+            self.client.set(self.key(path), entry, ex=EXPIRE)
+        except Exception as err:  # pylint: disable=W0703
+            logging.debug(f"Vault cache: unable to store {path}: {err}")
+
+    def read(
+        self,
+        path: str,
+        fetch: Callable[[str], tuple],
+        version: Callable[[str], Optional[int]]
+    ) -> dict:
+        """Data of the secret *path*, from Redis when the copy is current.
+
+        Args:
+            fetch: ``fetch(path) -> (version, data)`` reads Vault.
+            version: ``version(path)`` is the current version of the
+                secret (None when the engine has no versions).
+        """
+        entry = self._load(path)
+        if entry is not None:
+            if self._clock() - entry["c"] < self.ttl:
+                self.hits += 1
+                return entry["data"]
+            try:
+                current = version(path) if entry["v"] is not None else None
+            except self.unavailable:
+                self.stale += 1
+                logging.warning(
+                    f"Vault cache: Vault unreachable, using the copy of {path}"
+                )
+                return entry["data"]
+            except Exception as err:  # pylint: disable=W0703
+                # e.g. a token allowed to read the secret but not its
+                # metadata: read it (its errors aren't masked by the copy)
+                logging.debug(
+                    f"Vault cache: unable to revalidate {path}, reading it: {err}"
+                )
+                current = None
+            if current is not None and current == entry["v"]:
+                self.revalidated += 1
+                self._store(path, current, entry["d"])
+                return entry["data"]
+        self.misses += 1
+        current, data = fetch(path)
+        payload = self.cypher.encrypt(
+            json.dumps(data, separators=(",", ":")).encode()
+        ).decode()
+        self._store(path, current, payload)
+        return data
+
+    def drop(self, paths: Iterable[str]) -> None:
+        """Forget the copies of *paths* (after writing them)."""
+        keys = [self.key(path) for path in paths]
+        if not keys:
+            return
+        try:
+            self.client.delete(*keys)
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(f"Vault cache: unable to drop {keys}: {err}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'stale': self.stale,
+        }
@@ -0,0 +1,207 @@
+"""
+KardexRegistry.
+
+Several independent configurations in one process (a multi-tenant
+service, a tool working on many projects): one ``Kardex`` per
+``(site_root, env)``, next to the ``Kardex()`` singleton, which keeps
+working as before.
+
+The instances share what can be shared: the reader connections (one Redis
+or Vault reader per distinct ``REDIS_*``/``VAULT_*`` settings) and the
+parsed ``etc/config.ini`` and ``pyproject.toml`` files. Instances not used
+for ``idle_timeout`` seconds, and the least recently used ones beyond
+``max_size``, are closed.
+
+Loading a project writes its ``.env`` to ``os.environ``: the registry
+builds one instance at a time under ``environ_lock``, keeps the values the
+project loaded in the instance itself and puts ``os.environ`` back as it
+was. Once a registry exists, the lookups of the other instances (the
+singleton included) read ``os.environ`` under the same lock, so no project
+sees the variables of another one, even for the duration of a build.
+Builds run outside the registry lock: getting a loaded instance never waits
+for the build of another one, and concurrent gets of the same project
+share one build.
+"""
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .kardex import Kardex, environ_lock
+from .utils.filecache import FileCache
+from .utils.flight import SingleFlight
+
+
+class KardexRegistry:
+    """Independent ``Kardex`` instances, keyed by ``(site_root, env)``.
+
+    Usage:
+        registry = KardexRegistry(max_size=32, idle_timeout=600)
+        config = registry.get("/srv/tenants/acme", env="prod")
+        config.get("DB_HOST")
+
+    Args:
+        max_size: Instances kept at most; the least recently used are closed.
+        idle_timeout: Seconds an unused instance is kept (0: no limit).
+    """
+
+    def __init__(
+        self,
+        max_size: int = 64,
+        idle_timeout: float = 0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._instances: "OrderedDict[Hashable, Tuple[Kardex, float]]" = OrderedDict()
+        #: readers shared by the instances, see ``Kardex._new_reader``.
+        self._readers: Dict[Hashable, Any] = {}
+        self._files = FileCache()
+        # concurrent gets of the same (site_root, env) share one build
+        self._flight = SingleFlight()
+        self.builds: int = 0
+        self.evictions: int = 0
+        # from now on, builds write os.environ: every lookup waits for them
+        Kardex._environ_guard = environ_lock  # pylint: disable=W0212
+
+    @staticmethod
+    def _key(site_root, env: Optional[str]) -> tuple:
+        return (str(Path(site_root).resolve()), env)
+
+    def get(self, site_root, env: str = None, **kwargs) -> Kardex:
+        """The configuration of *site_root* for *env*, built on first use.
+
+        Extra keyword arguments are passed to ``Kardex`` when it's built.
+        """
+        key = self._key(site_root, env)
+        self.prune()
+        with self._lock:
+            entry = self._instances.get(key)
+        if entry is not None:
+            return self._publish(key, entry[0])
+        # built outside the registry lock (file, Vault and Redis I/O)
+        return self._flight.do(key, self._build_once, key, site_root, env, kwargs)
+
+    def _build_once(
+        self, key: tuple, site_root, env: Optional[str], kwargs: dict
+    ) -> Kardex:
+        with self._lock:
+            entry = self._instances.get(key)
+        if entry is not None:
+            # published since the first look
+            return self._publish(key, entry[0])
+        kardex = self._build(site_root, env, **kwargs)
+        with self._lock:
+            self.builds += 1
+        return self._publish(key, kardex)
+
+    def _publish(self, key: tuple, kardex: Kardex) -> Kardex:
+        """Mark *kardex* as the most recently used, close the surplus."""
+        closing = []
+        with self._lock:
+            self._instances[key] = (kardex, self._clock())
+            self._instances.move_to_end(key)
+            while len(self._instances) > self.max_size:
+                _, (oldest, _) = self._instances.popitem(last=False)
+                closing.append(oldest)
+        for oldest in closing:
+            self._close(oldest)
+        return kardex
+
+    def _build(self, site_root, env: Optional[str], **kwargs) -> Kardex:
+        with environ_lock:
+            before = dict(os.environ)
+            try:
+                kardex = Kardex._unshared(  # pylint: disable=W0212
+                    site_root=site_root,
+                    env=env,
+                    shared_readers=self._readers,
+                    files=self._files,
+                    **kwargs
+                )
+                loaded = {
+                    name: value for name, value in os.environ.items()
+                    if before.get(name) != value
+                }
+            finally:
+                for name in set(os.environ) - set(before):
+                    del os.environ[name]
+                for name, value in before.items():
+                    if os.environ.get(name) != value:
+                        os.environ[name] = value
+        # built: its lookups respect the builds of the other instances
+        kardex._environ_guard = environ_lock  # pylint: disable=W0212
+        for name, value in loaded.items():
+            # pylint: disable=W0212
+            kardex._mapping_.setdefault(name, kardex._unserialize(value))
+        return kardex
+
+    def _close(self, kardex: Kardex) -> None:
+        self.evictions += 1
+        try:
+            kardex.close()
+        except Exception as err:  # pylint: disable=W0703,W0212
+            logging.error(f"NavConfig: Error closing {kardex._site_path}: {err}")
+
+    def evict(self, site_root, env: str = None) -> bool:
+        """Close the configuration of *site_root*/*env*; False if not loaded."""
+        with self._lock:
+            entry = self._instances.pop(self._key(site_root, env), None)
+        if entry is None:
+            return False
+        self._close(entry[0])
+        return True
+
+    def prune(self) -> int:
+        """Close the instances idle for longer than ``idle_timeout``."""
+        if not self.idle_timeout:
+            return 0
+        deadline = self._clock() - self.idle_timeout
+        with self._lock:
+            idle = [
+                key for key, (_, used) in self._instances.items()
+                if used <= deadline
+            ]
+            closing = [self._instances.pop(key)[0] for key in idle]
+        for kardex in closing:
+            self._close(kardex)
+        return len(closing)
+
+    def close(self) -> None:
+        """Close every instance, then the shared readers."""
+        with self._lock:
+            instances = [kardex for kardex, _ in self._instances.values()]
+            self._instances.clear()
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for kardex in instances:
+            self._close(kardex)
+        for reader in readers:
+            try:
+                reader.close()
+            except Exception as err:  # pylint: disable=W0703
+                logging.error(f"NavConfig: Error on Reader close: {err}")
+        self._files.clear()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __contains__(self, key) -> bool:
+        site_root, env = key if isinstance(key, tuple) else (key, None)
+        return self._key(site_root, env) in self._instances
+
+    def stats(self) -> dict:
+        return {
+            'instances': len(self._instances),
+            'max_size': self.max_size,
+            'idle_timeout': self.idle_timeout,
+            'builds': self.builds,
+            'evictions': self.evictions,
+            'readers': len(self._readers),
+            'files': self._files.stats(),
+        }
@@ -0,0 +1,241 @@
+"""
+Typed settings, declared once and materialized by ``Kardex``.
+
+``config.DB_PORT`` looks the key up in every source and converts it on
+each access. A schema declares the settings a component reads, with their
+type, default and (optionally) where they come from::
+
+    class Database(Schema):
+        DB_HOST: str = "localhost"
+        DB_PORT: int = 5432
+        DB_DEBUG: bool = False
+        DB_HOSTS: list = []
+        DB_PASSWORD: str = Field(source="vault")
+        pool_size: int = Field(10, key="POOL_SIZE", section="database")
+
+    db = config.settings(Database)
+    db.DB_PORT  # 5432: a slot read, already an int
+
+``Kardex.settings()`` builds the (frozen, ``__slots__``) instance once and
+keeps it until a reload, ``set()`` or an invalidation changes one of the
+keys of the schema: the next call builds it again.
+
+A single value read in a hot loop can be bound instead: the
+:class:`Handle` of ``config.handle("POOL_SIZE", type=int, default=10)``
+has the converted value in ``handle.value``, updated in place by Kardex
+when the key changes.
+"""
+import copy
+import json
+import typing
+from typing import Any, Dict, Iterable, Optional
+
+from .exceptions import ConfigError
+from .utils.functions import strtobool
+
+#: a Field without a default: the key must be defined.
+REQUIRED = object()
+
+#: sources a Field can be read from; None follows ``Kardex.get()``.
+SOURCES = (None, "env", "ini", "cache", "vault")
+
+
+class Field:
+    """Declaration of a setting.
+
+    Args:
+        default: Value when the key is not defined (``REQUIRED``: an error).
+        key: Configuration key, the attribute name by default.
+        source: ``"env"`` (the environment only), ``"ini"``, ``"cache"``
+            or ``"vault"``; None looks in every source, like ``get()``.
+        section: INI section (implies ``source="ini"``).
+    """
+
+    __slots__ = ("default", "key", "source", "section", "type", "name")
+
+    def __init__(
+        self,
+        default: Any = REQUIRED,
+        key: str = None,
+        source: str = None,
+        section: str = None
+    ) -> None:
+        if section is not None and source is None:
+            source = "ini"
+        if source not in SOURCES:
+            raise ValueError(f"Field: unknown source {source!r}")
+        if source == "ini" and section is None:
+            raise ValueError("Field: an INI setting needs a section")
+        self.default = default
+        self.key = key
+        self.source = source
+        self.section = section
+        self.type: Any = str
+        self.name: str = None
+
+    def __repr__(self) -> str:
+        return (
+            f"Field({self.name}: {getattr(self.type, '__name__', self.type)}, "
+            f"key={self.key!r}, source={self.source!r})"
+        )
+
+
+def _unwrap(kind: Any) -> Any:
+    """``Optional[int]`` -> int, ``list[str]`` -> list."""
+    if typing.get_origin(kind) is typing.Union:
+        args = [arg for arg in typing.get_args(kind) if arg is not type(None)]
+        kind = args[0] if len(args) == 1 else Any
+    return typing.get_origin(kind) or kind
+
+
+def coerce(value: Any, kind: Any) -> Any:
+    """Convert a configuration value (often a string) to *kind*."""
+    kind = _unwrap(kind)
+    if kind is Any or isinstance(kind, type) and isinstance(value, kind) and not (
+        kind is int and isinstance(value, bool)
+    ):
+        return value
+    if kind is bool:
+        if isinstance(value, (int, float)):
+            return bool(value)
+        return strtobool(str(value).strip())
+    if kind in (list, tuple, set, frozenset):
+        if isinstance(value, str):
+            value = [item.strip() for item in value.split(",") if item.strip()]
+        return kind(value)
+    if kind is dict and isinstance(value, str):
+        return json.loads(value)
+    return kind(value)
+
+
+class SchemaMeta(type):
+    """Turns the annotated attributes of a schema into slots and Fields."""
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        annotations = namespace.get("__annotations__", {})
+        fields: Dict[str, Field] = {}
+        for base in reversed(bases):
+            fields.update(getattr(base, "__fields__", {}))
+        own = []
+        for attr, kind in annotations.items():
+            if attr.startswith("_") or typing.get_origin(kind) is typing.ClassVar:
+                continue
+            declared = namespace.pop(attr, REQUIRED)
+            field = declared if isinstance(declared, Field) else Field(declared)
+            field.name = attr
+            field.key = field.key or attr
+            field.type = kind
+            fields[attr] = field
+            if not any(attr in getattr(base, "__fields__", {}) for base in bases):
+                own.append(attr)
+        namespace["__slots__"] = tuple(own)
+        namespace["__fields__"] = fields
+        namespace["__keys__"] = frozenset(field.key for field in fields.values())
+        cls = super().__new__(mcs, name, bases, namespace)
+        if any(isinstance(fields[attr].type, str) for attr in own):
+            # postponed annotations (from __future__ import annotations)
+            hints = typing.get_type_hints(cls)
+            for attr in own:
+                fields[attr].type = hints.get(attr, fields[attr].type)
+        return cls
+
+
+class Schema(metaclass=SchemaMeta):
+    """Base of the settings schemas; instances are frozen.
+
+    See :meth:`navconfig.kardex.Kardex.settings`.
+    """
+
+    __slots__ = ()
+    __fields__: Dict[str, Field] = {}
+    __keys__: frozenset = frozenset()
+
+    @classmethod
+    def _build(cls, values: Dict[str, Any]) -> "Schema":
+        instance = object.__new__(cls)
+        for name, value in values.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+    @classmethod
+    def _convert(cls, name: str, value: Any) -> Any:
+        field = cls.__fields__[name]
+        if value is None:
+            if field.default is REQUIRED:
+                raise ConfigError(
+                    f"{cls.__name__}: {field.key} is not defined"
+                )
+            # (a list default is not shared by the instances)
+            return copy.copy(field.default)
+        try:
+            return coerce(value, field.type)
+        except (TypeError, ValueError) as err:
+            raise ConfigError(
+                f"{cls.__name__}: invalid value for {field.key}: {err}"
+            ) from err
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__fields__}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._asdict() == other._asdict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{k}={v!r}" for k, v in self._asdict().items())
+        return f"{type(self).__name__}({values})"
+
+
+class Handle:
+    """A configuration value bound to its key: read ``handle.value``.
+
+    Created by :meth:`navconfig.kardex.Kardex.handle`, which converts the
+    value again when a reload, ``set()`` or an invalidation changes the
+    key. Kardex only keeps a weak reference: a handle lives as long as its
+    owner keeps it.
+    """
+
+    __slots__ = (
+        "key", "type", "default", "source", "section", "value", "updates",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        key: str,
+        type: Any = str,  # pylint: disable=W0622
+        default: Any = None,
+        source: str = None,
+        section: str = None
+    ) -> None:
+        self.key = key
+        self.type = type
+        self.default = default
+        self.source = "ini" if section is not None and source is None else source
+        self.section = section
+        self.value: Any = default
+        #: times the value was refreshed.
+        self.updates: int = 0
+
+    def _update(self, raw: Any) -> None:
+        self.value = copy.copy(self.default) if raw is None else coerce(
+            raw, self.type
+        )
+        self.updates += 1
+
+    def __repr__(self) -> str:
+        return f"Handle({self.key}={self.value!r})"
+
+
+def changed(schema: type, keys: Optional[Iterable[str]]) -> bool:
+    """True when *keys* (None: every key) include a key of *schema*."""
+    return keys is None or not schema.__keys__.isdisjoint(keys)
@@ -1,9 +1,22 @@
-from .uvl import install_uvloop
-from .functions import strtobool
-from .types import Singleton
-from .json import json_encoder, json_decoder, JSONContent
-from .settings import ensure_settings_priority
+"""
+NavConfig utilities.
 
+Submodules are imported on first access (PEP 562), so importing a single
+helper does not pull orjson, dateutil or asyncio along with it.
+"""
+from importlib import import_module
+from typing import Any
+
+#: Public name -> submodule that defines it.
+_EXPORTS: dict = {
+    "install_uvloop": ".uvl",
+    "strtobool": ".functions",
+    "Singleton": ".types",
+    "json_encoder": ".json",
+    "json_decoder": ".json",
+    "JSONContent": ".json",
+    "ensure_settings_priority": ".settings",
+}
 
 __all__ = (
     "install_uvloop",
@@ -14,3 +27,17 @@ __all__ = (
     "ensure_settings_priority",
     "JSONContent",
 )
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,172 @@
+"""
+Circuit breaker for the external readers (Redis, Vault).
+
+After ``failures`` consecutive errors the circuit opens: calls are rejected
+at once with :class:`~navconfig.exceptions.ReaderUnavailable`, so lookups
+fall back to the local sources instead of waiting for a client timeout.
+Once ``reset_timeout`` seconds have passed a single call is let through
+(half-open); its success closes the circuit, its failure opens it again.
+"""
+import os
+import time
+import logging
+import threading
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+from ..exceptions import ReaderNotSet, ReaderUnavailable
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Track the failures of a reader and fail fast while it is down.
+
+    Args:
+        name: Reader name, used in the messages.
+        failures: Consecutive failures that open the circuit
+            (``NAVCONFIG_BREAKER_FAILURES``, 5). 0 disables the breaker.
+        reset_timeout: Seconds before a probe is let through
+            (``NAVCONFIG_BREAKER_RESET``, 30).
+        clock: Monotonic time source.
+        counts: Errors counted as failures. Other errors (a bad request,
+            a value of the wrong type) are raised, but the backend did
+            answer: they count as a success.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failures: int = None,
+        reset_timeout: float = None,
+        clock: Callable[[], float] = time.monotonic,
+        counts: Tuple[Type[BaseException], ...] = (Exception,)
+    ) -> None:
+        self.name = name
+        self.counts = counts
+        if failures is None:
+            failures = int(os.getenv("NAVCONFIG_BREAKER_FAILURES", "5"))
+        if reset_timeout is None:
+            reset_timeout = float(os.getenv("NAVCONFIG_BREAKER_RESET", "30"))
+        self.threshold = failures
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at: float = 0.0
+        self._probing = False
+        self._last_error: Optional[str] = None
+        #: calls rejected while the circuit was open.
+        self.rejected: int = 0
+
+    def after_fork(self) -> None:
+        """In a forked child: the lock may have been held by a parent thread."""
+        self._lock = threading.Lock()
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._retry_due():
+                return HALF_OPEN
+            return self._state
+
+    def _retry_due(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_timeout
+
+    def allow(self) -> bool:
+        """Whether a call may go to the backend now."""
+        if self._state == CLOSED:
+            return True
+        with self._lock:
+            if self._state == OPEN and self._retry_due():
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                # a single probe at a time
+                self._probing = True
+                return True
+            if self._state == CLOSED:
+                return True
+            self.rejected += 1
+            return False
+
+    def success(self) -> None:
+        if self._state == CLOSED and not self._failures:
+            return
+        with self._lock:
+            if self._state != CLOSED:
+                logging.info(f"NavConfig: {self.name} reader is available again")
+            self._state = CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def failure(self, error: BaseException) -> None:
+        with self._lock:
+            self._failures += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+            if self._state == HALF_OPEN or self._failures >= self.threshold:
+                if self._state != OPEN:
+                    logging.warning(
+                        f"NavConfig: {self.name} reader is unavailable, "
+                        f"retrying in {self.reset_timeout:g}s: {error}"
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probing = False
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Run ``func(*args, **kwargs)`` through the breaker.
+
+        Raises:
+            ReaderUnavailable: when the circuit is open.
+        """
+        if self.threshold <= 0:
+            return func(*args, **kwargs)
+        if not self.allow():
+            raise ReaderUnavailable(f"{self.name} reader is unavailable")
+        try:
+            result = func(*args, **kwargs)
+        except ReaderNotSet:
+            # disabled reader: not a backend failure
+            self.success()
+            raise
+        except self.counts as err:
+            self.failure(err)
+            raise
+        except Exception:
+            self.success()
+            raise
+        self.success()
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        """Health of the reader, for diagnostics."""
+        state = self.state
+        retry_in = None
+        if state == OPEN:
+            retry_in = round(
+                max(0.0, self.reset_timeout - (self._clock() - self._opened_at)), 3
+            )
+        return {
+            'state': state,
+            'failures': self._failures,
+            'rejected': self.rejected,
+            'last_error': self._last_error,
+            'retry_in': retry_in,
+        }
+
+
+class GuardedReader:
+    """A reader whose method calls go through a :class:`CircuitBreaker`."""
+
+    def __init__(self, reader: Any, breaker: CircuitBreaker) -> None:
+        self._reader = reader
+        self._breaker = breaker
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._reader, name)
+        if callable(attr):
+            return partial(self._breaker.call, attr)
+        return attr
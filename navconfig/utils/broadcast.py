@@ -0,0 +1,109 @@
+"""
+Cluster-wide invalidation of the values cached by ``Kardex``.
+
+Every ``Kardex.set``/``setext`` that writes to the Redis backend publishes
+the changed keys on a channel of the application and environment::
+
+    navconfig:<PROJECT_NAME>:<ENV>:invalidate
+
+Each instance listens on that channel (a daemon thread on a dedicated
+connection) and evicts those keys from its local caches, so several nodes
+can cache aggressively without serving stale configuration. It is opt-in:
+set ``NAVCONFIG_BROADCAST=true`` on every instance. Messages are
+compact JSON (``{"o": <origin>, "k": [<keys>]}``); ``"k": null`` means
+"everything". An instance ignores its own messages.
+"""
+import json
+import logging
+import uuid
+from typing import Any, Callable, Iterable, List, Optional
+
+
+def channel_name(app: str, env: str) -> str:
+    return f"navconfig:{app}:{env}:invalidate"
+
+
+def encode_message(origin: str, keys: Optional[Iterable[str]]) -> str:
+    return json.dumps(
+        {"o": origin, "k": None if keys is None else list(keys)},
+        separators=(",", ":")
+    )
+
+
+def decode_message(data: Any) -> tuple:
+    """(origin, keys) of a message; keys None means every key."""
+    message = json.loads(data)
+    keys = message.get("k")
+    return message.get("o"), None if keys is None else [str(key) for key in keys]
+
+
+class InvalidationBus:
+    """Publish and receive the invalidations of a channel.
+
+    Args:
+        reader: A reader with ``publish()``/``subscribe()`` (``mredis``).
+        channel: See :func:`channel_name`.
+        evict: Called with the keys to drop (None: drop everything).
+    """
+
+    def __init__(
+        self,
+        reader: Any,
+        channel: str,
+        evict: Callable[[Optional[List[str]]], None]
+    ) -> None:
+        self.reader = reader
+        self.channel = channel
+        self.evict = evict
+        #: identifies the messages of this instance.
+        self.origin = uuid.uuid4().hex[:12]
+        self._listener: Any = None
+        self.published: int = 0
+        self.received: int = 0
+
+    def start(self) -> None:
+        self._listener = self.reader.subscribe(
+            self.channel, self._receive, on_error=self._lost
+        )
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    @property
+    def running(self) -> bool:
+        return self._listener is not None
+
+    def publish(self, keys: Optional[Iterable[str]]) -> None:
+        """Tell the other instances that *keys* changed."""
+        try:
+            self.reader.publish(self.channel, encode_message(self.origin, keys))
+            self.published += 1
+        except Exception as err:  # pylint: disable=W0703
+            logging.warning(
+                f"NavConfig: unable to publish the invalidation of {keys}: {err}"
+            )
+
+    def _receive(self, data: Any) -> None:
+        try:
+            origin, keys = decode_message(data)
+        except (TypeError, ValueError, AttributeError) as err:
+            logging.debug(f"NavConfig: bad invalidation message {data!r}: {err}")
+            return
+        if origin == self.origin:
+            return
+        self.received += 1
+        self.evict(keys)
+
+    def _lost(self, err: Exception) -> None:
+        # messages may have been missed while disconnected
+        self.evict(None)
+
+    def stats(self) -> dict:
+        return {
+            'channel': self.channel,
+            'running': self.running,
+            'published': self.published,
+            'received': self.received,
+        }
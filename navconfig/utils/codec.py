@@ -0,0 +1,212 @@
+"""
+Codec for non-scalar values stored as strings.
+
+Environment variables and cache backends only hold strings, so ``Kardex``
+stores lists, dicts and other containers as tagged JSON::
+
+    NAVCONFIG_JSON:1:{"hosts": ["a", "b"]}
+
+JSON-native values are encoded as-is with orjson; tuples, sets, dates,
+decimals and bytes are wrapped as ``{"__nav__": <type>, "v": <value>}`` so
+they decode back to the same type. Decoding never runs constructors other
+than these built-in types.
+
+Values written by older releases (``NAVCONFIG_JSONDATA:`` + jsonpickle) are
+still read: plain JSON and the ``py/tuple``/``py/set`` tags are restored,
+anything else is returned as the raw string.
+"""
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Dict
+
+#: every encoded value starts with this, so the common (plain string) case
+#: is rejected with a single ``startswith``.
+MARKER = "NAVCONFIG_JSON"
+VERSION = 1
+PREFIX = f"{MARKER}:{VERSION}:"
+LEGACY_PREFIX = "NAVCONFIG_JSONDATA:"
+TAG = "__nav__"
+#: decoded values kept by raw string (the immutable ones only).
+CACHE_SIZE = 512
+
+SCALARS = (str, int, float, bool)
+
+# orjson, base64, datetime and decimal are imported on first use: reading a
+# plain string must not cost an import at startup.
+
+
+def _tagged(kind: str, value: Any) -> dict:
+    return {TAG: kind, "v": value}
+
+
+def _pack(value: Any) -> Any:
+    """Replace the values JSON cannot round-trip by tagged objects."""
+    if value is None or isinstance(value, SCALARS):
+        return value
+    if isinstance(value, dict):
+        return {key: _pack(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_pack(val) for val in value]
+    if isinstance(value, tuple):
+        return _tagged("tuple", [_pack(val) for val in value])
+    if isinstance(value, frozenset):
+        return _tagged("frozenset", [_pack(val) for val in value])
+    if isinstance(value, set):
+        return _tagged("set", [_pack(val) for val in value])
+    return _pack_object(value)
+
+
+def _pack_object(value: Any) -> Any:
+    # pylint: disable=C0415
+    import base64
+    import datetime
+    from decimal import Decimal
+    if isinstance(value, datetime.datetime):
+        return _tagged("datetime", value.isoformat())
+    if isinstance(value, datetime.date):
+        return _tagged("date", value.isoformat())
+    if isinstance(value, datetime.time):
+        return _tagged("time", value.isoformat())
+    if isinstance(value, Decimal):
+        return _tagged("decimal", str(value))
+    if isinstance(value, (bytes, bytearray)):
+        return _tagged("bytes", base64.b64encode(value).decode("ascii"))
+    # anything else is converted by JSONContent.default (lossy)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _unpackers() -> dict:
+    # pylint: disable=C0415
+    import base64
+    import datetime
+    from decimal import Decimal
+    return {
+        "tuple": tuple,
+        "set": set,
+        "frozenset": frozenset,
+        "datetime": datetime.datetime.fromisoformat,
+        "date": datetime.date.fromisoformat,
+        "time": datetime.time.fromisoformat,
+        "decimal": Decimal,
+        "bytes": base64.b64decode,
+    }
+
+
+def _unpack(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_unpack(val) for val in value]
+    if isinstance(value, dict):
+        kind = value.get(TAG)
+        unpackers = _unpackers()
+        if kind in unpackers and len(value) == 2 and "v" in value:
+            return unpackers[kind](_unpack(value["v"]))
+        return {key: _unpack(val) for key, val in value.items()}
+    return value
+
+
+class LegacyValueError(ValueError):
+    """A jsonpickle value that cannot be restored without running code."""
+
+
+def _unpack_legacy(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_unpack_legacy(val) for val in value]
+    if isinstance(value, dict):
+        if "py/tuple" in value:
+            return tuple(_unpack_legacy(val) for val in value["py/tuple"])
+        if "py/set" in value:
+            return set(_unpack_legacy(val) for val in value["py/set"])
+        if any(key.startswith("py/") for key in value):
+            raise LegacyValueError(sorted(value))
+        return {key: _unpack_legacy(val) for key, val in value.items()}
+    return value
+
+
+def is_encoded(value: Any) -> bool:
+    """True when *value* is a string produced by :func:`encode`."""
+    return value.__class__ is str and value.startswith(MARKER)
+
+
+def encode(value: Any) -> Any:
+    """Encode a non-scalar *value*; scalars are returned unchanged.
+
+    Raises:
+        ValueError: when the value cannot be serialized.
+    """
+    if isinstance(value, SCALARS):
+        return value
+    import orjson  # pylint: disable=C0415
+    from .json import JSONContent  # pylint: disable=C0415
+    return PREFIX + JSONContent().encode(
+        _pack(value),
+        option=orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY |
+        orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    )
+
+
+def _immutable(value: Any) -> bool:
+    if isinstance(value, (dict, list, set, bytearray)):
+        return False
+    if isinstance(value, (tuple, frozenset)):
+        return all(_immutable(val) for val in value)
+    return True
+
+
+def _decode(raw: str) -> Any:
+    import orjson  # pylint: disable=C0415
+    if raw.startswith(PREFIX):
+        payload = raw[len(PREFIX):]
+        try:
+            value = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            return raw
+        # only walk the structure when something was tagged
+        return _unpack(value) if TAG in payload else value
+    if raw.startswith(LEGACY_PREFIX):
+        try:
+            return _unpack_legacy(orjson.loads(raw[len(LEGACY_PREFIX):]))
+        except orjson.JSONDecodeError:
+            return raw
+        except LegacyValueError as err:
+            logging.warning(
+                f"NavConfig: unable to decode a legacy value using {err}, "
+                "store it again to migrate it."
+            )
+            return raw
+    return raw
+
+
+_cache: Dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def decode(value: Any) -> Any:
+    """Decode a value produced by :func:`encode` (or the legacy format).
+
+    Anything else, including strings that fail to decode, is returned
+    unchanged. Immutable results (tuples, dates, decimals...) are cached by
+    their raw string; dicts, lists and sets are decoded on every call, so
+    the caller may mutate them without changing what the others read.
+    """
+    if value.__class__ is str and value.startswith(MARKER):
+        try:
+            return _cache[value]
+        except KeyError:
+            pass
+        decoded = _decode(value)
+        if _immutable(decoded):
+            with _cache_lock:
+                if len(_cache) >= CACHE_SIZE:
+                    # the oldest entry goes
+                    del _cache[next(iter(_cache))]
+                _cache[value] = decoded
+        return decoded
+    return value
+
+
+def cache_clear() -> None:
+    """Drop the decode cache."""
+    with _cache_lock:
+        _cache.clear()
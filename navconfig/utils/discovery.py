@@ -0,0 +1,162 @@
+"""
+Cache for the filesystem discovery done on every bootstrap.
+
+Finding the project root and checking ``sys.path`` for conflicting
+``settings`` modules costs a handful of ``stat()`` calls per directory,
+which adds up on network filesystems. Results are cached in process (and,
+when enabled, in a small JSON file), keyed by the inputs (cwd,
+``sys.path``, ...) and validated against the modification time of every
+directory they depend on: adding or removing an entry in a directory
+changes its mtime, so a cached answer is reused only while the directories
+it was computed from are unchanged -- one ``stat()`` per directory instead
+of one per marker.
+
+The file is opt-in, with ``NAVCONFIG_DISCOVERY_CACHE``: ``true`` uses
+``$XDG_CACHE_HOME/navconfig/discovery.json`` (``~/.cache`` by default), any
+other value is the path of the file. Unset (or ``false``) the cache stays
+in process. A file that can't be written is skipped silently.
+"""
+import os
+import json
+import contextlib
+import time
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+#: A ``(path, st_mtime_ns)`` pair; ``None`` records that the path is missing.
+Stamp = Tuple[str, Optional[int]]
+
+CACHE_VERSION = 1
+MAX_ENTRIES = 64
+
+_MISS = object()
+
+
+def stamp(path: Path) -> Stamp:
+    """Record the modification time of *path* (None when it is missing)."""
+    try:
+        return str(path), os.stat(path).st_mtime_ns
+    except OSError:
+        return str(path), None
+
+
+def is_fresh(stamps: List[Stamp]) -> bool:
+    """True when none of the stamped paths changed since they were recorded."""
+    return all(stamp(path) == (path, mtime) for path, mtime in stamps)
+
+
+def default_cache_file() -> Optional[Path]:
+    """Location of the on-disk cache, None when disabled (the default)."""
+    setting = os.getenv("NAVCONFIG_DISCOVERY_CACHE", "")
+    if setting.lower() in ("", "false", "no", "off", "0"):
+        return None
+    if setting.lower() not in ("true", "yes", "on", "1"):
+        return Path(setting).expanduser()
+    try:
+        base = os.getenv("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    except RuntimeError:
+        # no home directory (a service account)
+        return None
+    return Path(base).joinpath("navconfig", "discovery.json")
+
+
+class DiscoveryCache:
+    """In-process and on-disk cache of discovery results.
+
+    Every entry stores a JSON-serializable value and the stamps it was
+    computed from; a stale entry is recomputed and replaced.
+    """
+
+    def __init__(self, filename: Optional[Path] = None) -> None:
+        self.filename = filename
+        self._entries: Optional[Dict[str, dict]] = None
+        #: last lookup of every discovery: duration (ms) and cache level.
+        self.timings: Dict[str, Dict[str, Any]] = {}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            if self.filename is not None:
+                try:
+                    data = json.loads(self.filename.read_text(encoding="utf-8"))
+                    if data.get("version") == CACHE_VERSION:
+                        self._entries = data["entries"]
+                except (OSError, ValueError, KeyError, AttributeError):
+                    pass
+        return self._entries
+
+    def _save(self) -> None:
+        if self.filename is None:
+            return
+        entries = self._load()
+        while len(entries) > MAX_ENTRIES:
+            entries.pop(next(iter(entries)))
+        tmpfile = self.filename.with_name(
+            f"{self.filename.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+            tmpfile.write_text(
+                json.dumps({"version": CACHE_VERSION, "entries": entries}),
+                encoding="utf-8"
+            )
+            os.replace(tmpfile, self.filename)
+        except OSError as err:
+            # read-only home, container...: in process from now on
+            logging.debug(f"NavConfig: unable to write {self.filename}: {err}")
+            with contextlib.suppress(OSError):
+                tmpfile.unlink()
+            self.filename = None
+
+    def lookup(
+        self,
+        name: str,
+        key: tuple,
+        compute: Callable[[], Tuple[Any, List[Stamp]]]
+    ) -> Any:
+        """Return the cached result for *key*, computing it when stale.
+
+        Args:
+            name: Discovery being cached (used for the timings).
+            key: JSON-serializable inputs of the discovery.
+            compute: Returns the result and the stamps it depends on.
+        """
+        started = time.perf_counter()
+        entry_key = json.dumps([name, *key])
+        from_memory = self._entries is not None
+        entry = self._load().get(entry_key, _MISS)
+        if entry is not _MISS and is_fresh(entry["stamps"]):
+            level = "memory" if from_memory else "disk"
+            value = entry["value"]
+        else:
+            level = None
+            value, stamps = compute()
+            self._entries[entry_key] = {"value": value, "stamps": stamps}
+            self._save()
+        self.timings[name] = {
+            "ms": round((time.perf_counter() - started) * 1000, 3),
+            "cached": level,
+        }
+        return value
+
+    def clear(self) -> None:
+        self._entries = {}
+        self.timings.clear()
+        self._save()
+
+
+_cache: Optional[DiscoveryCache] = None
+
+
+def discovery_cache() -> DiscoveryCache:
+    """Return the process-wide discovery cache."""
+    global _cache  # pylint: disable=W0603
+    if _cache is None:
+        _cache = DiscoveryCache(default_cache_file())
+    return _cache
+
+
+def discovery_timings() -> Dict[str, Dict[str, Any]]:
+    """Duration and cache level of the last run of every discovery."""
+    return dict(_cache.timings) if _cache is not None else {}
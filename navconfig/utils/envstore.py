@@ -0,0 +1,186 @@
+"""
+Compact storage of the cached environments.
+
+``Kardex`` keeps the environments it loaded besides the current one
+(``get_with_env()``, ``set_env()``, the background preloader). dev,
+staging and prod mostly define the same keys, often with the same values,
+yet each one came from its own parse: full dicts of distinct strings.
+
+:class:`EnvStore` keeps one *base* mapping, the most common value of the
+keys most environments define, and per environment only what differs from
+it (an overlay of changed or added keys, and the base keys it lacks). Keys
+are interned and equal values stored once, so the memory of N environments
+grows with their differences instead of N times their size.
+"""
+import sys
+import threading
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, Dict, FrozenSet, Iterator, Optional
+
+
+class EnvView(Mapping):
+    """Read-only values of one environment: the base and its overlay."""
+
+    __slots__ = ("_base", "_changed", "_removed", "_size")
+
+    def __init__(
+        self, base: Dict[str, Any], changed: Dict[str, Any], removed: FrozenSet[str]
+    ) -> None:
+        self._base = base
+        self._changed = changed
+        self._removed = removed
+        self._size = len(base) - len(removed) + sum(
+            1 for key in changed if key not in base
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._changed:
+            return self._changed[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._changed or (
+            key in self._base and key not in self._removed
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._changed:
+            return self._changed[key]
+        if key in self._removed:
+            return default
+        return self._base.get(key, default)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._base:
+            if key not in self._removed and key not in self._changed:
+                yield key
+        yield from self._changed
+
+    def __len__(self) -> int:
+        return self._size
+
+    def copy(self) -> Dict[str, Any]:
+        """A mutable dict of the values (sharing the stored objects)."""
+        values = dict(self._base)
+        for key in self._removed:
+            del values[key]
+        values.update(self._changed)
+        return values
+
+    def __repr__(self) -> str:
+        return f"EnvView({self.copy()!r})"
+
+
+class EnvStore:
+    """Environment name -> values, stored as overlays on a shared base.
+
+    Behaves like the dict it replaces: ``store[env] = values``,
+    ``store[env]`` (an :class:`EnvView`), ``in``, ``get``, ``pop``,
+    ``keys`` and ``clear``. The base is rebuilt when an environment is
+    stored or removed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._views: Dict[str, EnvView] = {}
+        self._base: Dict[str, Any] = {}
+
+    @staticmethod
+    def _intern(values: Mapping, pool: Dict[Any, Any]) -> Dict[str, Any]:
+        interned = {}
+        for key, value in values.items():
+            if isinstance(key, str):
+                key = sys.intern(key)
+            try:
+                # by type too: 1, 1.0 and True are equal
+                value = pool.setdefault((type(value), value), value)
+            except TypeError:
+                # unhashable (a dict from Vault): kept as is
+                pass
+            interned[key] = value
+        return interned
+
+    def _materialize(self) -> Dict[str, Dict[str, Any]]:
+        return {env: view.copy() for env, view in self._views.items()}
+
+    def _rebuild(self, envs: Dict[str, Mapping]) -> None:
+        # only the views are kept: full dicts exist during the rebuild
+        pool: Dict[Any, Any] = {}
+        envs = {
+            env: self._intern(values, pool) for env, values in envs.items()
+        }
+        quorum = len(envs) / 2
+        counts: Dict[str, Counter] = {}
+        for values in envs.values():
+            for key, value in values.items():
+                try:
+                    counts.setdefault(key, Counter())[(type(value), value)] += 1
+                except TypeError:
+                    continue
+        base = {}
+        for key, values in counts.items():
+            (_, value), times = values.most_common(1)[0]
+            if times > quorum or len(envs) == 1:
+                base[key] = value
+        views = {}
+        for env, values in envs.items():
+            changed = {
+                key: value for key, value in values.items()
+                if key not in base or base[key] is not value
+            }
+            removed = frozenset(key for key in base if key not in values)
+            views[env] = EnvView(base, changed, removed)
+        self._base = base
+        self._views = views
+
+    def __setitem__(self, env: str, values: Mapping) -> None:
+        with self._lock:
+            envs = self._materialize()
+            envs[env] = values
+            self._rebuild(envs)
+
+    def __getitem__(self, env: str) -> EnvView:
+        return self._views[env]
+
+    def __contains__(self, env: object) -> bool:
+        return env in self._views
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._views))
+
+    def get(self, env: str, default: Any = None) -> Optional[EnvView]:
+        return self._views.get(env, default)
+
+    def keys(self):
+        return list(self._views)
+
+    def pop(self, env: str, default: Any = None) -> Any:
+        with self._lock:
+            if env not in self._views:
+                return default
+            view = self._views[env]
+            envs = self._materialize()
+            del envs[env]
+            self._rebuild(envs)
+            return view
+
+    def clear(self) -> None:
+        with self._lock:
+            self._views = {}
+            self._base = {}
+
+    def stats(self) -> Dict[str, int]:
+        views = list(self._views.values())
+        return {
+            'envs': len(views),
+            # pylint: disable=W0212
+            'base_keys': len(self._base),
+            'overlay_keys': sum(len(view._changed) for view in views),
+            'removed_keys': sum(len(view._removed) for view in views),
+        }
@@ -0,0 +1,67 @@
+"""
+Cache of parsed configuration files, shared by several ``Kardex``.
+
+``KardexRegistry`` builds one ``Kardex`` per project; projects sharing an
+``etc/config.ini`` or a ``pyproject.toml`` (or a project rebuilt after its
+eviction) read the file once: the INI text, the parsed ``pyproject.toml``.
+An entry is reused while the file keeps its modification time and size,
+and every caller gets its own copy.
+"""
+import copy
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+def read_text(path: Path) -> str:
+    """Text of a file, decoded like ``ConfigParser.read()`` does."""
+    with open(path, encoding=None) as fp:  # pylint: disable=W1514
+        return fp.read()
+
+
+class FileCache:
+    """Parsed files, keyed by path and validated by ``(mtime, size)``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[tuple, Any]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def load(self, path, parse: Callable[..., Any], *tag: Hashable) -> Any:
+        """Result of ``parse(path)``, parsed again when the file changed.
+
+        Args:
+            path: File the result comes from.
+            parse: Parses it.
+            tag: Also part of the key, when the parsing depends on more
+                than the file (the project name of a ``pyproject.toml``).
+        """
+        path = Path(path)
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (str(path), *tag)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+        self.misses += 1
+        value = parse(path)
+        with self._lock:
+            self._entries[key] = (stamp, value)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            'files': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
@@ -0,0 +1,96 @@
+"""
+Request coalescing ("single flight") for the external readers.
+
+When many threads or tasks miss the same key at the same moment (a cold
+start, a cache expiry), only the first one calls the backend; the others
+wait for that call and share its result (or its exception).
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters: int = 0
+
+
+class SingleFlight:
+    """Share one in-flight call among concurrent identical requests.
+
+    Usage:
+        flight = SingleFlight()
+        value = flight.do(("redis", key), reader.get, key)
+        value = await flight.do_async(("redis", key), reader.get, key)
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[tuple, Any] = {}
+        #: calls answered by another caller's request.
+        self.shared: int = 0
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """Call ``func(*args, **kwargs)`` unless the same *key* is in flight."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, func: Callable, *args, **kwargs) -> Any:
+        """Asyncio version of :meth:`do` for blocking *func*.
+
+        Tasks of the same loop await one shared task; that task runs *func*
+        on the default executor through :meth:`do`, so it is also coalesced
+        with the threads asking for the same key.
+        """
+        import asyncio  # pylint: disable=C0415
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None:
+            task = loop.create_task(
+                asyncio.to_thread(self.do, key, func, *args, **kwargs)
+            )
+            self._tasks[task_key] = task
+            task.add_done_callback(
+                lambda _: self._tasks.pop(task_key, None)
+            )
+        else:
+            self.shared += 1
+        # a cancelled waiter must not cancel the others
+        return await asyncio.shield(task)
+
+    def after_fork(self) -> None:
+        """In a forked child: the calls in flight belong to the parent."""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+
+    def __len__(self) -> int:
+        """Number of calls in flight."""
+        return len(self._calls)
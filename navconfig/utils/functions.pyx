@@ -2,13 +2,11 @@
 # Copyright (C) 2018-present Jesus Lara
 #
 import time
-import orjson
 from collections.abc import Sequence
 from decimal import Decimal
 from datetime import timezone
 from cpython cimport datetime
-from zoneinfo import ZoneInfo
-from dateutil.parser import parse, ParserError
+# zoneinfo and dateutil are imported on first use (import-time budget).
 
 
 cpdef object strtobool(object val):
@@ -38,10 +36,12 @@ cpdef datetime.date to_date(object value, str mask = "%Y-%m-%d %H:%M:%S", str tz
         try:
             result = datetime.datetime.strptime(str(value), mask)
             if tz is not None:
+                from zoneinfo import ZoneInfo
                 zone = ZoneInfo(key=tz)
                 result = result.replace(tzinfo=zone)
             return result
         except (TypeError, ValueError, AttributeError):
+            from dateutil.parser import parse
             return parse(str(value))
 
 
@@ -89,6 +89,7 @@ cpdef datetime.datetime epoch_to_date(object value, str tz = None):
     else:
         s, _ = divmod(value, 1000.0)
     if tz is not None:
+        from zoneinfo import ZoneInfo
         zone = ZoneInfo(key=tz)
     else:
         zone = timezone.utc
@@ -111,6 +112,7 @@ cpdef object is_date(object value):
         if isinstance(value, (datetime.datetime, time, datetime.time, datetime.timedelta)):
             return True
         else:
+            from dateutil.parser import parse, ParserError
             try:
                 val = parse(value)
                 if val:
@@ -0,0 +1,255 @@
+"""
+``${NAME}`` interpolation across every configuration source.
+
+python-dotenv expands references one file at a time, so a value in
+``.env.databases`` cannot use a Vault secret, and INI or ``pyproject.toml``
+values are never expanded. :class:`Interpolator` compiles every value that
+contains a reference once, keeps the dependency graph between keys, and
+renders them in topological order; lookups then read plain strings.
+
+The syntax is the one of python-dotenv: ``${NAME}`` and
+``${NAME:-default}``. A reference resolves to the (expanded) value of
+another key, else to the process environment, else to the default (or an
+empty string). A key that references itself (``PATH=${PATH}:/opt/bin``)
+reads the environment from before the load. Reference cycles raise
+:class:`~navconfig.exceptions.ConfigError`.
+"""
+import re
+import logging
+from collections.abc import Hashable, Iterable, Mapping
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from ..exceptions import ConfigError
+
+# same grammar as python-dotenv
+REFERENCE = re.compile(
+    r"\$\{(?P<name>[^\}:]*)(?::-(?P<default>[^\}]*))?\}"
+)
+
+_MISSING = object()
+
+
+class Template:
+    """A value split into literal text and references, compiled once."""
+
+    __slots__ = ("parts", "names")
+
+    def __init__(self, value: str) -> None:
+        parts: List[Tuple[str, Optional[str], Optional[str]]] = []
+        position = 0
+        for match in REFERENCE.finditer(value):
+            parts.append(
+                (value[position:match.start()], match["name"], match["default"])
+            )
+            position = match.end()
+        if position < len(value):
+            parts.append((value[position:], None, None))
+        self.parts = tuple(parts)
+        self.names = frozenset(name for _, name, _ in parts if name is not None)
+
+    def render(
+        self,
+        lookup: Callable[[str], Optional[str]],
+        escape: Callable[[str], str] = None
+    ) -> str:
+        result = []
+        for literal, name, default in self.parts:
+            result.append(literal)
+            if name is None:
+                continue
+            value = lookup(name)
+            if value is None:
+                value = default or ""
+            result.append(escape(value) if escape else value)
+        return "".join(result)
+
+
+def compile_template(value: Any) -> Optional[Template]:
+    """Compile *value*, None when it is not a string with references."""
+    if value.__class__ is not str or "${" not in value:
+        return None
+    template = Template(value)
+    return template if template.names else None
+
+
+class Interpolator:
+    """Dependency graph of the references between configuration keys.
+
+    Keys are usually variable names; any hashable works (the INI options
+    are ``(section, option)`` tuples), but only string keys can be
+    referenced. Call :meth:`update` with the raw values that changed: only
+    the templates that depend on them are rendered again.
+    """
+
+    def __init__(
+        self,
+        outer: Mapping = None,
+        environ: Mapping = None,
+        resolve: Callable[[str, Any], Any] = None
+    ) -> None:
+        #: environment seen by self-references (before the load).
+        self.outer: Mapping = {} if outer is None else outer
+        #: fallback for names that are not configuration keys.
+        self.environ: Optional[Mapping] = environ
+        #: called with (name, value) of every key a template uses.
+        self.resolve = resolve
+        self._escapes: Dict[Hashable, Callable[[str], str]] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._templates: Dict[Hashable, Template] = {}
+        self._dependents: Dict[str, Set[Hashable]] = {}
+        self._expanded: Dict[Hashable, str] = {}
+        #: number of templates rendered so far.
+        self.rendered: int = 0
+
+    @property
+    def expanded(self) -> Dict[Hashable, str]:
+        """Rendered value of every key with references."""
+        return self._expanded
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def _unlink(self, key: Hashable) -> None:
+        template = self._templates.pop(key, None)
+        self._expanded.pop(key, None)
+        self._escapes.pop(key, None)
+        if template is not None:
+            for name in template.names:
+                self._dependents.get(name, set()).discard(key)
+
+    def _link(self, key: Hashable, value: Any, escape: Callable) -> None:
+        self._values[key] = value
+        if (template := compile_template(value)) is not None:
+            self._templates[key] = template
+            if escape is not None:
+                self._escapes[key] = escape
+            for name in template.names:
+                self._dependents.setdefault(name, set()).add(key)
+
+    def _affected(self, changed: Iterable[Hashable]) -> Set[Hashable]:
+        """Changed templates plus everything that (transitively) uses them."""
+        affected: Set[Hashable] = set()
+        pending = list(changed)
+        while pending:
+            key = pending.pop()
+            if key in self._templates and key not in affected:
+                affected.add(key)
+            for dependent in self._dependents.get(key, ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        return affected
+
+    def _order(self, keys: Set[Hashable]) -> List[Hashable]:
+        """Topological order of *keys*: references before their users."""
+        order: List[Hashable] = []
+        state: Dict[Hashable, int] = {}  # 1: visiting, 2: done
+        for root in keys:
+            if root in state:
+                continue
+            path = [root]
+            stack = [(root, iter(self._templates[root].names))]
+            state[root] = 1
+            while stack:
+                key, names = stack[-1]
+                for name in names:
+                    if name == key or name not in keys:
+                        continue
+                    if state.get(name) == 1:
+                        cycle = path[path.index(name):] + [name]
+                        raise ConfigError(
+                            "NavConfig: circular reference between "
+                            f"{' -> '.join(map(str, cycle))}"
+                        )
+                    if name not in state:
+                        state[name] = 1
+                        path.append(name)
+                        stack.append((name, iter(self._templates[name].names)))
+                        break
+                else:
+                    stack.pop()
+                    path.pop()
+                    state[key] = 2
+                    order.append(key)
+        return order
+
+    def _lookup(self, key: Hashable) -> Callable[[str], Optional[str]]:
+        def lookup(name: str) -> Optional[str]:
+            if name == key:
+                return self.outer.get(name)
+            value = self._expanded.get(name, _MISSING)
+            if value is _MISSING:
+                value = self._values.get(name, _MISSING)
+                if value is not _MISSING and self.resolve is not None:
+                    value = self.resolve(name, value)
+            if value is _MISSING or value is None:
+                if self.environ is None:
+                    return None
+                value = self.environ.get(name)
+                if value is None:
+                    logging.debug(f"NavConfig: unresolved reference ${{{name}}}")
+                    return None
+            return value if isinstance(value, str) else str(value)
+        return lookup
+
+    def update(
+        self,
+        changes: Mapping,
+        removed: Iterable[Hashable] = (),
+        escape: Callable[[str], str] = None
+    ) -> Dict[Hashable, str]:
+        """Apply changed raw values and render the templates they affect.
+
+        Args:
+            changes: Raw value of the keys added or modified.
+            removed: Keys that no longer exist.
+            escape: Applied to the values substituted into *changes*
+                (e.g. ``%`` for ConfigParser values).
+
+        Returns:
+            The keys rendered again, with their new value.
+
+        Raises:
+            ConfigError: when the references form a cycle.
+        """
+        changed = []
+        for key, value in changes.items():
+            if key in self._values and self._values[key] == value:
+                continue
+            self._unlink(key)
+            self._link(key, value, escape)
+            changed.append(key)
+        for key in removed:
+            if key in self._values:
+                self._unlink(key)
+                del self._values[key]
+                changed.append(key)
+        return self.refresh(changed)
+
+    def refresh(self, keys: Iterable[Hashable]) -> Dict[Hashable, str]:
+        """Render again the templates that depend on *keys*.
+
+        For values that changed outside of the graph (e.g. a secret that
+        could not be fetched during the first render).
+        """
+        rendered = {}
+        for key in self._order(self._affected(keys)):
+            rendered[key] = self._expanded[key] = self._templates[key].render(
+                self._lookup(key), self._escapes.get(key)
+            )
+        self.rendered += len(rendered)
+        return rendered
+
+    def keys(self) -> Set[Hashable]:
+        """Every key known to the graph."""
+        return set(self._values)
+
+    def raw(self, key: Hashable, default: Any = None) -> Any:
+        """Raw (unexpanded) value of *key*."""
+        return self._values.get(key, default)
+
+
+def expand_values(values: Mapping, environ: Mapping = None) -> Dict[str, Any]:
+    """Return a copy of *values* with every reference expanded."""
+    interpolator = Interpolator(outer=environ or {}, environ=environ)
+    interpolator.update(values)
+    return {**values, **interpolator.expanded}
@@ -0,0 +1,115 @@
+"""
+Access manifest: which keys a service reads, and from where.
+
+When ``NAVCONFIG_MANIFEST`` points to a file, ``Kardex`` records the first
+access to every key together with the source that answered it (``mapping``,
+``environ``, ``ini``, ``redis`` or ``vault``) and saves the manifest at
+exit. On the next startup the keys that came from an external reader are
+prefetched in one batch per reader, so the first requests do not pay a
+network lookup each. The manifest also tells which Vault secrets are loaded
+but never read.
+
+Manifests are merged across runs: a key recorded once stays listed.
+"""
+import os
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+MANIFEST_VERSION = 1
+
+SOURCES = ("mapping", "environ", "ini", "redis", "vault")
+
+
+def manifest_file() -> Optional[Path]:
+    """Manifest location (``NAVCONFIG_MANIFEST``), None when disabled."""
+    if filename := os.getenv("NAVCONFIG_MANIFEST"):
+        return Path(filename).expanduser()
+    return None
+
+
+class AccessRecorder:
+    """Record the configuration keys read by the process."""
+
+    def __init__(self, filename: Path, env: str = None) -> None:
+        self.filename = filename
+        self.env = env
+        self._accessed: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._previous = self._read()
+
+    def _read(self) -> Dict[str, List[str]]:
+        try:
+            data = json.loads(self.filename.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        if self.env is not None and data.get("env") not in (None, self.env):
+            # recorded for another environment
+            return {}
+        return {
+            source: list(keys)
+            for source, keys in data.get("sources", {}).items()
+            if source in SOURCES
+        }
+
+    def record(self, key: str, source: str) -> None:
+        """Register the first access to *key* (INI keys: ``section.option``)."""
+        if key not in self._accessed:
+            self._accessed[key] = source
+
+    @property
+    def accessed(self) -> Dict[str, str]:
+        return dict(self._accessed)
+
+    def keys(self, source: str) -> List[str]:
+        """Keys the previous runs read from *source*."""
+        return self._previous.get(source, [])
+
+    def unused(self, keys: Iterable[str]) -> List[str]:
+        """The *keys* that were never read (by this or previous runs)."""
+        read = set(self._accessed)
+        for recorded in self._previous.values():
+            read.update(recorded)
+        return sorted(key for key in keys if key not in read)
+
+    def save(self) -> None:
+        """Merge the accesses of this run into the manifest file."""
+        with self._lock:
+            sources: Dict[str, set] = {
+                source: set(keys) for source, keys in self._read().items()
+            }
+            for key, source in self._accessed.items():
+                sources.setdefault(source, set()).add(key)
+            data = {
+                "version": MANIFEST_VERSION,
+                "env": self.env,
+                "sources": {
+                    source: sorted(keys) for source, keys in sources.items()
+                },
+            }
+            tmpfile = self.filename.with_name(
+                f"{self.filename.name}.{os.getpid()}.tmp"
+            )
+            try:
+                self.filename.parent.mkdir(parents=True, exist_ok=True)
+                tmpfile.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                os.replace(tmpfile, self.filename)
+            except OSError as err:
+                logging.warning(
+                    f"NavConfig: unable to write the manifest {self.filename}: {err}"
+                )
+
+
+def prefetch(reader: Any, keys: List[str]) -> Dict[str, Any]:
+    """Read *keys* from *reader*: one batch when the reader supports it."""
+    if not keys:
+        return {}
+    if get_many := getattr(reader, "get_many", None):
+        values = get_many(keys)
+    else:
+        values = {key: reader.get(key) for key in keys}
+    return {key: value for key, value in values.items() if value is not None}
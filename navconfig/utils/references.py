@@ -0,0 +1,151 @@
+"""
+Lazy references to secrets kept in Vault or Redis.
+
+A configuration value can point to a secret instead of holding it::
+
+    STRIPE_KEY=vault:payments/stripe#api_key
+    DB_PASSWORD=vault:db_password          # key under VAULT_ENV
+    FEATURE_X=redis:feature/x
+
+The reference is kept as-is at load time and fetched on first access. Vault
+secrets are read once per path (every key of ``payments/stripe`` comes from
+the same read) and cached, like the Redis values; threads that miss the
+same path at once share that read.
+
+Values that look like ``host:port`` (``redis:6379``) or URLs
+(``redis://localhost``) are not references.
+"""
+import re
+import logging
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Optional
+from . import codec
+from ..exceptions import ReaderError
+from .flight import SingleFlight
+
+SCHEMES = ("vault:", "redis:")
+
+REFERENCE = re.compile(
+    r"^(?P<scheme>vault|redis):(?!//)(?P<target>[^\s#:]+)(?:#(?P<key>[^\s#:]+))?$"
+)
+
+
+class SecretUnavailable(LookupError):
+    """The backend of a secret can't be reached right now."""
+
+
+class SecretRef(NamedTuple):
+    """A parsed ``vault:`` or ``redis:`` reference."""
+    scheme: str
+    path: Optional[str]
+    key: str
+    raw: str
+
+
+def parse_reference(value: Any) -> Optional[SecretRef]:
+    """Parse *value*, None when it is not a secret reference."""
+    if value.__class__ is not str or not value.startswith(SCHEMES):
+        return None
+    if (match := REFERENCE.match(value)) is None:
+        return None
+    scheme, target, key = match.group("scheme", "target", "key")
+    if target.isdigit():
+        # host:port
+        return None
+    if scheme == "redis":
+        return None if key else SecretRef(scheme, None, target, value)
+    if key is None:
+        path, _, key = target.rpartition("/")
+    else:
+        path = target
+    return SecretRef(scheme, path or None, key, value)
+
+
+class SecretResolver:
+    """Fetch and cache the secrets behind the references.
+
+    Args:
+        reader: returns the reader for a scheme (``"vault"``/``"redis"``),
+            None when that backend is not available.
+    """
+
+    def __init__(self, reader: Callable[[str], Any]) -> None:
+        self._reader = reader
+        self._paths: Dict[Optional[str], dict] = {}
+        self._values: Dict[str, Any] = {}
+        self._flight = SingleFlight()
+        #: round trips made to the backends.
+        self.reads: int = 0
+
+    def _vault_path(self, path: Optional[str]) -> dict:
+        if (data := self._paths.get(path)) is not None:
+            return data
+        return self._flight.do(("vault", path), self._read_vault_path, path)
+
+    def _read_vault_path(self, path: Optional[str]) -> dict:
+        if (data := self._paths.get(path)) is not None:
+            # read by a call that just finished
+            return data
+        if (reader := self._reader("vault")) is None:
+            raise LookupError("Vault reader is not available")
+        self.reads += 1
+        try:
+            data = reader.get(f"{path}/*" if path else "*")
+        except ReaderError as err:
+            raise SecretUnavailable(str(err)) from err
+        if not isinstance(data, dict):
+            raise LookupError(f"Vault path {path!r} can't be read")
+        self._paths[path] = data
+        return data
+
+    def _redis_value(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        return self._flight.do(("redis", key), self._read_redis_value, key)
+
+    def _read_redis_value(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if (reader := self._reader("redis")) is None:
+            raise LookupError("Redis reader is not available")
+        self.reads += 1
+        try:
+            value = reader.get(key)
+        except ReaderError as err:
+            raise SecretUnavailable(str(err)) from err
+        if value is None:
+            raise LookupError(f"Redis key {key!r} doesn't exist")
+        value = self._values[key] = codec.decode(value)
+        return value
+
+    def resolve(self, ref: SecretRef) -> Any:
+        """Return the secret behind *ref*.
+
+        Raises:
+            SecretUnavailable: when the backend can't be reached.
+            LookupError: when the backend or the secret is not available.
+        """
+        if ref.scheme == "redis":
+            return self._redis_value(ref.key)
+        data = self._vault_path(ref.path)
+        if ref.key not in data:
+            raise LookupError(
+                f"Vault path {ref.path or '(VAULT_ENV)'!r} has no key {ref.key!r}"
+            )
+        return data[ref.key]
+
+    def after_fork(self) -> None:
+        self._flight.after_fork()
+
+    def forget(self, keys: Optional[Iterable[str]] = None) -> None:
+        """Forget the cached Redis values of *keys* (all when None)."""
+        if keys is None:
+            self._values.clear()
+            return
+        for key in keys:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget the cached secrets (they are read again on next access)."""
+        self._paths.clear()
+        self._values.clear()
+        logging.debug("NavConfig: secret references cache cleared")
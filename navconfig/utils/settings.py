@@ -1,5 +1,7 @@
+import os
 import sys
 from pathlib import Path
+from .discovery import discovery_cache, stamp
 
 
 def ensure_settings_priority(settings_dir: Path) -> bool:
@@ -33,20 +35,17 @@ def ensure_settings_priority(settings_dir: Path) -> bool:
 
     return True
 
-def check_settings_conflicts(settings_dir: Path) -> tuple:
-    """Check for conflicts with other settings modules in sys.path.
-
-    Args:
-        settings_dir (Path): Path to the project's settings directory.
+def _scan_settings_conflicts(settings_dir: Path) -> tuple:
+    """Scan ``sys.path`` for other settings modules.
 
-    Returns:
-        tuple: (has_conflict, conflicting_path)
+    Returns ``(has_conflict, conflicting_path)`` and the stamps of every
+    directory inspected: a ``settings`` package or ``settings.py`` file can
+    only appear or disappear by changing one of them.
     """
-    # Check if there are other settings modules in sys.path that might conflict
-    settings_dir = settings_dir.resolve()  # Resolve to absolute path
-
+    stamps = []
     for path in sys.path:
         path_obj = Path(path).resolve()  # Resolve to absolute path
+        stamps.append(stamp(path_obj))
 
         # Skip if this is the project's settings directory we just added
         if path_obj == settings_dir:
@@ -54,16 +53,42 @@ def check_settings_conflicts(settings_dir: Path) -> tuple:
 
         # Check for a settings package in this path
         if path_obj.name == "settings" and path_obj.is_dir() and (path_obj / "__init__.py").exists():
-            return True, str(path_obj)
+            return (True, str(path_obj)), stamps
 
         # Check for settings package as a subdirectory
         settings_subdir = path_obj / "settings"
+        if settings_subdir.exists():
+            stamps.append(stamp(settings_subdir))
         if settings_subdir.exists() and settings_subdir != settings_dir and settings_subdir.is_dir() and (settings_subdir / "__init__.py").exists():
-            return True, str(settings_subdir)
+            return (True, str(settings_subdir)), stamps
 
         # Check for settings.py file directly in the path
         settings_file = path_obj / "settings.py"
         if settings_file.exists() and settings_file.parent != settings_dir:
-            return True, str(settings_file)
+            return (True, str(settings_file)), stamps
+
+    return (False, None), stamps
+
 
-    return False, None
+def check_settings_conflicts(settings_dir: Path) -> tuple:
+    """Check for conflicts with other settings modules in sys.path.
+
+    The answer is cached (see :mod:`navconfig.utils.discovery`) for the
+    current ``sys.path`` until one of the directories inspected changes.
+
+    Args:
+        settings_dir (Path): Path to the project's settings directory.
+
+    Returns:
+        tuple: (has_conflict, conflicting_path)
+    """
+    def compute():
+        # Resolve to absolute path
+        return _scan_settings_conflicts(settings_dir.resolve())
+
+    has_conflict, conflict_path = discovery_cache().lookup(
+        "settings_conflicts",
+        (str(settings_dir), os.getcwd(), list(sys.path)),
+        compute
+    )
+    return has_conflict, conflict_path
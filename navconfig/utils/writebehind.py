@@ -0,0 +1,201 @@
+"""
+Write-behind queue for the writes ``Kardex`` sends to Redis or Vault.
+
+``put()`` returns at once; a daemon thread drains the queue and hands the
+writes to the backend in batches (the writes queued meanwhile, the last
+value of a key wins), grouped by backend and TTL so each group is a single
+``set_many()`` call: one Redis pipeline, one Vault patch per secret path.
+
+The queue is bounded: when the backend can't keep up, ``put()`` blocks
+until there is room again. :meth:`WriteBehind.close` (also run at exit)
+writes everything still queued before returning.
+
+A batch the backend rejects is retried (``retries`` times, with an
+exponential backoff); the writes still failing are kept and reported by the
+next :meth:`WriteBehind.flush` or :meth:`WriteBehind.close`, which raise
+:class:`~navconfig.exceptions.ReaderError` naming them.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from ..exceptions import ReaderError
+
+_STOP = object()
+
+
+class WriteBehind:
+    """Queue writes and flush them in batches from a background thread.
+
+    Args:
+        write: Called as ``write(backend, values, timeout)`` for each batch;
+            *values* maps keys to their new value.
+        max_size: Writes queued at most before ``put()`` blocks.
+        batch_size: Writes flushed at most per batch.
+        retries: Retries of a failed batch before its writes are given up.
+        backoff: Seconds before the first retry (doubled on each one).
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str, Dict[str, Any], Optional[int]], None],
+        max_size: int = 10000,
+        batch_size: int = 500,
+        retries: int = 3,
+        backoff: float = 0.5
+    ) -> None:
+        self.write = write
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        # writes given up: (backend, key) -> error, until flush() reports them
+        self._failures: Dict[tuple, Exception] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.queued: int = 0
+        self.written: int = 0
+        self.batches: int = 0
+        self.failed: int = 0
+
+    def put(self, backend: str, key: str, value: Any, timeout: int = None) -> None:
+        """Queue the write of *key* to *backend*."""
+        if self._thread is None:
+            self._start()
+        self._queue.put((backend, key, value, timeout))
+        self.queued += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="navconfig-write-behind", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self._close_at_exit)
+
+    def _run(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            while len(items) < self.batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in items)
+            try:
+                self._flush([item for item in items if item is not _STOP])
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _flush(self, items: list) -> None:
+        latest: Dict[tuple, tuple] = {}
+        for backend, key, value, timeout in items:
+            # the last write of a key wins (and moves to the end)
+            latest.pop((backend, key), None)
+            latest[(backend, key)] = (value, timeout)
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for (backend, key), (value, timeout) in latest.items():
+            groups.setdefault((backend, timeout), {})[key] = value
+        for (backend, timeout), values in groups.items():
+            error = self._write(backend, values, timeout)
+            with self._lock:
+                for key in values:
+                    if error is None:
+                        self._failures.pop((backend, key), None)
+                    else:
+                        self._failures[(backend, key)] = error
+            if error is None:
+                self.written += len(values)
+                self.batches += 1
+            else:
+                self.failed += len(values)
+                logging.error(
+                    f"NavConfig: unable to write {list(values)} to {backend}: {error}"
+                )
+
+    def _write(
+        self, backend: str, values: Dict[str, Any], timeout: Optional[int]
+    ) -> Optional[Exception]:
+        """Write a batch, retrying it; the last error if it never succeeded."""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                self.write(backend, values, timeout)
+                return None
+            except Exception as err:  # pylint: disable=W0703
+                error = err
+        return error
+
+    def _raise_failures(self) -> None:
+        with self._lock:
+            failures, self._failures = self._failures, {}
+        if failures:
+            keys = sorted(f"{backend}:{key}" for backend, key in failures)
+            raise ReaderError(
+                f"NavConfig: writes lost after {self.retries} retries: "
+                f"{', '.join(keys)} ({list(failures.values())[-1]})"
+            )
+
+    def flush(self) -> None:
+        """Wait until every queued write reached its backend.
+
+        Raises ReaderError for the writes given up since the last call.
+        """
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_failures()
+
+    def close(self) -> None:
+        """Write what is still queued and stop the thread.
+
+        Raises ReaderError, like :meth:`flush`, for the writes given up.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+            atexit.unregister(self._close_at_exit)
+        self._raise_failures()
+
+    def _close_at_exit(self) -> None:
+        # the writes given up were already logged
+        try:
+            self.close()
+        except ReaderError:
+            pass
+
+    def after_fork(self) -> None:
+        """In a forked child: the worker is gone and the queue is the parent's.
+
+        The writes queued by the parent are written by the parent.
+        """
+        self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._lock = threading.Lock()
+        self._failures = {}
+        if self._thread is not None:
+            self._thread = None
+            atexit.unregister(self._close_at_exit)
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def stats(self) -> dict:
+        return {
+            'running': self._thread is not None,
+            'pending': self.pending,
+            'queued': self.queued,
+            'written': self.written,
+            'batches': self.batches,
+            'failed': self.failed,
+        }
@@ -0,0 +1,193 @@
+"""Tests for the circuit breaker in front of the external readers."""
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import requests
+
+import navconfig.kardex
+from navconfig.exceptions import ReaderUnavailable
+from navconfig.kardex import Kardex
+from navconfig.readers.vault import VaultReader
+from navconfig.utils.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def failing():
+    raise ConnectionError("refused")
+
+
+def test_breaker_opens_after_consecutive_failures():
+    clock = Clock()
+    breaker = CircuitBreaker("redis", failures=3, reset_timeout=10, clock=clock)
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+    assert breaker.state == OPEN
+    calls = []
+    with pytest.raises(ReaderUnavailable):
+        breaker.call(calls.append, 1)
+    assert calls == []
+    status = breaker.status()
+    assert status["rejected"] == 1
+    assert status["retry_in"] == 10
+    assert status["last_error"] == "ConnectionError: refused"
+
+
+def test_successes_reset_the_failure_count():
+    breaker = CircuitBreaker("redis", failures=2, reset_timeout=10)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_lets_a_single_probe_through():
+    clock = Clock()
+    breaker = CircuitBreaker("vault", failures=1, reset_timeout=10, clock=clock)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+
+    clock.now += 10
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow() is True
+    # the probe is still running: everybody else fails fast
+    assert breaker.allow() is False
+    breaker.failure(ConnectionError("still down"))
+    assert breaker.state == OPEN
+
+    clock.now += 10
+    assert breaker.call(lambda: "back") == "back"
+    assert breaker.state == CLOSED
+    assert breaker.status()["failures"] == 0
+
+
+def test_only_the_counted_errors_open_the_circuit():
+    breaker = CircuitBreaker(
+        "redis", failures=1, reset_timeout=10, counts=(ReaderUnavailable,)
+    )
+
+    def wrong_type():
+        raise ValueError("WRONGTYPE Operation against a key")
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            breaker.call(wrong_type)
+    assert breaker.state == CLOSED
+
+    def unreachable():
+        raise ReaderUnavailable("Redis is unavailable")
+
+    with pytest.raises(ReaderUnavailable):
+        breaker.call(unreachable)
+    assert breaker.state == OPEN
+
+
+def test_zero_threshold_disables_the_breaker():
+    breaker = CircuitBreaker("redis", failures=0)
+    for _ in range(10):
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+    assert breaker.allow() is True
+
+
+def test_vault_reader_reports_an_unreachable_server():
+    def unreachable(**kwargs):
+        raise requests.exceptions.ConnectTimeout("timed out")
+
+    reader = object.__new__(VaultReader)
+    reader.enabled = True
+    reader.version = 2
+    reader._mount = "navigator"
+    reader._env = "dev"
+    reader.client = SimpleNamespace(secrets=SimpleNamespace(kv=SimpleNamespace(
+        v2=SimpleNamespace(read_secret_version=unreachable)
+    )))
+    for call in (reader.get, reader.exists, lambda key: reader.get_many([key])):
+        with pytest.raises(ReaderUnavailable):
+            call("A")
+
+
+class DownRedis:
+    """A cache reader whose server went away."""
+
+    calls: int = 0
+    down: bool = False
+
+    def __init__(self, *args, **kwargs):
+        self.enabled = True
+        DownRedis.calls = 0
+        DownRedis.down = False
+
+    def exists(self, key):
+        DownRedis.calls += 1
+        if DownRedis.down:
+            raise ReaderUnavailable("Redis is unavailable: timed out")
+        return key == "REMOTE"
+
+    def get(self, key, default=None):
+        return "remote value"
+
+    def close(self):
+        pass
+
+
+def build_kardex(root, monkeypatch) -> Kardex:
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text("DEBUG=true\nLOCAL=1\n", encoding="utf-8")
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text("", encoding="utf-8")
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_BREAKER_FAILURES", "2")
+    monkeypatch.setenv("NAVCONFIG_BREAKER_RESET", "60")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: DownRedis if name == "redis" else None
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=root, env="dev")
+    return cfg
+
+
+def test_kardex_fails_over_to_local_sources(tmp_path, monkeypatch):
+    cfg = build_kardex(tmp_path, monkeypatch)
+    assert cfg.get("REMOTE") == "remote value"
+
+    DownRedis.down = True
+    DownRedis.calls = 0
+    for _ in range(5):
+        assert cfg.get("REMOTE", fallback="local default") == "local default"
+        assert cfg.get("LOCAL") == "1"
+    # the cache is asked once per key (not once per alias) until the
+    # circuit opens, then not at all
+    assert DownRedis.calls == 2
+    health = cfg.get_env_info()["readers"]
+    assert list(health) == ["cache"]
+    assert health["cache"]["state"] == OPEN
+    assert health["cache"]["rejected"] == 3
+
+    DownRedis.down = False
+    cfg._breakers["cache"].reset_timeout = 0
+    assert cfg.get("REMOTE") == "remote value"
+    assert cfg.get_readers_health()["cache"]["state"] == CLOSED
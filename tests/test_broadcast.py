@@ -0,0 +1,143 @@
+"""Tests for the cluster-wide invalidation of Kardex caches."""
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.kardex import Kardex
+from navconfig.utils.broadcast import (
+    InvalidationBus, channel_name, decode_message, encode_message
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class SharedRedis:
+    """Cache reader over a store and pub/sub shared by every instance."""
+
+    store: dict = {}
+    subscribers: dict = {}
+    forgotten: list = []
+
+    def __init__(self, *args, **kwargs):
+        self.enabled = True
+
+    def exists(self, key):
+        return key in self.store
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.store[key] = value
+        return True
+
+    def forget(self, keys):
+        SharedRedis.forgotten.append(keys)
+
+    def publish(self, channel, message):
+        for handler in list(self.subscribers.get(channel, ())):
+            handler(message)
+        return len(self.subscribers.get(channel, ()))
+
+    def subscribe(self, channel, handler, on_error=None):
+        handlers = self.subscribers.setdefault(channel, [])
+        handlers.append(handler)
+        return SimpleNamespace(stop=lambda: handlers.remove(handler))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    SharedRedis.store = {"feature/x": "on"}
+    SharedRedis.subscribers = {}
+    SharedRedis.forgotten = []
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "true")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: SharedRedis if name == "redis" else None
+    )
+    return SharedRedis
+
+
+def make_node(root) -> Kardex:
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=root, env="dev")
+    return cfg
+
+
+def make_project(root):
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text(
+        "DEBUG=true\nFEATURE=redis:feature/x\n", encoding="utf-8"
+    )
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text("", encoding="utf-8")
+
+
+def test_message_format():
+    assert channel_name("billing", "prod") == "navconfig:billing:prod:invalidate"
+    message = encode_message("abc", ["A", "B"])
+    assert message == '{"o":"abc","k":["A","B"]}'
+    assert decode_message(message) == ("abc", ["A", "B"])
+    assert decode_message(encode_message("abc", None)) == ("abc", None)
+
+
+def test_bus_ignores_its_own_messages_and_bad_payloads(shared_redis):
+    evicted = []
+    reader = SharedRedis()
+    first = InvalidationBus(reader, "channel", evicted.append)
+    second = InvalidationBus(reader, "channel", evicted.append)
+    first.start()
+    second.start()
+
+    first.publish(["A"])
+    assert evicted == [["A"]]  # only the second bus evicted
+    reader.publish("channel", "not json")
+    assert evicted == [["A"]]
+    assert second.stats()["received"] == 1
+    first.stop()
+    second.stop()
+    assert shared_redis.subscribers["channel"] == []
+
+
+def test_set_on_one_node_refreshes_the_others(tmp_path, shared_redis):
+    make_project(tmp_path)
+    node_a = make_node(tmp_path)
+    node_b = make_node(tmp_path)
+    assert node_b.get("FEATURE") == "on"
+    assert node_b.get_env_info()["broadcast"]["channel"] == (
+        "navconfig:navconfig:dev:invalidate"
+    )
+
+    node_a.set("feature/x", "off")
+
+    assert shared_redis.forgotten[-1] == ["feature/x"]
+    assert node_b.get("FEATURE") == "off"
+    assert os.environ["FEATURE"] == "off"
+    assert node_b.get_env_info()["broadcast"]["received"] == 1
+
+    node_b.close()
+    node_a.setext("feature/x", "on", timeout=60)
+    assert node_b.get_env_info()["broadcast"] is None
+
+
+def test_broadcast_is_off_by_default(tmp_path, shared_redis, monkeypatch):
+    monkeypatch.delenv("NAVCONFIG_BROADCAST")
+    make_project(tmp_path)
+    node = make_node(tmp_path)
+    assert node.get_env_info()["broadcast"] is None
+    assert shared_redis.subscribers == {}
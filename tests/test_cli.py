@@ -7,12 +7,19 @@ require ``env/`` to exist already.
 import subprocess
 import sys
 from configparser import ConfigParser
+from types import SimpleNamespace
 
+import hvac
 import pytest
 
 from navconfig.cli import main
-from navconfig.commands.common import SPLIT_ENV_FILES, VAULT_BLOCK_START
+from navconfig.commands.common import (
+    SPLIT_ENV_FILES,
+    VAULT_BLOCK_START,
+    CommandError,
+)
 from navconfig.commands.vault import (
+    VaultWriter,
     _parse_pair,
     collect_migratable,
     is_vault_variable,
@@ -256,6 +263,23 @@ def test_vault_save_requires_token(tmp_path, capsys):
     assert "VAULT_TOKEN is not set" in capsys.readouterr().err
 
 
+def test_vault_writer_hints_at_an_unmounted_engine():
+    def no_route(*args, **kwargs):
+        raise hvac.exceptions.InvalidPath("no handler for route 'secrets/data/dev'")
+
+    writer = object.__new__(VaultWriter)
+    writer.mount_point, writer.version, writer.path = "secrets", 2, "dev"
+    kv2 = SimpleNamespace(
+        read_secret_version=no_route, create_or_update_secret=no_route
+    )
+    writer.client = SimpleNamespace(
+        adapter=SimpleNamespace(request=no_route),
+        secrets=SimpleNamespace(kv=SimpleNamespace(v2=kv2)),
+    )
+    with pytest.raises(CommandError, match="enable -path=secrets -version=2 kv"):
+        writer.set_many({"KEY": "value"})
+
+
 # ---------------------------------------------------------------------------
 # kardex log
 # ---------------------------------------------------------------------------
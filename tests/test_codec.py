@@ -0,0 +1,77 @@
+"""Tests for the tagged JSON codec used by ``Kardex`` for non-scalar values."""
+import datetime
+import os
+from decimal import Decimal
+
+import pytest
+
+from navconfig.utils import codec
+
+
+@pytest.fixture(autouse=True)
+def empty_decode_cache():
+    codec.cache_clear()
+    yield
+    codec.cache_clear()
+
+
+@pytest.mark.parametrize("value", ["plain", 42, 1.5, True])
+def test_scalars_are_not_encoded(value):
+    assert codec.encode(value) is value
+
+
+@pytest.mark.parametrize("value", [
+    {"hosts": ["a", "b"], "port": 5432, "debug": False},
+    ["a", 1, None],
+    (1, 2, (3, 4)),
+    {"ids": {1, 2, 3}, "frozen": frozenset({"x"})},
+    {"when": datetime.datetime(2024, 5, 1, 12, 30), "day": datetime.date(2024, 5, 1)},
+    [Decimal("1.10"), b"\x00binary"],
+    None,
+])
+def test_round_trip(value):
+    raw = codec.encode(value)
+    assert raw.startswith(codec.PREFIX)
+    assert codec.decode(raw) == value
+
+
+def test_only_immutable_values_are_cached():
+    raw = codec.encode((1, datetime.date(2024, 5, 1)))
+    first = codec.decode(raw)
+    assert codec.decode(raw) is first
+
+    raw = codec.encode({"a": [1, 2]})
+    first = codec.decode(raw)
+    first["a"].append(3)
+    assert codec.decode(raw) == {"a": [1, 2]}
+
+
+def test_plain_and_invalid_strings_are_returned_unchanged():
+    assert codec.decode("NAVCONFIG") == "NAVCONFIG"
+    assert codec.decode(f"{codec.PREFIX}{{not json") == f"{codec.PREFIX}{{not json"
+    assert codec.decode(None) is None
+    assert codec.decode(10) == 10
+
+
+def test_legacy_jsonpickle_values_are_read():
+    assert codec.decode('NAVCONFIG_JSONDATA:{"a": [1, 2]}') == {"a": [1, 2]}
+    assert codec.decode(
+        'NAVCONFIG_JSONDATA:{"py/tuple": [1, {"py/set": [2]}]}'
+    ) == (1, {2})
+
+
+def test_legacy_objects_are_not_constructed():
+    raw = 'NAVCONFIG_JSONDATA:{"py/object": "os.system", "py/newargs": ["id"]}'
+    assert codec.decode(raw) == raw
+
+
+def test_kardex_stores_containers_in_the_environment(tmp_path, monkeypatch):
+    from navconfig.kardex import Kardex
+
+    monkeypatch.setenv("KARDEX_CODEC", "placeholder")
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=tmp_path, env="dev", lazy=True)
+    cfg["KARDEX_CODEC"] = {"hosts": ("a", "b")}
+
+    assert os.environ["KARDEX_CODEC"].startswith(codec.PREFIX)
+    assert cfg.get("KARDEX_CODEC") == {"hosts": ("a", "b")}
@@ -0,0 +1,116 @@
+"""Tests for the cached project-root and settings-conflict discovery."""
+import os
+import sys
+
+import pytest
+
+from navconfig.project import find_project_root
+from navconfig.utils import discovery
+from navconfig.utils.discovery import DiscoveryCache
+from navconfig.utils.settings import check_settings_conflicts
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    """Give every test its own cache file and a fresh process cache."""
+    filename = tmp_path / "cache" / "discovery.json"
+    monkeypatch.setenv("NAVCONFIG_DISCOVERY_CACHE", str(filename))
+    monkeypatch.setattr(discovery, "_cache", None)
+    return filename
+
+
+def bump_mtime(path):
+    """Make sure a directory change is visible on coarse-mtime filesystems."""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_project_root_is_cached(tmp_path):
+    root = tmp_path / "project"
+    (root / "app" / "module").mkdir(parents=True)
+    (root / "pyproject.toml").write_text("", encoding="utf-8")
+    base_file = str(root / "app" / "module" / "main.py")
+
+    assert find_project_root(base_file) == root
+    assert discovery.discovery_timings()["project_root"]["cached"] is None
+    assert find_project_root(base_file) == root
+    assert discovery.discovery_timings()["project_root"]["cached"] == "memory"
+
+
+def test_project_root_is_invalidated_by_a_closer_marker(tmp_path):
+    root = tmp_path / "project"
+    app = root / "app"
+    app.mkdir(parents=True)
+    (root / "pyproject.toml").write_text("", encoding="utf-8")
+    base_file = str(app / "main.py")
+    assert find_project_root(base_file) == root
+
+    (app / ".env").write_text("", encoding="utf-8")
+    bump_mtime(app)
+
+    assert find_project_root(base_file) == app
+    assert discovery.discovery_timings()["project_root"]["cached"] is None
+
+
+def test_project_root_is_read_back_from_disk(tmp_path, cache_file):
+    root = tmp_path / "project"
+    root.mkdir()
+    (root / "setup.py").write_text("", encoding="utf-8")
+    base_file = str(root / "main.py")
+    find_project_root(base_file)
+    assert cache_file.exists()
+
+    # a new process starts with an empty in-memory cache
+    discovery._cache = DiscoveryCache(cache_file)
+    assert find_project_root(base_file) == root
+    assert discovery.discovery_timings()["project_root"]["cached"] == "disk"
+
+
+def test_disk_cache_can_be_disabled(tmp_path, monkeypatch, cache_file):
+    monkeypatch.setenv("NAVCONFIG_DISCOVERY_CACHE", "false")
+    (tmp_path / ".git").mkdir()
+    assert find_project_root(str(tmp_path / "main.py")) == tmp_path
+    assert not cache_file.exists()
+
+
+def test_disk_cache_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("NAVCONFIG_DISCOVERY_CACHE")
+    assert discovery.default_cache_file() is None
+    monkeypatch.setenv("NAVCONFIG_DISCOVERY_CACHE", "true")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert discovery.default_cache_file() == (
+        tmp_path / "xdg" / "navconfig" / "discovery.json"
+    )
+
+
+def test_unwritable_cache_file_is_skipped(tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv(
+        "NAVCONFIG_DISCOVERY_CACHE", str(blocker / "discovery.json")
+    )
+    (tmp_path / ".git").mkdir()
+    assert find_project_root(str(tmp_path / "main.py")) == tmp_path
+    assert discovery.discovery_cache().filename is None
+    assert find_project_root(str(tmp_path / "main.py")) == tmp_path
+    assert discovery.discovery_timings()["project_root"]["cached"] == "memory"
+
+
+def test_settings_conflicts_are_cached_and_invalidated(tmp_path, monkeypatch):
+    project_settings = tmp_path / "project" / "settings"
+    project_settings.mkdir(parents=True)
+    other = tmp_path / "other"
+    other.mkdir()
+    monkeypatch.setattr(sys, "path", [str(project_settings), str(other)])
+
+    assert check_settings_conflicts(project_settings) == (False, None)
+    assert check_settings_conflicts(project_settings) == (False, None)
+    timing = discovery.discovery_timings()["settings_conflicts"]
+    assert timing["cached"] == "memory"
+
+    (other / "settings.py").write_text("", encoding="utf-8")
+    bump_mtime(other)
+
+    assert check_settings_conflicts(project_settings) == (
+        True, str(other / "settings.py")
+    )
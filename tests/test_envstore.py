@@ -0,0 +1,59 @@
+"""Tests for the structurally shared storage of the cached environments."""
+from navconfig.utils.envstore import EnvStore
+
+
+def parsed(values: dict) -> dict:
+    # distinct objects for equal strings, as separate parses produce
+    return {
+        "".join(list(key)): "".join(list(value)) if isinstance(value, str) else value
+        for key, value in values.items()
+    }
+
+
+def test_environments_read_back_unchanged():
+    dev = {"DB_HOST": "localhost", "DEBUG": "true", "WORKERS": 2}
+    prod = {"DB_HOST": "db.internal", "DEBUG": "true", "SENTRY": "on"}
+    store = EnvStore()
+    store["dev"] = parsed(dev)
+    store["prod"] = parsed(prod)
+
+    assert dict(store["dev"]) == dev
+    assert store["prod"].copy() == prod
+    assert store["prod"].get("WORKERS", 4) == 4
+    assert "SENTRY" not in store["dev"] and "SENTRY" in store["prod"]
+    assert len(store["dev"]) == 3
+    assert sorted(store.keys()) == ["dev", "prod"]
+
+    values = store["dev"].copy()
+    values["DEBUG"] = "false"
+    assert store["dev"]["DEBUG"] == "true"
+
+
+def test_equal_values_are_stored_once():
+    common = {f"KEY_{n}": f"value-{n}" for n in range(50)}
+    store = EnvStore()
+    for env, db in (("dev", "dev-db"), ("staging", "stg-db"), ("prod", "prod-db")):
+        store[env] = parsed({**common, "DB": db})
+
+    assert store["dev"]["KEY_7"] is store["prod"]["KEY_7"]
+    assert store.stats() == {
+        'envs': 3, 'base_keys': 50, 'overlay_keys': 3, 'removed_keys': 0
+    }
+    # 1 and True are equal, but not interchangeable
+    store["flags"] = {"KEY_1": True}
+    store["count"] = {"KEY_1": 1}
+    assert store["flags"]["KEY_1"] is True
+    assert store["count"]["KEY_1"] == 1 and store["count"]["KEY_1"] is not True
+
+
+def test_removing_an_environment_rebuilds_the_base():
+    store = EnvStore()
+    store["dev"] = {"A": "1", "B": "dev"}
+    store["prod"] = {"A": "1", "B": "prod", "C": "x"}
+    store["staging"] = {"A": "2", "B": "prod"}
+    assert store.pop("dev")["B"] == "dev"
+    assert store.pop("dev", None) is None
+    assert dict(store["prod"]) == {"A": "1", "B": "prod", "C": "x"}
+    assert dict(store["staging"]) == {"A": "2", "B": "prod"}
+    store.clear()
+    assert len(store) == 0 and "prod" not in store
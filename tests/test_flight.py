@@ -0,0 +1,185 @@
+"""Tests for the single-flight coalescing of the external reader calls."""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.kardex import Kardex
+from navconfig.utils.flight import SingleFlight
+from navconfig.utils.references import SecretResolver, parse_reference
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class SlowRedis:
+    """A reader whose round trips take a while, counting them."""
+
+    calls: list = []
+
+    def __init__(self, *args, **kwargs):
+        self.enabled = True
+        SlowRedis.calls = []
+
+    def exists(self, key):
+        SlowRedis.calls.append(("exists", key))
+        time.sleep(0.05)
+        return key.startswith("REMOTE")
+
+    def get(self, key, default=None):
+        SlowRedis.calls.append(("get", key))
+        return f"value of {key}"
+
+    def close(self):
+        pass
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "value"
+
+    with ThreadPoolExecutor(8) as pool:
+        leader = pool.submit(flight.do, "key", fetch)
+        started.wait(2)
+        waiters = [pool.submit(flight.do, "key", fetch) for _ in range(7)]
+        while flight.shared < 7:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [waiter.result() for waiter in waiters]
+
+    assert results == ["value"] * 8
+    assert calls == [1]
+    assert len(flight) == 0
+    # once finished, the next call runs again
+    release.set()
+    assert flight.do("key", fetch) == "value"
+    assert len(calls) == 2
+
+
+def test_waiters_receive_the_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(2)
+        raise ConnectionError("down")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flight.do, "key", fail)
+        started.wait(2)
+        waiter = pool.submit(flight.do, "key", fail)
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, waiter):
+            with pytest.raises(ConnectionError):
+                future.result()
+    assert len(flight) == 0
+
+
+def test_async_tasks_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return key.upper()
+
+    async def main():
+        return await asyncio.gather(
+            *(flight.do_async("key", fetch, "key") for _ in range(10)),
+            flight.do_async("other", fetch, "other"),
+        )
+
+    results = asyncio.run(main())
+    assert results == ["KEY"] * 10 + ["OTHER"]
+    assert sorted(calls) == ["key", "other"]
+    assert flight.shared == 9
+
+
+def test_secret_resolver_reads_a_path_once_under_concurrency():
+    reads = []
+
+    class Vault:
+        def get(self, key):
+            reads.append(key)
+            time.sleep(0.05)
+            return {"api_key": "sk", "pub": "pk"}
+
+    reader = Vault()
+    resolver = SecretResolver(lambda scheme: reader)
+    refs = [
+        parse_reference("vault:payments/stripe#api_key"),
+        parse_reference("vault:payments/stripe#pub"),
+    ] * 8
+    with ThreadPoolExecutor(16) as pool:
+        values = list(pool.map(resolver.resolve, refs))
+
+    assert values == ["sk", "pk"] * 8
+    assert reads == ["payments/stripe/*"]
+    assert resolver.reads == 1
+
+
+def build_kardex(root, monkeypatch) -> Kardex:
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text("DEBUG=true\n", encoding="utf-8")
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text("", encoding="utf-8")
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: SlowRedis if name == "redis" else None
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=root, env="dev")
+    SlowRedis.calls = []
+    return cfg
+
+
+def test_kardex_coalesces_concurrent_misses(tmp_path, monkeypatch):
+    cfg = build_kardex(tmp_path, monkeypatch)
+
+    with ThreadPoolExecutor(10) as pool:
+        values = list(pool.map(cfg.get, ["REMOTE_KEY"] * 10))
+
+    assert values == ["value of REMOTE_KEY"] * 10
+    assert SlowRedis.calls == [("exists", "REMOTE_KEY"), ("get", "REMOTE_KEY")]
+    assert cfg.get_bootstrap_info()["coalesced"] == 9
+
+
+def test_kardex_get_async(tmp_path, monkeypatch):
+    cfg = build_kardex(tmp_path, monkeypatch)
+
+    async def main():
+        return await asyncio.gather(
+            *(cfg.get_async("REMOTE_KEY") for _ in range(10)),
+            cfg.get_async("MISSING", fallback="default"),
+            cfg.get_async("DEBUG"),
+        )
+
+    values = asyncio.run(main())
+    assert values == ["value of REMOTE_KEY"] * 10 + ["default", "true"]
+    assert SlowRedis.calls.count(("exists", "REMOTE_KEY")) == 1
@@ -0,0 +1,112 @@
+"""Tests for the reinitialization of Kardex in forked children."""
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+import redis
+import requests
+from redis.connection import AbstractConnection
+
+import navconfig.kardex
+from navconfig.kardex import Kardex
+from navconfig.readers.redis import mredis
+from navconfig.readers.vault import VaultReader
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class ForkRedis:
+    store = {"feature/x": "on"}
+
+    def __init__(self, *args, **kwargs):
+        self.enabled = True
+        self.forks = 0
+
+    def exists(self, key):
+        return key in self.store
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def subscribe(self, channel, handler, on_error=None):
+        return SimpleNamespace(stop=lambda: None)
+
+    def after_fork(self):
+        self.forks += 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def kardex(tmp_path, monkeypatch):
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "true")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: ForkRedis if name == "redis" else None
+    )
+    env_dir = tmp_path / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text("DEBUG=true\n", encoding="utf-8")
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "config.ini").write_text("", encoding="utf-8")
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    return cfg
+
+
+def test_after_fork_rebuilds_readers_and_listener(kardex):
+    bus = kardex._broadcast
+    kardex.after_fork()
+    # "cache" and its "redis" alias are the same reader
+    assert kardex._readers["cache"].forks == 1
+    assert kardex._broadcast is not bus
+    assert kardex._broadcast.running
+    assert kardex.getboolean("DEBUG") is True
+    assert kardex.get("feature/x") == "on"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork()")
+def test_forked_child_is_reinitialized(kardex):
+    reader = kardex._readers["cache"]
+    pid = os.fork()
+    if pid == 0:  # child
+        os._exit(0 if reader.forks == 1 else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert reader.forks == 0  # not in the parent
+
+
+def test_redis_reader_drops_the_parent_connections(monkeypatch):
+    monkeypatch.setenv("REDIS_NEAR_CACHE", "0")
+    monkeypatch.setattr(redis.Redis, "ping", lambda self: True)
+    monkeypatch.setattr(AbstractConnection, "connect", lambda self: None)
+    monkeypatch.setattr(AbstractConnection, "can_read", lambda self, timeout=0: False)
+    reader = mredis()
+    pool = reader._redis.connection_pool
+    pool.release(pool.get_connection("GET"))
+    assert reader.pool_stats()["created"] == 1
+
+    reader.after_fork()  # same process: nothing to do
+    assert reader.pool_stats()["created"] == 1
+    reader._pid = 0
+    reader.after_fork()
+    assert reader.pool_stats()["created"] == 0
+
+
+def test_vault_reader_uses_a_new_session():
+    reader = object.__new__(VaultReader)
+    session = requests.Session()
+    session.verify = "/etc/ssl/vault.pem"
+    reader.client = SimpleNamespace(adapter=SimpleNamespace(session=session))
+    reader.after_fork()
+    assert reader.client.adapter.session is not session
+    assert reader.client.adapter.session.verify == "/etc/ssl/vault.pem"
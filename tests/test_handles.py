@@ -0,0 +1,122 @@
+"""Tests for the bound configuration handles."""
+import gc
+import os
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.exceptions import ConfigError
+from navconfig.kardex import Kardex
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.delenv("POOL_SIZE", raising=False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+@pytest.fixture
+def kardex(tmp_path):
+    for env, size in (("dev", "10"), ("prod", "50")):
+        env_dir = tmp_path / "env" / env
+        env_dir.mkdir(parents=True)
+        (env_dir / ".env").write_text(
+            f"POOL_SIZE={size}\nDEBUG=false\n", encoding="utf-8"
+        )
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "config.ini").write_text(
+        "[pool]\ntimeout = 2.5\n", encoding="utf-8"
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    return cfg
+
+
+def test_handle_value_follows_set(kardex):
+    size = kardex.handle("POOL_SIZE", type=int, default=5)
+    missing = kardex.handle("WORKERS", type=int, default=4)
+    timeout = kardex.handle("timeout", type=float, section="pool")
+    assert size.value == 10
+    assert missing.value == 4
+    assert timeout.value == 2.5
+
+    kardex.set("POOL_SIZE", "20")
+    assert size.value == 20
+    kardex.set_many({"WORKERS": "8"})
+    assert missing.value == 8
+    # an invalidation received from another node
+    kardex._mapping_["POOL_SIZE"] = "30"
+    kardex._evict(["POOL_SIZE"])
+    assert size.value == 30
+    assert size.updates == 3
+
+
+def test_handles_are_refreshed_on_reload(kardex, caplog):
+    size = kardex.handle("POOL_SIZE", type=int)
+    debug = kardex.handle("DEBUG", type=bool)
+    kardex._mapping_ = {"POOL_SIZE": "50", "DEBUG": "true"}
+    kardex._keys_changed(None)
+    assert (size.value, debug.value) == (50, True)
+
+    # an invalid value keeps the last good one
+    kardex.set("POOL_SIZE", "lots")
+    assert size.value == 50
+    assert "POOL_SIZE keeps 50" in caplog.text
+
+
+def test_invalid_value_and_collected_handles(kardex):
+    kardex.set("POOL_SIZE", "lots")
+    with pytest.raises(ConfigError, match="Invalid value for POOL_SIZE"):
+        kardex.handle("POOL_SIZE", type=int)
+
+    handle = kardex.handle("DEBUG", type=bool)
+    assert handle.value is False
+    del handle
+    gc.collect()
+    kardex.set("DEBUG", "true")
+    assert "DEBUG" not in kardex._handles
+
+
+class FakeCache:
+    def __init__(self, env=None):
+        self.enabled = True
+        self.values = {}
+
+    def exists(self, key):
+        return key in self.values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.values[key] = value
+        return True
+
+    def set_many(self, values, timeout=None):
+        self.values.update(values)
+        return True
+
+    def close(self):
+        pass
+
+
+def test_cache_writes_refresh_the_handle_once(kardex, monkeypatch):
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "false")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: FakeCache if name == "redis" else None
+    )
+    kardex._init_external_readers()
+    workers = kardex.handle("WORKERS", type=int, default=4)
+    assert workers.updates == 1
+    kardex.set("WORKERS", "8")
+    assert workers.value == 8 and workers.updates == 2
+    kardex.set_many({"WORKERS": "9"})
+    assert workers.value == 9 and workers.updates == 3
+    kardex.setext("WORKERS", "10", timeout=60)
+    assert workers.value == 10 and workers.updates == 4
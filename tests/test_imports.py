@@ -0,0 +1,75 @@
+"""Import-time regression tests.
+
+``import navconfig`` is paid by every ``kardex`` invocation, so the optional
+backends and heavy dependencies must only be imported once they are
+configured or first used.
+"""
+import os
+import subprocess
+import sys
+
+#: Upper bound (ms) for the cumulative import time of the ``navconfig``
+#: package, as reported by ``python -X importtime``.
+IMPORT_BUDGET_MS = float(os.getenv("NAVCONFIG_IMPORT_BUDGET_MS", "100"))
+
+#: Modules that ``import navconfig`` must not pull in.
+LAZY_MODULES = (
+    "asyncio",
+    "redis",
+    "hvac",
+    "requests",
+    "urllib3",
+    "jsonpickle",
+    "dotenv",
+    "uvloop",
+    "aiofiles",
+    "pytomlpp",
+    "yaml",
+    "dateutil",
+    "navconfig.loaders",
+    "navconfig.readers",
+)
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_optional_backends():
+    code = (
+        "import sys, navconfig; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    loaded = run_python("-c", code).stdout.strip()
+    assert loaded == "", f"imported eagerly: {loaded}"
+
+
+def test_import_time_budget():
+    # best of three, to absorb a cold filesystem cache
+    timings = []
+    for _ in range(3):
+        result = run_python("-X", "importtime", "-c", "import navconfig")
+        for line in result.stderr.splitlines():
+            # import time: self [us] | cumulative | imported package
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == "navconfig":
+                timings.append(int(fields[1]) / 1000)
+    assert timings, "navconfig missing from the -X importtime report"
+    assert min(timings) < IMPORT_BUDGET_MS, (
+        f"import navconfig took {min(timings):.1f} ms "
+        f"(budget: {IMPORT_BUDGET_MS} ms)"
+    )
+
+
+def test_reader_classes_resolve_on_first_use():
+    code = (
+        "import sys, navconfig.kardex as k; "
+        "assert 'navconfig.readers.redis' not in sys.modules; "
+        "print(k.REDIS_LOADER.__name__)"
+    )
+    assert run_python("-c", code).stdout.strip() == "mredis"
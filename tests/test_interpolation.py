@@ -0,0 +1,157 @@
+"""Tests for the ``${VAR}`` interpolation engine and its use by Kardex."""
+import os
+from unittest import mock
+
+import pytest
+
+from navconfig.exceptions import ConfigError
+from navconfig.kardex import Kardex
+from navconfig.utils.interpolation import Interpolator, expand_values
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+def make_project(root, env_files: dict, config_ini: str = "", pyproject: str = ""):
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    for name, content in env_files.items():
+        (env_dir / name).write_text(content, encoding="utf-8")
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text(config_ini, encoding="utf-8")
+    (root / "pyproject.toml").write_text(pyproject, encoding="utf-8")
+
+
+def build_kardex(root) -> Kardex:
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=root, env="dev")
+    return cfg
+
+
+# ---------------------------------------------------------------------------
+# Engine
+# ---------------------------------------------------------------------------
+
+def test_references_are_expanded_in_dependency_order():
+    values = expand_values({
+        "DB_URL": "postgres://${DB_USER}@${DB_HOST}:${DB_PORT:-5432}",
+        "DB_USER": "${APP}_user",
+        "APP": "kardex",
+        "DB_HOST": "db",
+    })
+    assert values["DB_URL"] == "postgres://kardex_user@db:5432"
+
+
+def test_unknown_references_fall_back_to_the_environment():
+    values = expand_values(
+        {"HOME_DIR": "${HOME}/app", "EMPTY": "[${MISSING}]"},
+        environ={"HOME": "/home/kardex"},
+    )
+    assert values == {"HOME_DIR": "/home/kardex/app", "EMPTY": "[]"}
+
+
+def test_self_reference_reads_the_outer_environment():
+    interpolator = Interpolator(outer={"PATH": "/bin"})
+    assert interpolator.update({"PATH": "${PATH}:/opt/bin"}) == {
+        "PATH": "/bin:/opt/bin"
+    }
+
+
+def test_cycles_are_reported():
+    with pytest.raises(ConfigError, match="circular reference"):
+        expand_values({"A": "${B}", "B": "${C}", "C": "${A}"})
+
+
+def test_only_dependents_of_changed_keys_are_rendered():
+    interpolator = Interpolator()
+    interpolator.update({
+        "HOST": "db", "URL": "pg://${HOST}", "OTHER": "${NAME}", "NAME": "x",
+    })
+    assert interpolator.update({"HOST": "replica", "NAME": "x"}) == {
+        "URL": "pg://replica"
+    }
+    assert interpolator.update({}, removed=["HOST"]) == {"URL": "pg://"}
+
+
+# ---------------------------------------------------------------------------
+# Kardex
+# ---------------------------------------------------------------------------
+
+def test_references_cross_every_source(tmp_path):
+    make_project(
+        tmp_path,
+        {
+            ".env": "DB_HOST=db\nCONFIG_FILE=etc/config.ini\n",
+            ".env.databases": "DB_URL=postgres://${DB_USER}@${DB_HOST}\n",
+        },
+        config_ini="[db]\ndsn = ${DB_URL}/app?ssl=100%%\n",
+        pyproject='[navconfig]\nDB_USER = "toml_user"\nLABEL = "${DB_HOST}-label"\n',
+    )
+    cfg = build_kardex(tmp_path)
+
+    assert cfg.get("DB_URL") == "postgres://toml_user@db"
+    assert os.environ["DB_URL"] == "postgres://toml_user@db"
+    assert cfg.get("LABEL") == "db-label"
+    assert cfg.get("dsn", section="db") == "postgres://toml_user@db/app?ssl=100%"
+    info = cfg.get_bootstrap_info()["interpolation"]
+    assert info["templates"] == 3
+
+
+def test_set_re_expands_dependents(tmp_path):
+    make_project(tmp_path, {
+        ".env": "DB_HOST=db\nDB_URL=pg://${DB_HOST}\nAPP=app\nNAME=${APP}\n"
+    })
+    cfg = build_kardex(tmp_path)
+    assert cfg.get("DB_URL") == "pg://db"
+
+    with mock.patch.object(
+        cfg, "_write_expansions", wraps=cfg._write_expansions
+    ) as written:
+        cfg.set("DB_HOST", "replica")
+
+    assert cfg.get("DB_URL") == "pg://replica"
+    # only the dependents of the key set are written back
+    assert [list(call.args[0]) for call in written.call_args_list] == [["DB_URL"]]
+
+
+def test_reload_renders_only_changed_references(tmp_path):
+    make_project(
+        tmp_path, {".env": "A=1\nB=2\nUSE_A=${A}\nUSE_B=${B}\n"}
+    )
+    cfg = build_kardex(tmp_path)
+    rendered = cfg._interpolation.rendered
+
+    (tmp_path / "env" / "dev" / ".env").write_text(
+        "A=10\nB=2\nUSE_A=${A}\nUSE_B=${B}\n", encoding="utf-8"
+    )
+    cfg.configure("dev", override=True)
+
+    assert cfg.get("USE_A") == "10"
+    assert cfg.get("USE_B") == "2"
+    assert cfg._interpolation.rendered - rendered == 1
+
+
+def test_circular_references_fail_the_bootstrap(tmp_path):
+    make_project(tmp_path, {".env": "A=${B}\nB=${A}\n"})
+    with pytest.raises(ConfigError, match="A -> B -> A|B -> A -> B"):
+        build_kardex(tmp_path)
+
+
+def test_interpolation_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("NAVCONFIG_INTERPOLATE", "false")
+    make_project(
+        tmp_path,
+        {".env": "DB_HOST=db\n", ".env.databases": "DB_URL=pg://${DB_HOST}\n"},
+        pyproject='[navconfig]\nLABEL = "${DB_HOST}"\n',
+    )
+    cfg = build_kardex(tmp_path)
+
+    # python-dotenv still expands the .env files
+    assert cfg.get("DB_URL") == "pg://db"
+    assert cfg.get("LABEL") == "${DB_HOST}"
+    assert cfg.get_bootstrap_info()["interpolation"] is None
@@ -0,0 +1,140 @@
+"""Tests for the :class:`navconfig.Kardex` configuration container.
+
+Each test builds its own project in a temporary directory, so nothing here
+needs the repository to be scaffolded. ``Kardex`` is a singleton, so the
+instances are created through ``object.__new__`` to keep them independent.
+"""
+import os
+from unittest import mock
+
+import pytest
+
+from navconfig.kardex import Kardex
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def make_project(root, env: str = "dev", **files) -> None:
+    """Scaffold a minimal NavConfig project under *root*."""
+    env_dir = root / "env" / env
+    env_dir.mkdir(parents=True, exist_ok=True)
+    (env_dir / ".env").write_text(
+        files.pop(".env", "APP_NAME=kardex-test\nCONFIG_FILE=etc/config.ini\n"),
+        encoding="utf-8",
+    )
+    (root / "etc").mkdir(exist_ok=True)
+    (root / "etc" / "config.ini").write_text(
+        files.pop("config.ini", "[app]\nname = kardex\n"), encoding="utf-8"
+    )
+    (root / "pyproject.toml").write_text(
+        files.pop("pyproject.toml", '[navconfig]\nPYPROJECT_KEY = "toml"\n'),
+        encoding="utf-8",
+    )
+    for name, content in files.items():
+        (env_dir / name).write_text(content, encoding="utf-8")
+
+
+def build_kardex(root, env: str = "dev", **kwargs) -> Kardex:
+    """Return a fresh (non-singleton) Kardex for the project at *root*."""
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=root, env=env, **kwargs)
+    return cfg
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    """Loading a project writes into ``os.environ``: restore it afterwards."""
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Bootstrap
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("parallel", ["true", "false"])
+def test_configure_merges_every_source(tmp_path, monkeypatch, parallel):
+    monkeypatch.setenv("NAVCONFIG_PARALLEL_LOAD", parallel)
+    make_project(tmp_path, **{".env.api": "API_URL=http://api\n"})
+
+    cfg = build_kardex(tmp_path)
+
+    assert cfg.get("APP_NAME") == "kardex-test"
+    assert cfg.get("API_URL") == "http://api"
+    assert cfg.get("PYPROJECT_KEY") == "toml"
+    assert cfg.get("name", section="app") == "kardex"
+    assert cfg.initialized is True
+
+
+def test_parallel_and_sequential_loads_agree(tmp_path, monkeypatch):
+    make_project(tmp_path, **{".env.local": "APP_NAME=local-wins\n"})
+
+    monkeypatch.setenv("NAVCONFIG_PARALLEL_LOAD", "false")
+    sequential = build_kardex(tmp_path)
+    monkeypatch.setenv("NAVCONFIG_PARALLEL_LOAD", "true")
+    parallel = build_kardex(tmp_path)
+
+    assert parallel._mapping_ == sequential._mapping_
+    assert parallel.section("app") == sequential.section("app")
+
+
+def test_bootstrap_info_reports_phase_timings(tmp_path):
+    make_project(tmp_path)
+    cfg = build_kardex(tmp_path)
+
+    info = cfg.get_env_info()["bootstrap"]
+
+    assert info["parallel"] is True
+    for phase in ("environment", "readers", "ini", "pyproject", "total"):
+        assert phase in info["phases"], phase
+    assert "environment.base" in info["phases"]
+
+
+# ---------------------------------------------------------------------------
+# Asynchronous bootstrap
+# ---------------------------------------------------------------------------
+
+class AsyncKardex(Kardex):
+    """A separate singleton, so the async tests own their instance."""
+
+
+@pytest.mark.asyncio
+async def test_create_async_runs_on_the_callers_loop(tmp_path):
+    make_project(tmp_path, **{".env.api": "API_URL=http://api\n"})
+
+    cfg = await AsyncKardex.create_async(tmp_path, env="dev")
+
+    assert cfg.initialized is True
+    assert cfg.get("APP_NAME") == "kardex-test"
+    assert cfg.get("API_URL") == "http://api"
+    assert cfg.get("PYPROJECT_KEY") == "toml"
+    assert cfg.get("name", section="app") == "kardex"
+    # a second call returns the configured singleton
+    assert await AsyncKardex.create_async(tmp_path, env="dev") is cfg
+
+
+@pytest.mark.asyncio
+async def test_configure_async_matches_configure(tmp_path):
+    make_project(tmp_path, **{".env.local": "APP_NAME=local-wins\n"})
+    expected = build_kardex(tmp_path)
+
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=tmp_path, env="dev", lazy=True)
+    await cfg.configure_async("dev")
+
+    assert cfg._mapping_ == expected._mapping_
+    assert cfg.section("app") == expected.section("app")
+    assert "environment" in cfg.get_bootstrap_info()["phases"]
+
+
+@pytest.mark.asyncio
+async def test_configure_async_reports_missing_environment(tmp_path):
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=tmp_path, env="missing", lazy=True)
+
+    with pytest.raises(FileExistsError, match="kardex env create"):
+        await cfg.configure_async("missing")
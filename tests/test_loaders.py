@@ -0,0 +1,129 @@
+"""Tests for the environment loaders and their file parsers."""
+import asyncio
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from navconfig.loaders import pyProjectLoader
+from navconfig.loaders.vault import vaultLoader
+from navconfig.loaders.parsers.toml import TOMLParser
+from navconfig.loaders.parsers.yaml import YAMLParser
+
+
+TOML_CONTENT = '[navconfig]\nAPP_NAME = "loaders"\nWORKERS = 4\n'
+YAML_CONTENT = "navconfig:\n  APP_NAME: loaders\n  WORKERS: 4\n"
+
+
+# ---------------------------------------------------------------------------
+# Parsers
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "parser, filename, content",
+    [
+        (TOMLParser(), "env.toml", TOML_CONTENT),
+        (YAMLParser(), "env.yaml", YAML_CONTENT),
+    ],
+)
+def test_sync_and_async_parsers_agree(tmp_path, parser, filename, content):
+    path = tmp_path / filename
+    path.write_text(content, encoding="utf-8")
+
+    expected = {"navconfig": {"APP_NAME": "loaders", "WORKERS": 4}}
+    assert parser.parse_file(path) == expected
+    assert asyncio.run(parser.parse(path)) == expected
+    assert parser.loads(content) == expected
+
+
+@pytest.mark.parametrize("parser", [TOMLParser(), YAMLParser()])
+def test_parsers_wrap_errors(tmp_path, parser):
+    with pytest.raises(RuntimeError, match="Error parsing"):
+        parser.parse_file(tmp_path / "missing.file")
+    with pytest.raises(RuntimeError, match="Error parsing"):
+        parser.loads("[navconfig\n: - : -")
+
+
+# ---------------------------------------------------------------------------
+# pyProjectLoader
+# ---------------------------------------------------------------------------
+
+def test_pyproject_loader_parses_on_the_calling_thread(tmp_path, monkeypatch):
+    (tmp_path / "pyproject.toml").write_text(TOML_CONTENT, encoding="utf-8")
+    loader = pyProjectLoader(env_path=tmp_path, project_name="navconfig")
+
+    started = []
+    monkeypatch.setattr(
+        threading.Thread, "start", lambda self: started.append(self)
+    )
+    data = loader.load_environment()
+
+    assert data == {"APP_NAME": "loaders", "WORKERS": 4}
+    assert started == []
+
+
+def test_pyproject_loader_async(tmp_path):
+    (tmp_path / "pyproject.toml").write_text(TOML_CONTENT, encoding="utf-8")
+    loader = pyProjectLoader(env_path=tmp_path, project_name="navconfig")
+
+    data = asyncio.run(loader.load_environment_async())
+
+    assert data == {"APP_NAME": "loaders", "WORKERS": 4}
+
+
+# ---------------------------------------------------------------------------
+# vaultLoader
+# ---------------------------------------------------------------------------
+
+def make_vault_loader(tmp_path, **kwargs) -> vaultLoader:
+    (tmp_path / ".env").write_text(
+        "VAULT_ENABLED=true\nVAULT_URL=http://vault\nVAULT_TOKEN=t\n",
+        encoding="utf-8"
+    )
+    (tmp_path / ".env.api").write_text("API_URL=http://api\n", encoding="utf-8")
+    return vaultLoader(env_path=tmp_path, env="dev", create=False, **kwargs)
+
+
+@pytest.mark.parametrize("run", [
+    lambda loader: loader.load_environment(),
+    lambda loader: asyncio.run(loader.load_environment_async()),
+])
+def test_vault_loader_exports_the_files_after_the_vault_fetch(tmp_path, run):
+    loader = make_vault_loader(tmp_path)
+    seen = []
+
+    def load_from_vault():
+        time.sleep(0.1)  # the files are read meanwhile
+        seen.append(os.environ.get("API_URL"))
+        return {"SECRET": "s3cr3t"}
+
+    with mock.patch.dict(os.environ, clear=True):
+        loader._load_from_vault = load_from_vault
+        data = run(loader)
+        assert os.environ["API_URL"] == "http://api"
+        assert os.environ["SECRET"] == "s3cr3t"
+    assert seen == [None]
+    assert data["API_URL"] == "http://api"
+
+
+def test_vault_loader_async_honors_parallel(tmp_path):
+    loader = make_vault_loader(tmp_path, parallel=False)
+    calls = []
+
+    def record(name, result):
+        def load():
+            calls.append((name, "start"))
+            time.sleep(0.05)
+            calls.append((name, "end"))
+            return result
+        return load
+
+    with mock.patch.dict(os.environ, clear=True):
+        loader._load_from_vault = record("vault", {})
+        loader._load_additional_env_files = record("files", {})
+        asyncio.run(loader.load_environment_async())
+    assert calls == [
+        ("vault", "start"), ("vault", "end"), ("files", "start"), ("files", "end")
+    ]
@@ -0,0 +1,108 @@
+"""Tests for the access manifest and the startup prefetch."""
+import json
+import os
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.kardex import Kardex
+from navconfig.utils.manifest import AccessRecorder
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class FakeRedis:
+    data = {"FEATURE_X": "on", "FEATURE_Y": "off"}
+    calls: list = []
+
+    def __init__(self, env=None):
+        self.enabled = True
+
+    def exists(self, key):
+        FakeRedis.calls.append(("exists", key))
+        return key in self.data
+
+    def get(self, key):
+        FakeRedis.calls.append(("get", key))
+        return self.data.get(key)
+
+    def get_many(self, keys):
+        FakeRedis.calls.append(("get_many", tuple(keys)))
+        return {key: self.data.get(key) for key in keys}
+
+    def close(self):
+        pass
+
+
+def test_recorder_merges_runs(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    first = AccessRecorder(manifest, env="dev")
+    first.record("DEBUG", "mapping")
+    first.record("DEBUG", "environ")  # only the first access counts
+    first.save()
+
+    second = AccessRecorder(manifest, env="dev")
+    assert second.keys("mapping") == ["DEBUG"]
+    second.record("TOKEN", "vault")
+    second.save()
+
+    data = json.loads(manifest.read_text())
+    assert data["sources"] == {"mapping": ["DEBUG"], "vault": ["TOKEN"]}
+    assert AccessRecorder(manifest, env="prod").keys("mapping") == []
+    assert second.unused(["DEBUG", "TOKEN", "STALE"]) == ["STALE"]
+
+
+def build_kardex(root, monkeypatch) -> Kardex:
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: FakeRedis if name == "redis" else None
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=root, env="dev")
+    return cfg
+
+
+def test_manifest_drives_the_prefetch(tmp_path, monkeypatch):
+    env_dir = tmp_path / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text(
+        "APP_NAME=kardex\nDEBUG=false\nCONFIG_FILE=etc/config.ini\n",
+        encoding="utf-8"
+    )
+    manifest = tmp_path / "manifest.json"
+    monkeypatch.setenv("NAVCONFIG_MANIFEST", str(manifest))
+
+    cfg = build_kardex(tmp_path, monkeypatch)
+    assert cfg.get("APP_NAME") == "kardex"
+    assert cfg.get("FEATURE_X") == "on"
+    cfg.close()
+    sources = json.loads(manifest.read_text())["sources"]
+    assert "APP_NAME" in sources["mapping"]
+    assert sources["redis"] == ["FEATURE_X"]
+
+    FakeRedis.calls = []
+    cfg = build_kardex(tmp_path, monkeypatch)
+    assert FakeRedis.calls == [("get_many", ("FEATURE_X",))]
+    assert cfg.get("FEATURE_X") == "on"
+    assert FakeRedis.calls == [("get_many", ("FEATURE_X",))]
+    info = cfg.get_env_info()["manifest"]
+    assert info["prefetched"] == []
+    assert info["accessed"]["FEATURE_X"] == "redis"
+
+
+def test_recording_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.delenv("NAVCONFIG_MANIFEST", raising=False)
+    (tmp_path / "env" / "dev").mkdir(parents=True)
+    (tmp_path / "env" / "dev" / ".env").write_text("A=1\n", encoding="utf-8")
+    cfg = build_kardex(tmp_path, monkeypatch)
+    cfg.get("A")
+    assert cfg.get_manifest_info() is None
@@ -0,0 +1,236 @@
+"""Tests for the near-cache in front of the Redis reader."""
+from types import SimpleNamespace
+
+import pytest
+from redis.exceptions import ResponseError
+
+from navconfig.readers.nearcache import CHANNEL, MISSING, TRACKING_CHANNEL, NearCache
+from navconfig.readers.redis import mredis
+
+
+def test_lru_bound_and_metrics():
+    near = NearCache(max_size=2)
+    for key in ("A", "B", "C"):
+        near.put(key, key.lower(), near.reserve(key))
+
+    assert near.get("A") is MISSING
+    assert near.get("B") == "b"
+    assert near.get("C") == "c"
+    stats = near.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == 0.6667
+
+
+def test_invalidation_during_a_fetch_is_not_lost():
+    near = NearCache()
+    token = near.reserve("A")
+    # another node changed A while we were reading the old value
+    near.invalidate(["A"])
+    assert near.put("A", "old", token) is False
+    assert near.get("A") is MISSING
+
+    near.put("B", "b", near.reserve("B"))
+    near.invalidate(None)
+    assert len(near) == 0
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        self.client.round_trips += 1
+        results = []
+        for name, args, kwargs in self.queued:
+            if name == "publish":
+                self.client.published.append(args)
+                results.append(1)
+            else:
+                results.append(getattr(self.client, name)(*args, count=False, **kwargs))
+        return results
+
+
+class FakeRedis:
+    def __init__(self, data=None):
+        self.data = dict(data or {})
+        self.round_trips = 0
+        self.published = []
+
+    def _count(self, count):
+        if count:
+            self.round_trips += 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key, count=True):
+        self._count(count)
+        return self.data.get(key)
+
+    def mget(self, keys, count=True):
+        self._count(count)
+        return [self.data.get(key) for key in keys]
+
+    def exists(self, *keys, count=True):
+        self._count(count)
+        return sum(key in self.data for key in keys)
+
+    def set(self, key, value, ex=None, count=True):
+        self._count(count)
+        self.data[key] = value
+        return True
+
+    def delete(self, *keys, count=True):
+        self._count(count)
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+def make_reader(mode="tracking", data=None):
+    reader = object.__new__(mredis)
+    reader.enabled = True
+    reader._redis = FakeRedis(data)
+    reader._near = NearCache(16, mode=mode)
+    return reader
+
+
+def test_hot_reads_skip_the_server():
+    reader = make_reader(data={"A": "1"})
+    client = reader._redis
+
+    # Kardex asks exists() then get(): one round trip, then none
+    for _ in range(3):
+        assert reader.exists("A") is True
+        assert reader.get("A") == "1"
+    assert reader.exists("MISSING") is False
+    assert reader.get("MISSING") is None
+    assert client.round_trips == 2
+    assert reader.get_many(["A", "B"]) == {"A": "1", "B": None}
+    assert client.round_trips == 3
+    assert reader.near_cache_stats()["hits"] == 7
+
+
+def test_server_invalidation_drops_the_value():
+    reader = make_reader(data={"A": "1"})
+    assert reader.get("A") == "1"
+    reader._redis.data["A"] = "2"  # changed by another client
+    reader._near.invalidate(["A"])  # pushed on __redis__:invalidate
+    assert reader.get("A") == "2"
+
+
+def test_failed_fetches_release_their_reservation():
+    reader = make_reader(data={"A": "1"})
+
+    def refused(*args, **kwargs):
+        raise ConnectionError("refused")
+
+    reader._redis.get = refused
+    reader._redis.mget = refused
+    for fetch in (lambda: reader.get("A"), lambda: reader.get_many(["A", "B"])):
+        with pytest.raises(Exception):
+            fetch()
+        assert reader._near._pending == {}
+
+
+def test_writes_invalidate_and_publish_in_pubsub_mode():
+    reader = make_reader(mode="pubsub", data={"A": "1"})
+    assert reader.get("A") == "1"
+
+    reader.set("A", "2")
+    assert reader.get("A") == "2"
+    reader.delete_many(["A", "B"])
+    assert reader.get("A") is None
+    assert reader._redis.published == [
+        (CHANNEL, "A"), (CHANNEL, "A"), (CHANNEL, "B")
+    ]
+
+    tracked = make_reader(mode="tracking", data={"A": "1"})
+    tracked.set("A", "2")
+    # the server tells the other clients
+    assert tracked._redis.published == []
+
+
+class FakePubSub:
+    def __init__(self):
+        self.handlers = {}
+
+    def subscribe(self, **handlers):
+        self.handlers.update(handlers)
+
+    def run_in_thread(self, **kwargs):
+        return SimpleNamespace(stop=lambda: None)
+
+
+class FakeListenerClient:
+    def __init__(self):
+        connection = SimpleNamespace(
+            send_command=lambda *args: None, read_response=lambda: 42
+        )
+        self.connection_pool = SimpleNamespace(
+            get_connection=lambda name: connection,
+            release=lambda conn: None,
+        )
+        self.pubsub_instance = FakePubSub()
+
+    def pubsub(self, **kwargs):
+        return self.pubsub_instance
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("tracking, mode, channel", [
+    (True, "tracking", TRACKING_CHANNEL),
+    (False, "pubsub", CHANNEL),
+])
+def test_start_near_cache_selects_the_invalidation_mode(
+    monkeypatch, tracking, mode, channel
+):
+    monkeypatch.setenv("REDIS_NEAR_CACHE", "1024")
+    listeners = []
+
+    def client(self, **kwargs):
+        listeners.append(FakeListenerClient())
+        return listeners[-1]
+
+    tracked = []
+
+    def track(self, client_id):
+        if not tracking:
+            raise ResponseError("unknown subcommand 'TRACKING'")
+        tracked.append(client_id)
+
+    monkeypatch.setattr(mredis, "_client", client)
+    monkeypatch.setattr(mredis, "_track", track)
+    reader = object.__new__(mredis)
+    reader.redis_url = "redis://localhost:6379/1"
+    reader._timeout = 1
+    reader._start_near_cache()
+
+    assert reader.near_cache_stats()["mode"] == mode
+    assert tracked == ([42] if tracking else [])
+    handlers = listeners[-1].pubsub_instance.handlers
+    assert list(handlers) == [channel]
+    reader._near.put("A", "1", reader._near.reserve("A"))
+    handlers[channel]({"type": "message", "data": ["A"]})
+    assert reader._near.get("A") is MISSING
+
+
+def test_near_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("REDIS_NEAR_CACHE", "0")
+    reader = object.__new__(mredis)
+    reader._start_near_cache()
+    assert reader.near_cache_stats() is None
@@ -0,0 +1,163 @@
+"""Tests for the background preloading of the other environments."""
+import os
+from unittest import mock
+
+import pytest
+
+import navconfig.readers.vault
+from navconfig.kardex import Kardex
+from navconfig.loaders.vault import vaultLoader
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    for name in ("ENV", "DB_NAME", "HOST", "URL", "VAULT_ENABLED", "VAULT_URL"):
+        monkeypatch.delenv(name, raising=False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+def make_project(root):
+    for env, extra in (
+        ("dev", ""),
+        ("staging", "HOST=staging.local\nURL=http://${HOST}/api\n"),
+        ("prod", "PROD_ONLY=yes\n"),
+    ):
+        env_dir = root / "env" / env
+        env_dir.mkdir(parents=True)
+        (env_dir / ".env").write_text(
+            f"DB_NAME={env}_db\n{extra}", encoding="utf-8"
+        )
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text("", encoding="utf-8")
+
+
+@pytest.fixture
+def kardex(tmp_path, monkeypatch):
+    monkeypatch.setenv("NAVCONFIG_PRELOAD_ENVS", "true")
+    make_project(tmp_path)
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    cfg.preload_envs(wait=True)
+    yield cfg
+    cfg.close()
+
+
+def test_other_environments_load_without_touching_environ(kardex):
+    assert kardex._preloaded_envs() == ["prod", "staging"]
+    assert kardex.get_env_info()["preloaded_envs"] == ["prod", "staging"]
+    assert "PROD_ONLY" not in os.environ
+    assert "HOST" not in os.environ
+    assert os.environ["DB_NAME"] == "dev_db"
+
+    with mock.patch.object(
+        kardex, "_load_env_isolated", side_effect=AssertionError("loaded")
+    ):
+        assert kardex.get_with_env("DB_NAME", "prod") == "prod_db"
+        assert kardex.get_with_env("URL", "staging") == "http://staging.local/api"
+
+
+def test_set_env_switches_to_the_preloaded_environment(kardex):
+    with mock.patch.object(
+        kardex, "load_environment", side_effect=AssertionError("reloaded")
+    ):
+        assert kardex.set_env("prod") is True
+    assert kardex.get("DB_NAME") == "prod_db"
+    assert kardex.get("PROD_ONLY") == "yes"
+    assert kardex.ENV == "prod"
+
+    # the environment left is preloaded again, for the way back
+    kardex._env_loading["dev"].result()
+    assert kardex._env_cache["dev"]["DB_NAME"] == "dev_db"
+    kardex.clear_env_cache("staging")
+    assert "staging" not in kardex._preloaded_envs()
+
+
+def test_isolated_vault_loader_keeps_the_settings_private(tmp_path, monkeypatch):
+    created = []
+
+    class FakeVault:
+        def __init__(self, env=None, settings=None):
+            created.append(settings)
+
+        def list(self, path):
+            return {"SECRET": f"from-{path}"}
+
+    monkeypatch.setattr(navconfig.readers.vault, "VaultReader", FakeVault)
+    (tmp_path / ".env").write_text(
+        "VAULT_ENABLED=true\nVAULT_URL=http://vault:8200\nVAULT_TOKEN=t\n",
+        encoding="utf-8"
+    )
+    loader = vaultLoader(env_path=tmp_path, env="prod", isolated=True)
+    data = loader.load_environment()
+
+    assert data["SECRET"] == "from-prod"
+    assert created[0]["VAULT_URL"] == "http://vault:8200"
+    assert "VAULT_URL" not in os.environ
+    assert "SECRET" not in os.environ
+
+
+class FakeVault:
+    """Serves ``<env>/api`` secrets like VaultReader.get."""
+
+    secrets = {
+        "dev/api": {"key": "DEV_SECRET"},
+        "prod/api": {"key": "PROD_SECRET"},
+    }
+
+    def __init__(self, env: str = None, **kwargs):
+        self.enabled = True
+
+    def get(self, key, default=None):
+        return self.secrets.get(key.rpartition("/")[0], default)
+
+    def exists(self, key):
+        return False
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("preload", [True, False])
+def test_set_env_resets_the_references_of_the_environment_left(
+    tmp_path, monkeypatch, preload
+):
+    make_project(tmp_path)
+    for env, extra in (("dev", "ONLY_DEV=yes\n"), ("prod", "")):
+        env_file = tmp_path / "env" / env / ".env"
+        env_file.write_text(
+            env_file.read_text(encoding="utf-8")
+            + f"API_KEY=vault:{env}/api#key\n{extra}",
+            encoding="utf-8",
+        )
+    monkeypatch.setenv("VAULT_ENABLED", "true")
+    monkeypatch.setenv("NAVCONFIG_PRELOAD_ENVS", str(preload).lower())
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: FakeVault if name == "vault" else None
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    try:
+        if preload:
+            cfg.preload_envs(wait=True)
+        assert cfg.get("API_KEY") == "DEV_SECRET"
+        assert cfg.get("ONLY_DEV") == "yes"
+
+        assert cfg.set_env("prod") is True
+        assert cfg.get("API_KEY") == "PROD_SECRET"
+        assert cfg.get("DB_NAME") == "prod_db"
+        assert "ONLY_DEV" not in os.environ
+        assert cfg.get("ONLY_DEV") is None
+
+        if preload:
+            cfg._env_loading["dev"].result()
+        assert cfg.set_env("dev") is True
+        assert cfg.get("API_KEY") == "DEV_SECRET"
+        assert cfg.get("ONLY_DEV") == "yes"
+        assert "PROD_ONLY" not in os.environ
+    finally:
+        cfg.close()
@@ -0,0 +1,317 @@
+"""Tests for the batch operations of the external readers."""
+from types import SimpleNamespace
+
+import hvac
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError, ResponseError
+
+from navconfig.exceptions import ReaderUnavailable
+from navconfig.readers.abstract import AbstractReader
+from navconfig.readers.redis import mredis
+from navconfig.readers.vault import KVPatcher, VaultReader
+
+
+class DictReader(AbstractReader):
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def exists(self, key):
+        return key in self.data
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        return self.data.pop(key, None) is not None
+
+    def close(self):
+        pass
+
+
+def test_abstract_reader_batch_defaults():
+    reader = DictReader()
+    reader.set_many({"A": 1, "B": 2})
+    assert reader.get_many(["A", "C"]) == {"A": 1, "C": None}
+    assert reader.exists_many(["A", "C"]) == {"A": True, "C": False}
+    assert reader.delete_many(["A", "C"]) == {"A": True, "C": False}
+
+
+# ---------------------------------------------------------------------------
+# Redis
+# ---------------------------------------------------------------------------
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        self.client.round_trips += 1
+        return [
+            getattr(self.client, name)(*args, count=False, **kwargs)
+            for name, args, kwargs in self.queued
+        ]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+        self.round_trips = 0
+
+    def _count(self, count):
+        if count:
+            self.round_trips += 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, ex=None, count=True):
+        self._count(count)
+        self.data[key] = value
+        self.expiry[key] = ex
+        return True
+
+    def mget(self, keys, count=True):
+        self._count(count)
+        return [self.data.get(key) for key in keys]
+
+    def exists(self, *keys, count=True):
+        self._count(count)
+        return sum(key in self.data for key in keys)
+
+    def delete(self, *keys, count=True):
+        self._count(count)
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture
+def redis_reader():
+    reader = object.__new__(mredis)
+    reader.enabled = True
+    reader._redis = FakeRedis()
+    return reader
+
+
+def test_redis_batches_use_one_round_trip(redis_reader):
+    client = redis_reader._redis
+    redis_reader.set_many({"A": "1", "B": "2"}, timeout=60)
+    assert client.round_trips == 1
+    assert client.expiry == {"A": 60, "B": 60}
+
+    assert redis_reader.get_many(["A", "B", "C"]) == {"A": "1", "B": "2", "C": None}
+    assert redis_reader.exists_many(["A", "C"]) == {"A": True, "C": False}
+    assert redis_reader.delete_many(["A", "C"]) == {"A": True, "C": False}
+    assert client.round_trips == 4
+
+
+def test_redis_set_honours_timeout_and_delete_deletes(redis_reader):
+    redis_reader.set("A", "1", timeout=30)
+    assert redis_reader._redis.expiry["A"] == 30
+    assert redis_reader.delete("A") is True
+    assert redis_reader.delete("A") is False
+
+
+def test_redis_unreachable_server_is_reported_as_unavailable(redis_reader):
+    def refused(*args, **kwargs):
+        raise RedisConnectionError("Connection refused")
+
+    def wrong_type(*args, **kwargs):
+        raise ResponseError("WRONGTYPE Operation against a key")
+
+    redis_reader._redis.set = refused
+    redis_reader._redis.delete = refused
+    with pytest.raises(ReaderUnavailable):
+        redis_reader.set("A", "1")
+    with pytest.raises(ReaderUnavailable):
+        redis_reader.delete("A")
+
+    redis_reader._redis.set = wrong_type
+    with pytest.raises(Exception, match="WRONGTYPE") as error:
+        redis_reader.set("A", "1")
+    assert not isinstance(error.value, ReaderUnavailable)
+
+
+# ---------------------------------------------------------------------------
+# Vault
+# ---------------------------------------------------------------------------
+
+class FakeKV2:
+    def __init__(self, secrets):
+        self.secrets = secrets
+        self.versions = {path: 1 for path in secrets}
+        self.reads = []
+        self.writes = []
+        self.conflicts = 0
+
+    def read_secret_version(self, path, mount_point):
+        self.reads.append(path)
+        if path not in self.secrets:
+            raise hvac.exceptions.InvalidPath()
+        return {"data": {
+            "data": dict(self.secrets[path]),
+            "metadata": {"version": self.versions[path]},
+        }}
+
+    def create_or_update_secret(self, path, secret, mount_point, cas=None):
+        if self.conflicts:
+            # another writer got in between
+            self.conflicts -= 1
+            self.versions[path] = self.versions.get(path, 0) + 1
+            self.secrets.setdefault(path, {})["OTHER"] = "writer"
+        if cas is not None and cas != self.versions.get(path, 0):
+            raise hvac.exceptions.InvalidRequest(
+                "check-and-set parameter did not match the current version"
+            )
+        self.writes.append(path)
+        self.secrets[path] = dict(secret)
+        self.versions[path] = self.versions.get(path, 0) + 1
+
+
+class FakeAdapter:
+    def __init__(self, kv2, supported=True):
+        self.kv2 = kv2
+        self.supported = supported
+        self.patches = []
+
+    def request(self, method, url, headers=None, json=None):
+        assert method == "PATCH"
+        assert headers["Content-Type"] == "application/merge-patch+json"
+        if not self.supported:
+            # what hvac raises for the 405 of Vault < 1.9
+            raise hvac.exceptions.VaultError.from_status(
+                405, errors=["1 error occurred:\n\t* unsupported operation\n\n"],
+                method="patch", url=url
+            )
+        path = url.split("/data/", 1)[1]
+        if path not in self.kv2.secrets:
+            raise hvac.exceptions.InvalidPath()
+        self.patches.append((path, json["data"]))
+        secret = self.kv2.secrets[path]
+        for key, value in json["data"].items():
+            if value is None:
+                secret.pop(key, None)
+            else:
+                secret[key] = value
+
+
+def make_vault_reader(supported=True):
+    reader = object.__new__(VaultReader)
+    reader.enabled = True
+    reader.version = 2
+    reader._mount = "navigator"
+    reader._env = "dev"
+    kv2 = FakeKV2({"dev": {"A": "1", "B": "2"}, "payments": {"KEY": "k"}})
+    reader.client = SimpleNamespace(
+        secrets=SimpleNamespace(kv=SimpleNamespace(v2=kv2)),
+        adapter=FakeAdapter(kv2, supported),
+    )
+    reader._patcher = KVPatcher(reader.client, "navigator", 2)
+    return reader
+
+
+@pytest.fixture
+def vault_reader():
+    return make_vault_reader()
+
+
+def test_vault_reads_each_path_once(vault_reader):
+    kv2 = vault_reader.client.secrets.kv.v2
+    assert vault_reader.get_many(["A", "B", "payments/KEY", "missing/X"]) == {
+        "A": "1", "B": "2", "payments/KEY": "k", "missing/X": None,
+    }
+    assert sorted(kv2.reads) == ["dev", "missing", "payments"]
+    assert vault_reader.exists_many(["A", "Z"]) == {"A": True, "Z": False}
+
+
+def test_vault_writes_send_only_the_changed_keys(vault_reader):
+    kv2 = vault_reader.client.secrets.kv.v2
+    adapter = vault_reader.client.adapter
+    vault_reader.set_many({"C": "3", "D": "4"})
+    vault_reader.delete_many(["A"])
+
+    assert adapter.patches == [("dev", {"C": "3", "D": "4"}), ("dev", {"A": None})]
+    assert kv2.reads == [] and kv2.writes == []
+    assert kv2.secrets["dev"] == {"B": "2", "C": "3", "D": "4"}
+
+
+def test_vault_falls_back_to_check_and_set():
+    reader = make_vault_reader(supported=False)
+    kv2 = reader.client.secrets.kv.v2
+    reader.set_many({"C": "3", "new/E": "5"})
+    assert reader._patcher.native is False
+    assert kv2.secrets["dev"] == {"A": "1", "B": "2", "C": "3"}
+    assert kv2.secrets["new"] == {"E": "5"}
+
+    assert reader.delete_many(["A", "B", "missing/X"]) == {
+        "A": True, "B": True, "missing/X": True,
+    }
+    assert kv2.secrets["dev"] == {"C": "3"}
+    assert "missing" not in kv2.secrets
+
+
+def test_other_unexpected_patch_errors_are_raised(vault_reader):
+    def refuse(*args, **kwargs):
+        raise hvac.exceptions.VaultError.from_status(412, "precondition failed")
+
+    vault_reader.client.adapter.request = refuse
+    with pytest.raises(ValueError, match="precondition failed"):
+        vault_reader.set("C", "3")
+    assert vault_reader._patcher.native is None
+
+
+def test_check_and_set_retries_and_keeps_concurrent_writes():
+    reader = make_vault_reader(supported=False)
+    kv2 = reader.client.secrets.kv.v2
+    kv2.conflicts = 2
+
+    reader.set("C", "3")
+
+    assert kv2.secrets["dev"] == {"A": "1", "B": "2", "C": "3", "OTHER": "writer"}
+    assert kv2.reads == ["dev", "dev", "dev"]
+
+
+def test_nested_values_are_not_merge_patched(vault_reader):
+    kv2 = vault_reader.client.secrets.kv.v2
+    kv2.secrets["dev"]["CONF"] = {"old": 1}
+    vault_reader.set("CONF", {"new": 2})
+    assert vault_reader.client.adapter.patches == []
+    assert kv2.secrets["dev"]["CONF"] == {"new": 2}
+
+
+def test_kardex_set_many_batches_external_keys(tmp_path, monkeypatch):
+    from navconfig.kardex import Kardex
+
+    calls = []
+
+    class BatchReader(DictReader):
+        def set_many(self, values, timeout=None):
+            calls.append((dict(values), timeout))
+            super().set_many(values, timeout)
+
+    monkeypatch.setenv("KARDEX_LOCAL", "env")
+    cfg = object.__new__(Kardex)
+    cfg.__init__(site_root=tmp_path, lazy=True)
+    cfg._mapping_ = {}
+    cfg._readers = {"cache": BatchReader()}
+    cfg._use_vault = False
+    cfg._use_cache = True
+
+    cfg.set_many({"KARDEX_LOCAL": "changed", "A": [1, 2], "B": "2"}, timeout=10)
+
+    assert calls == [({"A": 'NAVCONFIG_JSON:1:[1,2]', "B": "2"}, 10)]
+    assert cfg._readers["cache"].data["B"] == "2"
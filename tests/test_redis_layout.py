@@ -0,0 +1,255 @@
+"""Tests for the hash-per-environment layout of the Redis reader."""
+import os
+from unittest import mock
+
+import pytest
+from redis.exceptions import DataError, ResponseError
+
+import navconfig.kardex
+import navconfig.readers.redis as redis_module
+from navconfig.kardex import Kardex
+from navconfig.readers.nearcache import NearCache
+from navconfig.readers.redis import mredis
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "billing")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.queued = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+        return queue
+
+    def execute(self):
+        self.client.round_trips += 1
+        return [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.queued
+        ]
+
+
+class HashRedis:
+    """Hashes and sorted sets, enough for the hash layout."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.zsets = {}
+        self.round_trips = 0
+        self.scanned = False
+
+    def ping(self):
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def hset(self, name, mapping):
+        if not mapping:
+            raise DataError("'hset' with no key value pairs")
+        self.hashes.setdefault(name, {}).update(mapping)
+        return len(mapping)
+
+    def hmget(self, name, keys):
+        return [self.hashes.get(name, {}).get(key) for key in keys]
+
+    def hdel(self, name, *keys):
+        return sum(
+            self.hashes.get(name, {}).pop(key, None) is not None for key in keys
+        )
+
+    def hlen(self, name):
+        return len(self.hashes.get(name, {}))
+
+    def hgetall(self, name):
+        return dict(self.hashes.get(name, {}))
+
+    def hscan_iter(self, name, count=None):
+        self.scanned = True
+        return iter(self.hashes.get(name, {}).items())
+
+    def zadd(self, name, mapping):
+        if not mapping:
+            raise DataError("ZADD requires an equal number of values and scores")
+        self.zsets.setdefault(name, {}).update(mapping)
+
+    def zrem(self, name, *keys):
+        if not keys:
+            raise ResponseError("wrong number of arguments for 'zrem' command")
+        for key in keys:
+            self.zsets.get(name, {}).pop(key, None)
+
+    def zscore(self, name, key):
+        return self.zsets.get(name, {}).get(key)
+
+    def zrange(self, name, start, end):
+        return list(self.zsets.get(name, {}))
+
+    def eval(self, script, numkeys, name, expiry, now):
+        # PURGE_EXPIRED
+        due = [key for key, at in self.zsets.get(expiry, {}).items() if at <= now]
+        if due:
+            self.hdel(name, *due)
+            self.zrem(expiry, *due)
+        return len(due)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(redis_module, "timestamp", clock)
+    return clock
+
+
+def make_reader(monkeypatch, near=False):
+    monkeypatch.setenv("REDIS_LAYOUT", "hash")
+    client = HashRedis()
+    monkeypatch.setattr(mredis, "_client", lambda self, **kwargs: client)
+    monkeypatch.setenv("REDIS_NEAR_CACHE", "0")
+    reader = mredis(env="prod")
+    if near:
+        reader._near = NearCache(16, mode="tracking")
+    return reader
+
+
+def test_keys_live_in_one_hash_per_environment(monkeypatch, clock):
+    reader = make_reader(monkeypatch)
+    client = reader._redis
+    assert reader.layout == "hash"
+
+    reader.set_many({"A": "1", "B": "2"})
+    reader.set("C", "3", timeout=10)
+    assert client.hashes == {"navconfig:billing:prod": {"A": "1", "B": "2", "C": "3"}}
+    assert client.zsets["navconfig:billing:prod:expiry"] == {"C": 1010.0}
+
+    client.round_trips = 0
+    assert reader.get_many(["A", "C", "Z"]) == {"A": "1", "C": "3", "Z": None}
+    assert client.round_trips == 1
+    assert reader.exists_many(["A", "Z"]) == {"A": True, "Z": False}
+
+    clock.now = 1011.0
+    assert reader.get("C") is None
+    assert reader.exists("C") is False
+    # written again without a TTL: no longer expires
+    reader.set("C", "4")
+    assert reader.get("C") == "4"
+    assert reader.delete_many(["A", "Z"]) == {"A": True, "Z": False}
+
+    # nothing to write or delete: no empty HSET/ZADD/ZREM
+    reader.set_many({})
+    assert reader.delete_many([]) == {}
+    reader._pipeline(lambda pipe: reader._queue_set(pipe, {}))
+    reader._pipeline(lambda pipe: reader._queue_delete(pipe, []))
+
+
+def test_get_all_purges_expired_and_skips_expiring_keys(monkeypatch, clock):
+    reader = make_reader(monkeypatch)
+    reader.set_many({"A": "1", "B": "2"})
+    reader.setex("OTP", "x", 30)
+    reader.setex("OLD", "y", 5)
+    clock.now = 1010.0
+
+    assert reader.get_all() == {"A": "1", "B": "2"}
+    assert reader.get_all(expiring=True) == {"A": "1", "B": "2", "OTP": "x"}
+    assert "OLD" not in reader._redis.hashes["navconfig:billing:prod"]
+
+    monkeypatch.setattr(redis_module, "HSCAN_THRESHOLD", 1)
+    assert reader.get_all() == {"A": "1", "B": "2"}
+    assert reader._redis.scanned is True
+
+
+def test_expiring_values_are_not_near_cached(monkeypatch, clock):
+    reader = make_reader(monkeypatch, near=True)
+    reader.set("A", "1")
+    reader.set("T", "2", timeout=10)
+    reader.get_many(["A", "T"])
+    assert reader.get("A") == "1"
+    clock.now = 1011.0
+    assert reader.get("T") is None
+    assert reader.near_cache_stats()["size"] == 1
+
+    reader.use_env("dev")
+    assert reader._hash == "navconfig:billing:dev"
+    assert reader.near_cache_stats()["size"] == 0
+
+
+class PreloadRedis:
+    layout = "hash"
+    store: dict = {}
+
+    def __init__(self, env=None):
+        self.enabled = True
+        self.env = env
+        self.gets = []
+
+    def get_all(self):
+        return dict(self.store)
+
+    def exists(self, key):
+        return key in self.store
+
+    def get(self, key, default=None):
+        self.gets.append(key)
+        return self.store.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.store[key] = value
+        return True
+
+    def close(self):
+        pass
+
+
+def test_kardex_preloads_the_environment_hash(tmp_path, monkeypatch):
+    PreloadRedis.store = {"FEATURE": "on", "DEBUG": "from-redis", "LIMIT": "10"}
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "false")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: PreloadRedis if name == "redis" else None
+    )
+    env_dir = tmp_path / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text("DEBUG=true\n", encoding="utf-8")
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "config.ini").write_text("", encoding="utf-8")
+
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    reader = cfg._readers["cache"]
+    assert reader.env == "dev"
+    assert "preload" in cfg.get_bootstrap_info()["phases"]
+
+    assert cfg.get("FEATURE") == "on"
+    assert cfg.get("LIMIT") == "10"
+    assert cfg.getboolean("DEBUG") is True  # the environment wins
+    assert reader.gets == []
+
+    # written through to the cache backend
+    cfg.set("FEATURE", "off")
+    assert PreloadRedis.store["FEATURE"] == "off"
+    assert cfg.get("FEATURE") == "off"
+    assert reader.gets == ["FEATURE"]
@@ -0,0 +1,75 @@
+"""Tests for the connection pool settings of the Redis reader."""
+import os
+from unittest import mock
+
+import pytest
+import redis
+from redis.connection import AbstractConnection, UnixDomainSocketConnection
+
+from navconfig.exceptions import ReaderUnavailable
+from navconfig.readers.redis import mredis
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.setenv("REDIS_NEAR_CACHE", "0")
+    # no server here: connections "connect" without a socket
+    monkeypatch.setattr(redis.Redis, "ping", lambda self: True)
+    monkeypatch.setattr(AbstractConnection, "connect", lambda self: None)
+    monkeypatch.setattr(AbstractConnection, "can_read", lambda self, timeout=0: False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+def test_tcp_pool_defaults():
+    reader = mredis()
+    pool = reader._redis.connection_pool
+    assert isinstance(pool, redis.BlockingConnectionPool)
+    assert pool.max_connections == 50
+    assert pool.timeout == 5
+    assert pool.connection_kwargs["socket_keepalive"] is True
+    assert pool.connection_kwargs["socket_timeout"] == 2
+    assert pool.connection_kwargs["health_check_interval"] == 30
+    assert reader.pool_stats() == {
+        'transport': "tcp",
+        'protocol': 2,
+        'max_connections': 50,
+        'created': 0,
+        'in_use': 0,
+        'idle': 0,
+        'blocking': True,
+    }
+
+
+def test_unix_socket_and_resp3(monkeypatch):
+    monkeypatch.setenv("REDIS_SOCKET", "/run/redis/redis.sock")
+    monkeypatch.setenv("REDIS_PROTOCOL", "3")
+    reader = mredis()
+    pool = reader._redis.connection_pool
+    assert pool.connection_class is UnixDomainSocketConnection
+    assert pool.connection_kwargs["path"] == "/run/redis/redis.sock"
+    assert pool.connection_kwargs["db"] == 1
+    assert pool.connection_kwargs["protocol"] == 3
+    assert "socket_keepalive" not in pool.connection_kwargs
+    assert reader.pool_stats()["transport"] == "unix"
+    # listeners stay on RESP2 (pub/sub invalidations)
+    listener = reader._client(max_connections=1, protocol=2).connection_pool
+    assert listener.connection_kwargs["protocol"] == 2
+    assert not isinstance(listener, redis.BlockingConnectionPool)
+
+
+def test_exhausted_pool_waits_then_fails_fast(monkeypatch):
+    monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "2")
+    monkeypatch.setenv("REDIS_POOL_TIMEOUT", "0.01")
+    reader = mredis()
+    pool = reader._redis.connection_pool
+    busy = [pool.get_connection("GET") for _ in range(2)]
+    stats = reader.pool_stats()
+    assert (stats["created"], stats["in_use"], stats["idle"]) == (2, 2, 0)
+
+    with pytest.raises(ReaderUnavailable):
+        reader.get("A")
+
+    pool.release(busy.pop())
+    stats = reader.pool_stats()
+    assert (stats["in_use"], stats["idle"]) == (1, 1)
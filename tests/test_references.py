@@ -0,0 +1,147 @@
+"""Tests for the lazy ``vault:``/``redis:`` secret references."""
+import os
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.kardex import Kardex
+from navconfig.utils.references import SecretRef, SecretResolver, parse_reference
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("PROJECT_NAME", "navconfig")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class FakeVault:
+    """Reads ``<path>/*`` like VaultReader.get, counting the round trips."""
+
+    secrets = {
+        "payments/stripe": {"api_key": "sk_live", "pub": "pk_live"},
+        "dev": {"db_password": "s3cr%t"},
+    }
+    reads: list = []
+
+    def __init__(self, env: str = None, **kwargs):
+        self.enabled = True
+        FakeVault.reads = []
+
+    def get(self, key, default=None):
+        path = key.rpartition("/")[0] or "dev"
+        FakeVault.reads.append(path)
+        return self.secrets.get(path, default)
+
+    def exists(self, key):
+        return False
+
+    def close(self):
+        pass
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("vault:payments/stripe#api_key", SecretRef("vault", "payments/stripe", "api_key", "vault:payments/stripe#api_key")),
+    ("vault:db/password", SecretRef("vault", "db", "password", "vault:db/password")),
+    ("vault:db_password", SecretRef("vault", None, "db_password", "vault:db_password")),
+    ("redis:feature/x", SecretRef("redis", None, "feature/x", "redis:feature/x")),
+    ("redis://localhost:6379/1", None),
+    ("redis:6379", None),
+    ("vault:8200", None),
+    ("redis:host:6379", None),
+    ("plain", None),
+    (10, None),
+])
+def test_parse_reference(value, expected):
+    assert parse_reference(value) == expected
+
+
+def test_resolver_reads_each_vault_path_once():
+    reader = FakeVault()
+    resolver = SecretResolver(lambda scheme: reader if scheme == "vault" else None)
+
+    assert resolver.resolve(parse_reference("vault:payments/stripe#api_key")) == "sk_live"
+    assert resolver.resolve(parse_reference("vault:payments/stripe#pub")) == "pk_live"
+    assert FakeVault.reads == ["payments/stripe"]
+    with pytest.raises(LookupError):
+        resolver.resolve(parse_reference("vault:payments/stripe#missing"))
+    with pytest.raises(LookupError, match="Redis reader"):
+        resolver.resolve(parse_reference("redis:feature/x"))
+
+
+def make_project(root, env: str, config_ini: str = ""):
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text(env, encoding="utf-8")
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text(config_ini, encoding="utf-8")
+
+
+def build_kardex(root, monkeypatch) -> Kardex:
+    monkeypatch.setenv("VAULT_ENABLED", "true")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: FakeVault if name == "vault" else None
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=root, env="dev")
+    return cfg
+
+
+def test_references_are_resolved_on_first_access(tmp_path, monkeypatch):
+    make_project(
+        tmp_path,
+        "STRIPE_KEY=vault:payments/stripe#api_key\n"
+        "STRIPE_PUB=vault:payments/stripe#pub\n",
+        config_ini="[db]\npassword = vault:db_password\n",
+    )
+    cfg = build_kardex(tmp_path, monkeypatch)
+
+    assert FakeVault.reads == []
+    assert cfg.get_bootstrap_info()["references"]["pending"] == 3
+    assert cfg.get("STRIPE_KEY") == "sk_live"
+    assert cfg.STRIPE_PUB == "pk_live"
+    assert cfg.get("password", section="db") == "s3cr%t"
+    assert FakeVault.reads == ["payments/stripe", "dev"]
+    assert os.environ["STRIPE_KEY"] == "sk_live"
+    assert cfg.get_bootstrap_info()["references"] == {"pending": 0, "reads": 2}
+
+
+def test_templates_use_the_resolved_secret(tmp_path, monkeypatch):
+    make_project(
+        tmp_path,
+        "DB_PASSWORD=vault:db_password\nDSN=pg://user:${DB_PASSWORD}@db\n",
+    )
+    cfg = build_kardex(tmp_path, monkeypatch)
+
+    assert cfg.get("DSN") == "pg://user:s3cr%t@db"
+
+
+def test_unresolvable_references_fall_back_to_the_raw_value(tmp_path, monkeypatch):
+    make_project(tmp_path, "MISSING=vault:payments/stripe#nope\n")
+    cfg = build_kardex(tmp_path, monkeypatch)
+
+    assert cfg.get("MISSING") == "vault:payments/stripe#nope"
+
+
+def test_a_secret_fetched_during_an_eviction_is_not_stored(tmp_path, monkeypatch):
+    make_project(tmp_path, "STRIPE_KEY=vault:payments/stripe#api_key\n")
+    cfg = build_kardex(tmp_path, monkeypatch)
+    reader = cfg._readers["vault"]
+    get = reader.get
+
+    def evicted_meanwhile(key, default=None):
+        # the invalidation listener thread, while the secret is fetched
+        cfg._evict(["STRIPE_KEY"])
+        return get(key, default)
+
+    reader.get = evicted_meanwhile
+    assert cfg.get("STRIPE_KEY") == "sk_live"
+    # may be stale: resolved again on next access
+    assert "STRIPE_KEY" in cfg._references
+    reader.get = get
+    assert cfg.get("STRIPE_KEY") == "sk_live"
+    assert "STRIPE_KEY" not in cfg._references
@@ -0,0 +1,239 @@
+"""Tests for KardexRegistry: independent configurations in one process."""
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig import KardexRegistry
+from navconfig.kardex import Kardex
+from navconfig.utils.filecache import FileCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "false")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class SharedRedis:
+    instances: list = []
+
+    def __init__(self, env=None):
+        self.enabled = True
+        self.env = env
+        self.closed = False
+        SharedRedis.instances.append(self)
+
+    def exists(self, key):
+        return False
+
+    def get(self, key, default=None):
+        return default
+
+    def close(self):
+        self.closed = True
+
+
+def make_project(root, name, redis_db="1"):
+    env_dir = root / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text(
+        f"TENANT={name}\nCACHE_BACKEND=redis\nREDIS_DB={redis_db}\n"
+        "PORT=8080\nFEATURE_ON=yes\nHOSTS=a,b\nLIMITS={\"rps\": 5}\n",
+        encoding="utf-8"
+    )
+    (root / "etc").mkdir()
+    (root / "etc" / "config.ini").write_text(
+        f"[tenant]\nname = {name}\nratio = 50%%\ndiscount = 10%\n"
+        "label = %(name)s-app\n",
+        encoding="utf-8"
+    )
+    return root
+
+
+@pytest.fixture
+def projects(tmp_path, monkeypatch):
+    SharedRedis.instances = []
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: SharedRedis if name == "redis" else None
+    )
+    return (
+        make_project(tmp_path / "acme", "acme"),
+        make_project(tmp_path / "globex", "globex"),
+        make_project(tmp_path / "initech", "initech", redis_db="2"),
+    )
+
+
+def test_instances_are_independent(projects):
+    acme, globex, _ = projects
+    registry = KardexRegistry()
+    first = registry.get(acme, env="dev")
+    second = registry.get(globex, env="dev")
+
+    assert first is not second
+    assert registry.get(acme, env="dev") is first
+    assert first.get("TENANT") == "acme"
+    assert second.get("TENANT") == "globex"
+    assert second.get("name", section="tenant") == "globex"
+    # parsed like ConfigParser.read(): interpolation included
+    assert second.get("ratio", section="tenant") == "50%"
+    assert second.get("label", section="tenant") == "globex-app"
+    assert second._ini.get("tenant", "discount", raw=True) == "10%"
+    # os.environ is left as it was
+    assert "TENANT" not in os.environ
+    assert (acme, "dev") in registry
+    assert registry.stats()["builds"] == 2
+    registry.close()
+
+
+def test_typed_getters_read_the_instance_values(projects):
+    acme, _, _ = projects
+    registry = KardexRegistry()
+    config = registry.get(acme, env="dev")
+    # the instance values win over the process environment
+    os.environ["PORT"] = "9090"
+    assert config.getint("PORT") == 8080
+    assert config.getboolean("FEATURE_ON") is True
+    assert config.getlist("HOSTS") == ["a", "b"]
+    assert config.getdict("LIMITS") == {"rps": 5}
+    assert config.PORT == "8080"
+    assert config.TENANT == "acme"
+    assert config.get("PORT") == "8080"
+    registry.close()
+
+
+def test_lookups_wait_for_the_build_of_another_project(projects, monkeypatch):
+    acme, globex, _ = projects
+    with open(globex / "env" / "dev" / ".env", "a", encoding="utf-8") as fp:
+        fp.write("GLOBEX_ONLY=1\n")
+    registry = KardexRegistry()
+    first = registry.get(acme, env="dev")
+    building = threading.Event()
+    load_ini = Kardex._load_ini_config
+
+    def slow_ini(self):
+        if self is not first:
+            building.set()
+            time.sleep(0.2)
+        load_ini(self)
+
+    monkeypatch.setattr(Kardex, "_load_ini_config", slow_ini)
+    builder = threading.Thread(
+        target=registry.get, args=(globex,), kwargs={"env": "dev"}
+    )
+    builder.start()
+    assert building.wait(5)
+    # globex is loaded into os.environ, acme doesn't read it meanwhile
+    assert first.get("GLOBEX_ONLY") is None
+    builder.join()
+    assert registry.get(globex, env="dev").get("GLOBEX_ONLY") == "1"
+    registry.close()
+
+
+def test_builds_run_outside_the_registry_lock(projects, monkeypatch):
+    acme, globex, _ = projects
+    registry = KardexRegistry()
+    first = registry.get(acme, env="dev")
+    building, release = threading.Event(), threading.Event()
+    load_ini = Kardex._load_ini_config
+
+    def slow_ini(self):
+        if self is not first:
+            building.set()
+            release.wait(5)
+        load_ini(self)
+
+    monkeypatch.setattr(Kardex, "_load_ini_config", slow_ini)
+    results = []
+    builders = [
+        threading.Thread(
+            target=lambda: results.append(registry.get(globex, env="dev"))
+        ) for _ in range(3)
+    ]
+    for builder in builders:
+        builder.start()
+    assert building.wait(5)
+    # another project is returned while globex is being built
+    started = time.monotonic()
+    assert registry.get(acme, env="dev") is first
+    assert time.monotonic() - started < 2
+    release.set()
+    for builder in builders:
+        builder.join()
+    assert len(results) == 3 and len({id(kardex) for kardex in results}) == 1
+    assert registry.stats()["builds"] == 2
+    registry.close()
+
+
+def test_readers_are_shared_by_settings(projects):
+    acme, globex, initech = projects
+    registry = KardexRegistry()
+    first = registry.get(acme, env="dev")
+    second = registry.get(globex, env="dev")
+    third = registry.get(initech, env="dev")
+
+    assert first._readers["cache"] is second._readers["cache"]
+    assert third._readers["cache"] is not first._readers["cache"]
+    assert len(SharedRedis.instances) == 2
+
+    # an evicted instance leaves the shared reader open
+    assert registry.evict(acme, env="dev") is True
+    assert registry.evict(acme, env="dev") is False
+    assert not second._readers["cache"].closed
+    registry.close()
+    assert all(reader.closed for reader in SharedRedis.instances)
+    assert len(registry) == 0
+
+
+def test_least_recently_used_and_idle_instances_are_closed(projects):
+    acme, globex, initech = projects
+    clock = Clock()
+    registry = KardexRegistry(max_size=2, idle_timeout=60, clock=clock)
+    registry.get(acme, env="dev")
+    registry.get(globex, env="dev")
+    clock.now += 30
+    registry.get(acme, env="dev")
+    clock.now += 20
+    registry.get(initech, env="dev")
+    assert (globex, "dev") not in registry
+    assert (acme, "dev") in registry
+
+    clock.now += 45
+    assert registry.prune() == 1  # acme: 65 seconds ago
+    assert (acme, "dev") not in registry
+    assert (initech, "dev") in registry
+    assert registry.stats()["evictions"] == 2
+    registry.close()
+
+
+def test_parsed_files_are_reused_until_changed(tmp_path):
+    ini = tmp_path / "config.ini"
+    ini.write_text("[a]\nx = 1\n", encoding="utf-8")
+    calls = []
+
+    def parse(path):
+        calls.append(path)
+        return {"x": path.read_text(encoding="utf-8")}
+
+    files = FileCache()
+    first = files.load(ini, parse)
+    first["x"] = "changed by the caller"
+    assert files.load(ini, parse) == {"x": "[a]\nx = 1\n"}
+    assert len(calls) == 1
+
+    ini.write_text("[a]\nx = 22\n", encoding="utf-8")
+    assert files.load(ini, parse) == {"x": "[a]\nx = 22\n"}
+    assert files.stats() == {'files': 1, 'hits': 1, 'misses': 2}
@@ -0,0 +1,97 @@
+"""Tests for the typed settings materialized from a schema."""
+import os
+from typing import List, Optional
+from unittest import mock
+
+import pytest
+
+from navconfig import Field, Schema
+from navconfig.exceptions import ConfigError
+from navconfig.kardex import Kardex
+from navconfig.schema import coerce
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class Database(Schema):
+    DB_HOST: str = "localhost"
+    DB_PORT: int = 5432
+    DB_DEBUG: bool = False
+    DB_REPLICAS: List[str] = []
+    DB_TIMEOUT: Optional[float] = None
+    pool: int = Field(5, key="POOL_SIZE", section="database")
+
+
+class Required(Schema):
+    API_KEY: str
+
+
+@pytest.fixture
+def kardex(tmp_path):
+    env_dir = tmp_path / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text(
+        "DB_HOST=db.internal\nDB_PORT=6432\nDB_DEBUG=yes\n"
+        "DB_REPLICAS=r1, r2\n",
+        encoding="utf-8"
+    )
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "config.ini").write_text(
+        "[database]\npool_size = 20\n", encoding="utf-8"
+    )
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+    return cfg
+
+
+def test_schema_instances_are_typed_and_frozen(kardex):
+    db = kardex.settings(Database)
+    assert db.DB_HOST == "db.internal"
+    assert db.DB_PORT == 6432
+    assert db.DB_DEBUG is True
+    assert db.DB_REPLICAS == ["r1", "r2"]
+    assert db.DB_TIMEOUT is None
+    assert db.pool == 20
+    assert Database.__slots__ == (
+        "DB_HOST", "DB_PORT", "DB_DEBUG", "DB_REPLICAS", "DB_TIMEOUT", "pool"
+    )
+    assert not hasattr(db, "__dict__")
+    with pytest.raises(AttributeError):
+        db.DB_PORT = 1
+    # built once
+    assert kardex.settings(Database) is db
+
+
+def test_instance_is_rebuilt_when_one_of_its_keys_changes(kardex):
+    db = kardex.settings(Database)
+    kardex.set("UNRELATED", "x")
+    assert kardex.settings(Database) is db
+
+    kardex.set("DB_PORT", "7000")
+    rebuilt = kardex.settings(Database)
+    assert rebuilt is not db and rebuilt.DB_PORT == 7000
+    kardex._evict(["POOL_SIZE"])
+    assert kardex.settings(Database) is not rebuilt
+
+
+def test_missing_and_invalid_values(kardex):
+    with pytest.raises(ConfigError, match="API_KEY is not defined"):
+        kardex.settings(Required)
+    kardex.set("DB_PORT", "many")
+    with pytest.raises(ConfigError, match="invalid value for DB_PORT"):
+        kardex.settings(Database)
+
+
+def test_coerce():
+    assert coerce("off", bool) is False
+    assert coerce(1, bool) is True
+    assert coerce(True, int) == 1 and coerce(True, int) is not True
+    assert coerce('{"a": 1}', dict) == {"a": 1}
+    assert coerce(("a", "b"), List[str]) == ["a", "b"]
+    assert coerce("3", Optional[int]) == 3
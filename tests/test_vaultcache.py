@@ -0,0 +1,169 @@
+"""Tests for the encrypted Redis copy of the Vault secrets."""
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+import hvac
+import pytest
+import requests
+from cryptography.fernet import Fernet
+
+from navconfig.readers.vault import KVPatcher, VaultReader
+from navconfig.readers.vaultcache import SecretCache, cache_cypher
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("VAULT_CACHE_KEY_DIR", raising=False)
+    with mock.patch.dict(os.environ):
+        yield
+
+
+class Clock:
+    now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class DictRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeKV2:
+    def __init__(self, secrets):
+        self.secrets = secrets
+        self.versions = {path: 1 for path in secrets}
+        self.calls = []
+        self.down = False
+        self.metadata_denied = False
+
+    def read_secret_version(self, path, mount_point):
+        self.calls.append(("read", path))
+        if path not in self.secrets:
+            raise hvac.exceptions.InvalidPath()
+        return {"data": {
+            "data": dict(self.secrets[path]),
+            "metadata": {"version": self.versions[path]},
+        }}
+
+    def read_secret_metadata(self, path, mount_point):
+        self.calls.append(("metadata", path))
+        if self.down:
+            raise requests.exceptions.ConnectionError("vault is down")
+        if self.metadata_denied:
+            raise hvac.exceptions.Forbidden("permission denied")
+        return {"data": {"current_version": self.versions[path]}}
+
+
+def make_reader(kv2, redis, clock, token="s.token"):
+    """A Vault reader of another process sharing *kv2* and *redis*."""
+    reader = object.__new__(VaultReader)
+    reader.enabled = True
+    reader.version = 2
+    reader._mount = "navigator"
+    reader._env = "dev"
+    reader.client = SimpleNamespace(secrets=SimpleNamespace(kv=SimpleNamespace(v2=kv2)))
+    reader._patcher = KVPatcher(reader.client, "navigator", 2)
+    reader._cache = SecretCache(
+        redis, cache_cypher(token), "navigator", ttl=60,
+        unavailable=(requests.exceptions.ConnectionError,), clock=clock
+    )
+    return reader
+
+
+def test_processes_share_one_encrypted_copy():
+    kv2 = FakeKV2({"dev": {"DB_PASSWORD": "s3cr3t"}})
+    redis, clock = DictRedis(), Clock()
+    first = make_reader(kv2, redis, clock)
+    assert first.get("DB_PASSWORD") == "s3cr3t"
+    assert kv2.calls == [("read", "dev")]
+    assert "s3cr3t" not in redis.data["navconfig:vault:navigator:dev"]
+
+    for _ in range(5):
+        other = make_reader(kv2, redis, clock)
+        assert other.get("DB_PASSWORD") == "s3cr3t"
+        assert other.exists("DB_PASSWORD") is True
+    assert kv2.calls == [("read", "dev")]
+    assert other.cache_stats()["hits"] == 2
+
+    # another token derives another key: the copy can't be read
+    rotated = make_reader(kv2, redis, clock, token="s.rotated")
+    assert rotated.get("DB_PASSWORD") == "s3cr3t"
+    assert kv2.calls[-1] == ("read", "dev")
+
+
+def test_outdated_copies_are_revalidated_by_version():
+    kv2 = FakeKV2({"dev": {"A": "1"}})
+    redis, clock = DictRedis(), Clock()
+    reader = make_reader(kv2, redis, clock)
+    reader.get("A")
+
+    clock.now += 61
+    assert reader.get("A") == "1"
+    assert kv2.calls[-1] == ("metadata", "dev")  # unchanged: no read
+    assert reader.cache_stats()["revalidated"] == 1
+
+    kv2.secrets["dev"]["A"] = "2"
+    kv2.versions["dev"] = 2
+    clock.now += 61
+    assert reader.get("A") == "2"
+    assert kv2.calls[-2:] == [("metadata", "dev"), ("read", "dev")]
+
+
+def test_outdated_copy_is_served_while_vault_is_down():
+    kv2 = FakeKV2({"dev": {"A": "1"}})
+    redis, clock = DictRedis(), Clock()
+    reader = make_reader(kv2, redis, clock)
+    reader.get("A")
+    kv2.down = True
+    clock.now += 61
+    assert reader.get("A") == "1"
+    assert reader.cache_stats()["stale"] == 1
+
+
+def test_outdated_copy_is_read_again_without_metadata_rights():
+    kv2 = FakeKV2({"dev": {"A": "1"}})
+    redis, clock = DictRedis(), Clock()
+    reader = make_reader(kv2, redis, clock)
+    reader.get("A")
+    kv2.metadata_denied = True
+    kv2.secrets["dev"]["A"] = "2"
+    clock.now += 61
+    assert reader.get("A") == "2"
+    assert kv2.calls[-2:] == [("metadata", "dev"), ("read", "dev")]
+    assert reader.cache_stats()["stale"] == 0
+
+    # the read error itself isn't masked by the copy
+    del kv2.secrets["dev"]
+    clock.now += 61
+    assert reader.get("A", "default") == "default"
+
+
+def test_writes_drop_the_copy():
+    kv2 = FakeKV2({"dev": {"A": "1"}})
+    redis, clock = DictRedis(), Clock()
+    reader = make_reader(kv2, redis, clock)
+    reader.get("A")
+    reader._patcher.patch = lambda path, updates=None, deletes=(): None
+    reader.set("A", "2")
+    assert redis.data == {}
+
+
+def test_key_file_of_file_cypher(tmp_path, monkeypatch):
+    key = Fernet.generate_key()
+    (tmp_path / "unlock.key").write_bytes(key)
+    monkeypatch.setenv("VAULT_CACHE_KEY_DIR", str(tmp_path))
+    token = cache_cypher("ignored").encrypt(b"x")
+    assert Fernet(key).decrypt(token) == b"x"
@@ -0,0 +1,136 @@
+"""Tests for the write-behind queue of Kardex.set."""
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+import navconfig.kardex
+from navconfig.exceptions import ReaderError
+from navconfig.kardex import Kardex
+from navconfig.utils.writebehind import WriteBehind
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    monkeypatch.delenv("PROJECT_PATH", raising=False)
+    monkeypatch.setenv("NAVCONFIG_BROADCAST", "false")
+    with mock.patch.dict(os.environ):
+        yield
+
+
+def test_batches_keep_the_last_write_per_key():
+    entered, gate = threading.Event(), threading.Event()
+    batches = []
+
+    def write(backend, values, timeout):
+        entered.set()
+        gate.wait(5)
+        batches.append((backend, values, timeout))
+
+    writer = WriteBehind(write)
+    writer.put("cache", "FIRST", "1")
+    entered.wait(5)
+    # the worker is blocked on FIRST: the next writes pile up
+    writer.put("cache", "A", "1")
+    writer.put("cache", "A", "2")
+    writer.put("cache", "B", "x", timeout=60)
+    writer.put("vault", "C", "secret")
+    assert writer.pending >= 4
+    gate.set()
+    writer.close()
+
+    assert batches[0] == ("cache", {"FIRST": "1"}, None)
+    assert sorted(batches[1:], key=str) == sorted([
+        ("cache", {"A": "2"}, None),
+        ("cache", {"B": "x"}, 60),
+        ("vault", {"C": "secret"}, None),
+    ], key=str)
+    assert writer.stats()["written"] == 4
+    assert writer.stats()["running"] is False
+
+
+def test_failed_batches_are_retried_then_reported():
+    calls = []
+
+    def write(backend, values, timeout):
+        calls.append(dict(values))
+        if values.get("A") == "1" or len(calls) == 4:
+            raise ConnectionError("down")
+
+    writer = WriteBehind(write, retries=2, backoff=0)
+    writer.put("cache", "A", "1")
+    with pytest.raises(ReaderError, match="cache:A"):
+        writer.flush()
+    assert len(calls) == 3  # the write and its two retries
+    assert writer.stats()["failed"] == 1
+    writer.flush()  # reported once
+
+    writer.put("cache", "B", "2")
+    writer.flush()  # the first attempt fails, the retry succeeds
+    assert calls[-2:] == [{"B": "2"}, {"B": "2"}]
+    assert writer.stats()["written"] == 1
+
+    writer.put("cache", "A", "1")
+    with pytest.raises(ReaderError, match="cache:A"):
+        writer.close()
+
+
+class SlowRedis:
+    store: dict = {}
+    batches: list = []
+    gate = threading.Event()
+
+    def __init__(self, *args, **kwargs):
+        self.enabled = True
+
+    def exists(self, key):
+        return key in self.store
+
+    def get(self, key, default=None):
+        return self.store.get(key, default)
+
+    def set_many(self, values, timeout=None):
+        self.gate.wait(5)
+        SlowRedis.batches.append(dict(values))
+        self.store.update(values)
+
+    def close(self):
+        pass
+
+
+def test_kardex_set_returns_before_the_backend_write(tmp_path, monkeypatch):
+    SlowRedis.store = {}
+    SlowRedis.batches = []
+    SlowRedis.gate = threading.Event()
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("NAVCONFIG_WRITE_BEHIND", "true")
+    monkeypatch.setattr(
+        navconfig.kardex, "_reader_class",
+        lambda name: SlowRedis if name == "redis" else None
+    )
+    env_dir = tmp_path / "env" / "dev"
+    env_dir.mkdir(parents=True)
+    (env_dir / ".env").write_text("DEBUG=true\n", encoding="utf-8")
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "etc" / "config.ini").write_text("", encoding="utf-8")
+    cfg = object.__new__(Kardex)
+    cfg._readers = {}
+    cfg.__init__(site_root=tmp_path, env="dev")
+
+    cfg.set("feature/x", "on")
+    cfg.set_many({"feature/y": {"a": 1}, "feature/x": "off"})
+    assert cfg.get("feature/x") == "off"  # visible before the write
+    assert cfg.get("feature/y") == {"a": 1}
+    assert SlowRedis.store == {}
+
+    SlowRedis.gate.set()
+    cfg.flush()
+    assert SlowRedis.store["feature/x"] == "off"
+    assert "feature/x" not in cfg._mapping_  # read from Redis again
+    assert cfg.get("feature/y") == {"a": 1}
+    assert cfg.get_env_info()["write_behind"]["written"] >= 2
+
+    cfg.set("feature/z", "late")
+    cfg.close()  # flush-on-close
+    assert SlowRedis.store["feature/z"] == "late"